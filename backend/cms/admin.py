@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import SiteSettings, NavItem, FooterLink, SEO, Hero, Page, PageSection, ContactSubmission, ServiceProcessStep, WhyChooseItem, OfficeHour, SocialLink, QuickStat, Partner, CoreValue, Leadership, TimelineEvent
+from django.utils import timezone
+from .models import SiteSettings, NavItem, FooterLink, SEO, Hero, Page, PageSection, ContactSubmission, ServiceProcessStep, WhyChooseItem, OfficeHour, SocialLink, QuickStat, Partner, CoreValue, Leadership, TimelineEvent, OutboundEmail
 
 
 @admin.register(SiteSettings)
@@ -131,4 +132,20 @@ class TimelineEventAdmin(admin.ModelAdmin):
     search_fields = ("title", "description")
     list_filter = ("is_active", "year")
 
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ("subject", "status", "attempts", "next_attempt_at", "sent_at", "created_at")
+    list_filter = ("status",)
+    search_fields = ("subject", "last_error")
+    readonly_fields = ("attempts", "sent_at", "last_error", "created_at", "updated_at")
+    actions = ["requeue"]
+
+    def requeue(self, request, queryset):
+        count = queryset.exclude(status=OutboundEmail.SENT).update(
+            status=OutboundEmail.PENDING, attempts=0, next_attempt_at=timezone.now()
+        )
+        self.message_user(request, f"Requeued {count} emails.")
+    requeue.short_description = "Requeue selected emails"
+
 # Register your models here.
@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class CmsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'cms'
+
+    def ready(self):
+        from config import authentication, cache, images, snapshot
+        from . import search
+        authentication.connect_signals()
+        cache.connect_signals()
+        images.connect_signals()
+        search.connect_signals()
+        snapshot.connect_signals()
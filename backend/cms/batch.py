@@ -0,0 +1,93 @@
+"""
+In-process execution of batched GET requests (``/api/batch/``).
+
+Each URL is resolved against the root URLconf and its view called directly
+with a GET request derived from the batch request: same headers (so the same
+credentials and host), same database connection, same response cache. The
+middleware stack runs once, for the batch itself.
+"""
+
+import json
+import logging
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+from rest_framework.exceptions import APIException
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "/api/"
+
+# Describe the batch request itself, not its sub-requests.
+DROPPED_HEADERS = ("CONTENT_LENGTH", "CONTENT_TYPE", "HTTP_IF_NONE_MATCH", "HTTP_IF_MODIFIED_SINCE")
+
+
+class SubRequest(HttpRequest):
+    """A GET for ``path``/``query`` sharing the parent request's headers, user and scheme."""
+
+    def __init__(self, parent, path, query):
+        super().__init__()
+        self.parent = parent
+        self.method = "GET"
+        self.path = self.path_info = path
+        self.META = {key: value for key, value in parent.META.items() if key not in DROPPED_HEADERS}
+        self.META.update(REQUEST_METHOD="GET", PATH_INFO=path, QUERY_STRING=query)
+        self.GET = QueryDict(query)
+        self.COOKIES = parent.COOKIES
+        for attribute in ("session", "user"):
+            if hasattr(parent, attribute):
+                setattr(self, attribute, getattr(parent, attribute))
+
+    def _get_scheme(self):
+        return self.parent.scheme
+
+
+def error(url, status, detail):
+    return {"url": url, "status": status, "body": {"detail": detail}}
+
+
+def execute(request, url, excluded=()):
+    """Run one batched URL; returns ``{"url", "status", "body"}``.
+
+    Any exception raised by the view becomes that URL's status (500 when it
+    is not an HTTP error), never the batch's.
+
+    ``excluded`` names URL patterns that must not be batched (the batch view).
+    """
+    path, _, query = url.partition("?")
+    if not path.startswith(PREFIX):
+        return error(url, 400, f"Only {PREFIX} URLs can be batched.")
+    try:
+        match = resolve(path)
+    except Resolver404:
+        return error(url, 404, "Not found.")
+    if match.url_name in excluded:
+        return error(url, 400, "This URL cannot be batched.")
+
+    subrequest = SubRequest(request, path, query)
+    subrequest.resolver_match = match
+    view = async_to_sync(match.func) if iscoroutinefunction(match.func) else match.func
+    try:
+        response = view(subrequest, *match.args, **match.kwargs)
+    except Http404:
+        return error(url, 404, "Not found.")
+    except PermissionDenied:
+        return error(url, 403, "You do not have permission to perform this action.")
+    except APIException as exc:
+        body = exc.detail if isinstance(exc.detail, (dict, list)) else {"detail": exc.detail}
+        return {"url": url, "status": exc.status_code, "body": body}
+    except Exception:
+        # One broken URL must not fail the whole batch.
+        logger.exception("Batched request %s failed", url)
+        return error(url, 500, "Server error.")
+
+    if hasattr(response, "data"):
+        # DRF response: embed the unrendered data, the batch renders it once.
+        body = response.data
+    elif response.get("Content-Type", "").startswith("application/json"):
+        body = json.loads(response.content)
+    else:
+        return error(url, 406, "Only JSON endpoints can be batched.")
+    return {"url": url, "status": response.status_code, "body": body}
@@ -0,0 +1,117 @@
+from sectors.models import Sector
+from sectors.serializers import SectorSerializer
+from services.models import Service, ServiceCategory
+from services.serializers import ServiceSerializer, ServiceCategorySerializer
+from testimonials.models import Testimonial
+from testimonials.serializers import TestimonialSerializer
+from .models import SiteSettings, NavItem, FooterLink, Hero, ServiceProcessStep, WhyChooseItem, OfficeHour, SocialLink, QuickStat, Partner, CoreValue, Leadership, TimelineEvent
+from .serializers import (
+    SiteSettingsSerializer,
+    NavItemSerializer,
+    FooterLinkSerializer,
+    HeroSerializer,
+    ServiceProcessStepSerializer,
+    WhyChooseItemSerializer,
+    OfficeHourSerializer,
+    SocialLinkSerializer,
+    QuickStatSerializer,
+    PartnerSerializer,
+    CoreValueSerializer,
+    LeadershipSerializer,
+    TimelineEventSerializer,
+)
+
+
+class Section:
+    """One key of a bundle: a queryset factory plus the serializer used by its viewset.
+
+    ``many=False`` sections render the first row (or ``None``), matching how the
+    frontend consumes ``/api/settings/`` and ``/api/hero/``. ``dependencies``
+    lists models reached through nested serializers.
+    """
+
+    def __init__(self, get_queryset, serializer_class, many=True, dependencies=()):
+        self.get_queryset = get_queryset
+        self.serializer_class = serializer_class
+        self.many = many
+        self.dependencies = dependencies
+
+    @property
+    def models(self):
+        return [self.get_queryset().model, *self.dependencies]
+
+    def render(self, context):
+        queryset = self.get_queryset()
+        if self.many:
+            return self.serializer_class(queryset, many=True, context=context).data
+        instance = queryset.first()
+        if instance is None:
+            return None
+        return self.serializer_class(instance, context=context).data
+
+    async def arender(self, context):
+        """``render`` with the rows fetched through the async ORM."""
+        queryset = self.get_queryset()
+        if self.many:
+            rows = [instance async for instance in queryset]
+            return self.serializer_class(rows, many=True, context=context).data
+        instance = await queryset.afirst()
+        if instance is None:
+            return None
+        return self.serializer_class(instance, context=context).data
+
+
+SECTIONS = {
+    "settings": Section(lambda: SiteSettings.objects.all(), SiteSettingsSerializer, many=False),
+    "hero": Section(lambda: Hero.objects.filter(is_active=True), HeroSerializer, many=False),
+    "nav_items": Section(lambda: NavItem.objects.filter(is_active=True), NavItemSerializer),
+    "footer_links": Section(lambda: FooterLink.objects.filter(is_active=True), FooterLinkSerializer),
+    "social_links": Section(lambda: SocialLink.objects.filter(is_active=True), SocialLinkSerializer),
+    "office_hours": Section(lambda: OfficeHour.objects.filter(is_active=True), OfficeHourSerializer),
+    "quick_stats": Section(lambda: QuickStat.objects.filter(is_active=True), QuickStatSerializer),
+    "partners": Section(lambda: Partner.objects.filter(is_active=True), PartnerSerializer),
+    "why_choose": Section(lambda: WhyChooseItem.objects.filter(is_active=True), WhyChooseItemSerializer),
+    "process_steps": Section(lambda: ServiceProcessStep.objects.filter(is_active=True), ServiceProcessStepSerializer),
+    "core_values": Section(lambda: CoreValue.objects.filter(is_active=True), CoreValueSerializer),
+    "leadership": Section(lambda: Leadership.objects.filter(is_active=True), LeadershipSerializer),
+    "timeline_events": Section(lambda: TimelineEvent.objects.filter(is_active=True), TimelineEventSerializer),
+    "services": Section(
+        lambda: Service.objects.filter(is_active=True).select_related("category"),
+        ServiceSerializer,
+        dependencies=(ServiceCategory,),
+    ),
+    "service_categories": Section(lambda: ServiceCategory.objects.filter(is_active=True), ServiceCategorySerializer),
+    "sectors": Section(lambda: Sector.objects.filter(is_active=True), SectorSerializer),
+    "testimonials": Section(lambda: Testimonial.objects.filter(is_active=True), TestimonialSerializer),
+}
+
+# Each bundle issues exactly one query per section, regardless of row counts.
+BUNDLES = {
+    "layout": ["settings", "nav_items", "footer_links", "social_links", "sectors", "service_categories"],
+    "home": ["settings", "hero", "services", "partners", "quick_stats", "why_choose", "process_steps", "testimonials", "sectors"],
+    "about": ["settings", "core_values", "leadership", "timeline_events", "quick_stats"],
+    "contact": ["settings", "office_hours", "social_links", "quick_stats"],
+}
+
+
+def bundle_models(name):
+    models = {model for key in BUNDLES[name] for model in SECTIONS[key].models}
+    return sorted(models, key=lambda model: model._meta.label)
+
+
+def bundle_querysets(name):
+    """Querysets whose rows make up a bundle, for computing its validators."""
+    querysets = []
+    for key in BUNDLES[name]:
+        section = SECTIONS[key]
+        querysets.append(section.get_queryset())
+        querysets.extend(model.objects.all() for model in section.dependencies)
+    return querysets
+
+
+def build_bundle(name, context):
+    return {key: SECTIONS[key].render(context) for key in BUNDLES[name]}
+
+
+async def abuild_bundle(name, context):
+    return {key: await SECTIONS[key].arender(context) for key in BUNDLES[name]}
@@ -0,0 +1,191 @@
+import json
+import platform
+import re
+import subprocess
+import time
+from datetime import datetime, timezone
+
+import django
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory, override_settings
+from django.urls import get_resolver, reverse
+
+from config import snapshot
+
+SEARCH_QUERY = "hydropower"
+_queries_re = re.compile(r'desc="(\d+) queries"')
+
+
+def endpoints():
+    """Path and query of every public GET endpoint: lists, one detail per viewset, bundles, search."""
+    result = []
+    for pattern in snapshot.walk(get_resolver().url_patterns):
+        viewset = getattr(pattern.callback, "cls", None)
+        actions = getattr(pattern.callback, "actions", None)
+        if actions is None or "format" in pattern.pattern.regex.groupindex:
+            continue
+        action = actions.get("get")
+        if action == "list":
+            path = reverse(pattern.name)
+            result.extend((path, query) for query in ["", *snapshot.list_queries(viewset)[:1]])
+        elif action == "retrieve":
+            lookup_url_kwarg = viewset.lookup_url_kwarg or viewset.lookup_field
+            value = viewset.queryset.order_by().values_list(viewset.lookup_field, flat=True).first()
+            if value is not None:
+                result.append((reverse(pattern.name, kwargs={lookup_url_kwarg: value}), ""))
+    for pattern in snapshot.walk(get_resolver().url_patterns):
+        view = getattr(pattern.callback, "view_class", None)
+        if hasattr(view, "snapshot_targets"):
+            result.extend((path, "") for path, _ in view.snapshot_targets())
+    result.append((reverse("search"), f"q={SEARCH_QUERY}"))
+    return result
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive every public GET endpoint through the WSGI application in-process and report latency "
+        "percentiles, queries per request and throughput. Seed data first with `seed_bench_data`."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=100, help="Timed requests per endpoint.")
+        parser.add_argument("--warmup", type=int, default=5, help="Untimed requests per endpoint.")
+        parser.add_argument("--no-cache", action="store_true", help="Disable the API response cache.")
+        parser.add_argument("--match", default="", help="Only endpoints whose URL contains this text.")
+        parser.add_argument("--json", dest="json_path", help="Write the results to this file.")
+        parser.add_argument("--compare", help="Print p50/p95 changes against an earlier --json file.")
+
+    def handle(self, *args, **options):
+        from config.wsgi import application
+
+        self.application = application
+        self.factory = RequestFactory()
+        overrides = {"API_CACHE": {"ENABLED": False}} if options["no_cache"] else {}
+        with override_settings(**overrides):
+            results = []
+            for path, query in endpoints():
+                url = f"{path}?{query}" if query else path
+                if options["match"] in url:
+                    result = self.bench(path, query, options["warmup"], options["requests"])
+                    if result is not None:
+                        results.append(result)
+
+        total_requests = sum(result["requests"] for result in results)
+        total_seconds = sum(result["seconds"] for result in results)
+        report = {
+            "meta": {
+                "commit": git_commit(),
+                "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "requests_per_endpoint": options["requests"],
+                "cache": not options["no_cache"],
+            },
+            "summary": {
+                "endpoints": len(results),
+                "requests": total_requests,
+                "throughput_rps": round(total_requests / total_seconds, 1) if total_seconds else 0,
+            },
+            "results": results,
+        }
+        self.print_report(report)
+        if options["compare"]:
+            with open(options["compare"]) as baseline:
+                self.print_comparison(json.load(baseline), report)
+        if options["json_path"]:
+            with open(options["json_path"], "w") as output:
+                json.dump(report, output, indent=2)
+            self.stdout.write(f"Wrote {options['json_path']}")
+
+    def request(self, path, query):
+        environ = self.factory.get(path, QUERY_STRING=query, HTTP_ACCEPT_ENCODING="gzip").environ
+        captured = {}
+
+        def start_response(status, headers, exc_info=None):
+            captured["status"] = int(status.split(" ", 1)[0])
+            captured["headers"] = dict(headers)
+
+        started = time.perf_counter()
+        body = self.application(environ, start_response)
+        try:
+            size = sum(len(chunk) for chunk in body)
+        finally:
+            body.close()
+        elapsed = time.perf_counter() - started
+        match = _queries_re.search(captured["headers"].get("Server-Timing", ""))
+        return captured["status"], elapsed, int(match[1]) if match else None, size
+
+    def bench(self, path, query, warmup, requests):
+        url = f"{path}?{query}" if query else path
+        for _ in range(warmup):
+            status, *_ = self.request(path, query)
+        if status in (401, 403):
+            return None  # not a public endpoint
+        latencies, queries, sizes = [], [], []
+        for _ in range(requests):
+            status, elapsed, query_count, size = self.request(path, query)
+            latencies.append(elapsed * 1000)
+            queries.append(query_count)
+            sizes.append(size)
+        seconds = sum(latencies) / 1000
+        latencies.sort()
+        counted = [count for count in queries if count is not None]
+        return {
+            "url": url,
+            "status": status,
+            "requests": requests,
+            "seconds": round(seconds, 4),
+            "p50_ms": round(percentile(latencies, 0.50), 3),
+            "p95_ms": round(percentile(latencies, 0.95), 3),
+            "p99_ms": round(percentile(latencies, 0.99), 3),
+            "mean_ms": round(sum(latencies) / requests, 3),
+            "queries": round(sum(counted) / len(counted), 2) if counted else None,
+            "bytes": round(sum(sizes) / requests),
+            "rps": round(requests / seconds, 1),
+        }
+
+    def print_report(self, report):
+        self.stdout.write(
+            f"{'endpoint':<48}{'status':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'queries':>9}{'bytes':>9}{'req/s':>9}"
+        )
+        for result in report["results"]:
+            queries = "-" if result["queries"] is None else f"{result['queries']:g}"
+            self.stdout.write(
+                f"{result['url'][:47]:<48}{result['status']:>7}{result['p50_ms']:>9.2f}{result['p95_ms']:>9.2f}"
+                f"{result['p99_ms']:>9.2f}{queries:>9}{result['bytes']:>9}{result['rps']:>9.0f}"
+            )
+        summary = report["summary"]
+        self.stdout.write(
+            f"{summary['endpoints']} endpoints, {summary['requests']} requests, "
+            f"{summary['throughput_rps']} req/s overall (commit {report['meta']['commit'] or 'unknown'})"
+        )
+
+    def print_comparison(self, baseline, report):
+        previous = {result["url"]: result for result in baseline["results"]}
+        self.stdout.write(f"\nAgainst {baseline['meta'].get('commit') or 'baseline'}:")
+        self.stdout.write(f"{'endpoint':<48}{'p50':>10}{'p95':>10}{'queries':>10}")
+        for result in report["results"]:
+            before = previous.get(result["url"])
+            if before is None:
+                continue
+
+            def change(key):
+                return f"{(result[key] - before[key]) / before[key] * 100:+.0f}%" if before[key] else "-"
+
+            queries = "-" if result["queries"] is None or before["queries"] is None else (
+                f"{result['queries'] - before['queries']:+g}"
+            )
+            self.stdout.write(f"{result['url'][:47]:<48}{change('p50_ms'):>10}{change('p95_ms'):>10}{queries:>10}")
@@ -0,0 +1,118 @@
+import io
+import json
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from config.renderers import FastJSONParser, FastJSONRenderer, orjson
+from projects.models import Award, Project, ProjectCategory, ProjectImage
+from projects.serializers import ProjectSerializer
+from sectors.models import Sector
+from sectors.serializers import SectorSerializer
+
+TEXT = "Feasibility studies, detailed design and construction supervision of hydropower and irrigation works. "
+
+
+def create_rows(rows):
+    """Insert ``rows`` projects (with gallery and award) and sectors with realistic text."""
+    category = ProjectCategory.objects.create(name="Bench", slug="bench-json")
+    projects = Project.objects.bulk_create(
+        Project(
+            title=f"Bench project {i}",
+            slug=f"bench-json-{i}",
+            client="WAPDA",
+            summary=TEXT[:200],
+            description=TEXT * 10,
+            start_date=date(2020, 1, 1),
+            location="Khyber Pakhtunkhwa",
+            scope=[f"Scope item {n}" for n in range(8)],
+            impact=TEXT * 2,
+            category=category,
+        )
+        for i in range(rows)
+    )
+    ProjectImage.objects.bulk_create(
+        ProjectImage(project=project, image=f"projects/gallery/bench-{project.pk}-{n}.jpg", caption=f"View {n}")
+        for project in projects
+        for n in range(3)
+    )
+    Award.objects.bulk_create(
+        Award(project=project, title="Excellence award", organization="PEC", year=2022, description=TEXT)
+        for project in projects
+    )
+    Sector.objects.bulk_create(
+        Sector(
+            name=f"Bench sector {i}",
+            slug=f"bench-json-{i}",
+            description=TEXT * 3,
+            overview=TEXT * 10,
+            capabilities=[{"title": f"Capability {n}", "description": TEXT} for n in range(6)],
+            key_projects=[{"name": f"Project {n}", "capacity": f"{n * 100} MW"} for n in range(6)],
+        )
+        for i in range(rows)
+    )
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Compare DRF's JSONRenderer/JSONParser with the orjson-backed FastJSONRenderer/FastJSONParser."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000, help="Projects and sectors per list.")
+        parser.add_argument("--repeat", type=int, default=20, help="Renders/parses timed per payload.")
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stderr.write("orjson is not installed; FastJSONRenderer falls back to the stdlib path.")
+        try:
+            with transaction.atomic():
+                payloads = self.build_payloads(options["rows"])
+                raise Rollback
+        except Rollback:
+            pass
+
+        repeat = options["repeat"]
+        self.stdout.write(f"{'payload':<10}{'codec':<10}{'size KiB':>10}{'render/s':>12}{'parse/s':>12}")
+        for name, data in payloads:
+            baseline = JSONRenderer().render(data)
+            fast = FastJSONRenderer().render(data)
+            if json.loads(baseline) != json.loads(fast):
+                self.stderr.write(f"{name}: renderers produced different documents")
+            for codec, renderer, parser in [
+                ("drf", JSONRenderer(), JSONParser()),
+                ("fast", FastJSONRenderer(), FastJSONParser()),
+            ]:
+                body = renderer.render(data)
+                render_rate = repeat / self.time(lambda: renderer.render(data), repeat)
+                parse_rate = repeat / self.time(lambda: parser.parse(io.BytesIO(body)), repeat)
+                self.stdout.write(
+                    f"{name:<10}{codec:<10}{len(body) / 1024:>10.0f}{render_rate:>12.1f}{parse_rate:>12.1f}"
+                )
+
+    def build_payloads(self, rows):
+        create_rows(rows)
+        request = APIRequestFactory().get("/api/", HTTP_HOST="localhost")
+        context = {"request": request}
+        projects = Project.objects.filter(slug__startswith="bench-json-").select_related("category")
+        projects = projects.prefetch_related("images", "awards")
+        sectors = Sector.objects.filter(slug__startswith="bench-json-")
+        return [
+            ("projects", ProjectSerializer(projects, many=True, context=context).data),
+            ("sectors", SectorSerializer(sectors, many=True, context=context).data),
+        ]
+
+    @staticmethod
+    def time(operation, repeat):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            operation()
+        return time.perf_counter() - started
+
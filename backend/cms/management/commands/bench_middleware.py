@@ -0,0 +1,99 @@
+import json
+import time
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory, override_settings
+from rest_framework.views import APIView
+from rest_framework_simplejwt.tokens import AccessToken
+
+from config.stateless import LazyAuthenticationMixin
+
+from .bench_api import git_commit, percentile
+
+DEFAULT_PATHS = ["/api/settings/", "/api/bundle/layout/"]
+ROUNDS = 10
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the per-request cost of the session/CSRF/auth/messages middleware and eager JWT "
+        "authentication on public API reads: the full stack against the stateless route."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000, help="Timed requests per path and stack.")
+        parser.add_argument("--warmup", type=int, default=10, help="Untimed requests per round.")
+        parser.add_argument("--path", dest="paths", action="append", help=f"Repeatable; default {DEFAULT_PATHS}.")
+        parser.add_argument("--json", dest="json_path", help="Write the results to this file.")
+
+    def handle(self, *args, **options):
+        factory = RequestFactory()
+        # The stack is built when the handler loads its middleware.
+        lean = WSGIHandler()
+        with override_settings(API_STATELESS={"ENABLED": False}):
+            full = WSGIHandler()
+        per_round = max(1, options["requests"] // ROUNDS)
+        results = []
+        # Not in a transaction: every request closes the database connection when it finishes.
+        user = get_user_model().objects.create_user("bench-middleware", is_staff=True)
+        try:
+            token = str(AccessToken.for_user(user))
+            for path in options["paths"] or DEFAULT_PATHS:
+                for auth, headers in (("anonymous", {}), ("bearer", {"HTTP_AUTHORIZATION": f"Bearer {token}"})):
+                    environ = factory.get(path, HTTP_ACCEPT_ENCODING="gzip", **headers).environ
+                    timings = {"full": [], "lean": []}
+                    # Alternate in rounds so drift (CPU frequency, caches) hits both stacks alike.
+                    for _ in range(ROUNDS):
+                        # The full stack also authenticates eagerly, as DRF does by default.
+                        with mock.patch.object(
+                            LazyAuthenticationMixin, "perform_authentication", APIView.perform_authentication
+                        ):
+                            timings["full"] += self.bench(full, environ, options["warmup"], per_round)
+                        timings["lean"] += self.bench(lean, environ, options["warmup"], per_round)
+                    results.append({"path": path, "auth": auth, **self.summarize(timings)})
+        finally:
+            user.delete()
+
+        self.stdout.write(
+            f"{'path':<28}{'auth':<11}{'full p50 us':>12}{'lean p50 us':>12}{'saved us':>10}{'saved':>8}"
+        )
+        for result in results:
+            self.stdout.write(
+                f"{result['path'][:27]:<28}{result['auth']:<11}{result['full_p50_us']:>12.0f}"
+                f"{result['lean_p50_us']:>12.0f}{result['saved_us']:>10.0f}{result['saved_pct']:>7.0f}%"
+            )
+        if options["json_path"]:
+            report = {"meta": {"commit": git_commit(), "requests": options["requests"]}, "results": results}
+            with open(options["json_path"], "w") as output:
+                json.dump(report, output, indent=2)
+            self.stdout.write(f"Wrote {options['json_path']}")
+
+    def bench(self, handler, environ, warmup, requests):
+        def start_response(status, headers, exc_info=None):
+            if not status.startswith("200"):
+                raise RuntimeError(f"{environ['PATH_INFO']} answered {status}")
+
+        latencies = []
+        for n in range(warmup + requests):
+            started = time.perf_counter()
+            body = handler(dict(environ), start_response)
+            body.close()
+            if n >= warmup:
+                latencies.append((time.perf_counter() - started) * 1e6)
+        return latencies
+
+    def summarize(self, timings):
+        for latencies in timings.values():
+            latencies.sort()
+        full, lean = percentile(timings["full"], 0.50), percentile(timings["lean"], 0.50)
+        return {
+            "full_p50_us": round(full, 1),
+            "lean_p50_us": round(lean, 1),
+            "full_p95_us": round(percentile(timings["full"], 0.95), 1),
+            "lean_p95_us": round(percentile(timings["lean"], 0.95), 1),
+            "saved_us": round(full - lean, 1),
+            "saved_pct": round((full - lean) / full * 100, 1),
+        }
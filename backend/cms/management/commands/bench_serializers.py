@@ -0,0 +1,67 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from config.values import compile_plan
+from projects.models import Project
+from projects.serializers import ProjectListSerializer, ProjectSerializer
+from sectors.models import Sector
+from sectors.serializers import SectorListSerializer, SectorSerializer
+
+from .bench_json import Rollback, create_rows
+
+
+class Command(BaseCommand):
+    help = "Per-row cost of full vs. compact list serializers vs. the values() fast path (queries included)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000, help="Projects and sectors per list.")
+        parser.add_argument("--repeat", type=int, default=5, help="Timed runs per variant (best is reported).")
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                create_rows(options["rows"])
+                self.run(options["rows"], options["repeat"])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, rows, repeat):
+        request = Request(APIRequestFactory().get("/api/", HTTP_HOST="localhost"))
+        context = {"request": request}
+        projects = Project.objects.filter(slug__startswith="bench-json-")
+        sectors = Sector.objects.filter(slug__startswith="bench-json-")
+        variants = [
+            ("projects", "full", lambda: ProjectSerializer(
+                projects.select_related("category").prefetch_related("images", "awards"), many=True, context=context
+            ).data),
+            ("projects", "list", lambda: ProjectListSerializer(
+                projects.select_related("category"), many=True, context=context
+            ).data),
+            ("projects", "values", lambda: self.values(ProjectListSerializer(context=context), projects, request)),
+            ("sectors", "full", lambda: SectorSerializer(sectors, many=True, context=context).data),
+            ("sectors", "list", lambda: SectorListSerializer(sectors, many=True, context=context).data),
+            ("sectors", "values", lambda: self.values(SectorListSerializer(context=context), sectors, request)),
+        ]
+        self.stdout.write(f"{rows} rows, best of {repeat}")
+        self.stdout.write(f"{'payload':<10}{'variant':<10}{'µs/row':>10}{'speedup':>10}")
+        baseline = {}
+        for name, variant, operation in variants:
+            best = min(self.time(operation) for _ in range(repeat)) / rows * 1e6
+            baseline.setdefault(name, best)
+            self.stdout.write(f"{name:<10}{variant:<10}{best:>10.1f}{baseline[name] / best:>9.1f}x")
+
+    @staticmethod
+    def values(serializer, queryset, request):
+        plan = compile_plan(serializer)
+        return [plan.build(row, request) for row in queryset.values(*plan.columns)]
+
+    @staticmethod
+    def time(operation):
+        started = time.perf_counter()
+        operation()
+        return time.perf_counter() - started
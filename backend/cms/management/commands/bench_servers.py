@@ -0,0 +1,147 @@
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from .bench_api import git_commit, percentile
+
+DEFAULT_PATHS = ["/api/bundle/layout/", "/api/bundle/home/", "/api/settings/"]
+
+
+async def fetch(port, path, slow):
+    """One ``Connection: close`` GET; a slow client pauses ``slow`` seconds mid-request."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n".encode())
+        if slow:
+            await writer.drain()
+            await asyncio.sleep(slow)
+        writer.write(b"Accept-Encoding: gzip\r\nConnection: close\r\n\r\n")
+        await writer.drain()
+        response = await reader.read()
+    finally:
+        writer.close()
+    return int(response.split(b" ", 2)[1]) if response.startswith(b"HTTP/") else 0
+
+
+async def load(port, paths, requests, concurrency, slow=0, slow_every=0):
+    """Run ``requests`` GETs, ``concurrency`` at a time; every ``slow_every``-th client is slow."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, errors = [], 0
+
+    async def one(i, path):
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                status = await fetch(port, path, slow if slow_every and i % slow_every == 0 else 0)
+            except OSError:
+                status = 0
+            if status == 200:
+                latencies.append((time.perf_counter() - started) * 1000)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i, paths[i % len(paths)]) for i in range(requests)))
+    return latencies, errors, time.perf_counter() - started
+
+
+def wait_for_port(port, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise CommandError(f"gunicorn exited with status {process.returncode}")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise CommandError(f"gunicorn did not listen on port {port} within {timeout}s")
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare gunicorn sync workers (WSGI) with uvicorn workers (ASGI, async read views) under "
+        "concurrent, optionally slow, clients. Seed data first with `seed_bench_data`."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--modes", nargs="+", default=["wsgi", "asgi"], choices=["wsgi", "asgi"])
+        parser.add_argument("--workers", type=int, default=1, help="Worker processes per server.")
+        parser.add_argument("--concurrency", type=int, default=50, help="Connections open at once.")
+        parser.add_argument("--requests", type=int, default=1000)
+        parser.add_argument("--slow-ms", type=float, default=0, help="Mid-request pause of a slow client.")
+        parser.add_argument("--slow-every", type=int, default=10, help="Every n-th client is slow (with --slow-ms).")
+        parser.add_argument("--path", dest="paths", action="append", help=f"Repeatable; default {DEFAULT_PATHS}.")
+        parser.add_argument("--port", type=int, default=8790)
+        parser.add_argument("--json", dest="json_path", help="Write the results to this file.")
+
+    def handle(self, *args, **options):
+        paths = options["paths"] or DEFAULT_PATHS
+        results = []
+        for mode in options["modes"]:
+            results.append(self.bench(mode, paths, options))
+        self.stdout.write(f"{'mode':<8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+        for result in results:
+            self.stdout.write(
+                f"{result['mode']:<8}{result['throughput_rps']:>10.1f}{result['p50_ms']:>10.1f}"
+                f"{result['p95_ms']:>10.1f}{result['p99_ms']:>10.1f}{result['errors']:>8}"
+            )
+        if options["json_path"]:
+            report = {
+                "meta": {
+                    "commit": git_commit(),
+                    "paths": paths,
+                    **{key: options[key] for key in ("workers", "concurrency", "requests", "slow_ms", "slow_every")},
+                },
+                "results": results,
+            }
+            with open(options["json_path"], "w") as output:
+                json.dump(report, output, indent=2)
+            self.stdout.write(f"Wrote {options['json_path']}")
+
+    def bench(self, mode, paths, options):
+        env = {
+            **os.environ,
+            "GUNICORN_MODE": mode,
+            "GUNICORN_BIND": f"127.0.0.1:{options['port']}",
+            "GUNICORN_WORKERS": str(options["workers"]),
+        }
+        process = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "--log-level", "critical"],
+            cwd=settings.BASE_DIR,
+            env=env,
+        )
+        try:
+            wait_for_port(options["port"], process)
+            # Warm caches and imports in every worker before timing.
+            asyncio.run(load(options["port"], paths, len(paths) * options["workers"] * 4, options["workers"]))
+            latencies, errors, seconds = asyncio.run(load(
+                options["port"],
+                paths,
+                options["requests"],
+                options["concurrency"],
+                options["slow_ms"] / 1000,
+                options["slow_every"],
+            ))
+        finally:
+            process.terminate()
+            process.wait()
+        latencies.sort()
+        return {
+            "mode": mode,
+            "requests": options["requests"],
+            "errors": errors,
+            "seconds": round(seconds, 3),
+            "throughput_rps": round(len(latencies) / seconds, 1),
+            "p50_ms": round(percentile(latencies, 0.50), 2) if latencies else None,
+            "p95_ms": round(percentile(latencies, 0.95), 2) if latencies else None,
+            "p99_ms": round(percentile(latencies, 0.99), 2) if latencies else None,
+        }
@@ -0,0 +1,91 @@
+import multiprocessing
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+READ_SQL = 'SELECT id, title, "order" FROM item WHERE is_active = 1 ORDER BY "order", id LIMIT 50'
+WRITE_SQL = 'INSERT INTO item (title, "order", is_active) VALUES (?, ?, 1)'
+
+
+def connect(path, pragmas):
+    conn = sqlite3.connect(path, timeout=0, isolation_level=None)
+    for name, value in pragmas.items():
+        conn.execute(f"PRAGMA {name}={value}")
+    return conn
+
+
+def worker(path, pragmas, begin, duration, write_ratio, results):
+    conn = connect(path, pragmas)
+    rng = random.Random(os.getpid())
+    reads = writes = locked = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        try:
+            if rng.random() < write_ratio:
+                conn.execute(begin)
+                conn.execute(WRITE_SQL, ("bench", rng.randint(0, 100)))
+                conn.execute("COMMIT")
+                writes += 1
+            else:
+                conn.execute(READ_SQL).fetchall()
+                reads += 1
+        except sqlite3.OperationalError as exc:
+            if "locked" not in str(exc) and "busy" not in str(exc):
+                raise
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            locked += 1
+    results.put((reads, writes, locked))
+
+
+class Command(BaseCommand):
+    help = "Compare SQLite read/write concurrency with default settings vs. SQLITE_PRAGMAS."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument("--duration", type=float, default=5.0, help="Seconds per profile.")
+        parser.add_argument("--rows", type=int, default=5000)
+        parser.add_argument("--write-ratio", type=float, default=0.05)
+
+    def handle(self, *args, **options):
+        profiles = [
+            ("default", {"busy_timeout": 0}, "BEGIN"),
+            ("tuned", settings.SQLITE_PRAGMAS, "BEGIN IMMEDIATE"),
+        ]
+        self.stdout.write(
+            f"{options['workers']} workers, {options['duration']:.0f}s per profile, "
+            f"{options['write_ratio']:.0%} writes"
+        )
+        self.stdout.write(f"{'profile':<10}{'reads/s':>12}{'writes/s':>12}{'locked':>10}")
+        for name, pragmas, begin in profiles:
+            reads, writes, locked = self.run_profile(pragmas, begin, options)
+            duration = options["duration"]
+            self.stdout.write(f"{name:<10}{reads / duration:>12.0f}{writes / duration:>12.1f}{locked:>10}")
+
+    def run_profile(self, pragmas, begin, options):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bench.sqlite3")
+            conn = connect(path, pragmas)
+            conn.execute('CREATE TABLE item (id INTEGER PRIMARY KEY, title TEXT, "order" INTEGER, is_active BOOL)')
+            conn.executemany(WRITE_SQL, (("seed", i % 100) for i in range(options["rows"])))
+            conn.close()
+
+            results = multiprocessing.Queue()
+            processes = [
+                multiprocessing.Process(
+                    target=worker,
+                    args=(path, pragmas, begin, options["duration"], options["write_ratio"], results),
+                )
+                for _ in range(options["workers"])
+            ]
+            for process in processes:
+                process.start()
+            totals = [results.get() for _ in processes]
+            for process in processes:
+                process.join()
+        return tuple(sum(column) for column in zip(*totals))
@@ -0,0 +1,32 @@
+from django.apps import apps
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+
+from config import cache, images
+
+
+class Command(BaseCommand):
+    help = "Render responsive variants for every uploaded image that lacks them."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="Re-render images that already have variants.")
+
+    def handle(self, *args, **options):
+        rendered = missing = 0
+        for model in apps.get_models():
+            fields = images.image_fields(model) if cache.is_timestamped(model) else []
+            if not fields:
+                continue
+            names = set()
+            for row in model.objects.values_list(*fields):
+                names.update(name for name in row if name)
+            for name in sorted(names):
+                if not default_storage.exists(name):
+                    missing += 1
+                    self.stderr.write(f"Missing source file: {name}")
+                    continue
+                if options["force"] or not default_storage.exists(images.manifest_name(name)):
+                    images.generate(name, wait=True)
+                    rendered += 1
+            cache.bump_version(model)
+        self.stdout.write(f"Rendered derivatives for {rendered} image(s); {missing} source file(s) missing.")
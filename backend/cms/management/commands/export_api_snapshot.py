@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from config import snapshot
+
+
+class Command(BaseCommand):
+    help = "Render the public API to a static, precompressed snapshot for nginx."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default=None, help="Host name absolute URLs are built with.")
+        parser.add_argument("--watch", action="store_true", help="Keep running and re-export whenever content changes.")
+        parser.add_argument("--interval", type=float, default=2.0, help="Seconds between change checks with --watch.")
+
+    def handle(self, *args, **options):
+        if not options["watch"]:
+            self.export(options["host"])
+            return
+        while True:
+            if not snapshot.is_current():
+                # Let a burst of admin edits settle before rendering.
+                time.sleep(snapshot.get_config()["DEBOUNCE"])
+                self.export(options["host"])
+            time.sleep(options["interval"])
+
+    def export(self, host):
+        started = time.perf_counter()
+        release = snapshot.export(host)
+        if release is None:
+            self.stdout.write("Content changed during the export; release discarded.")
+            return
+        manifest = snapshot.read_manifest()
+        self.stdout.write(f"Published {manifest['files']} file(s) to {release} in {time.perf_counter() - started:.1f}s.")
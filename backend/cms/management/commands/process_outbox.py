@@ -0,0 +1,24 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from cms import outbox
+
+
+class Command(BaseCommand):
+    help = "Deliver queued outbound emails, retrying failures with exponential backoff."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Process due jobs once and exit.")
+        parser.add_argument("--batch-size", type=int, default=None, help="Jobs claimed per batch.")
+        parser.add_argument("--interval", type=float, default=5.0, help="Seconds to sleep when the queue is idle.")
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = outbox.process_batch(options["batch_size"])
+            if sent or failed:
+                self.stdout.write(f"Delivered {sent} email(s), {failed} failed.")
+                continue
+            if options["once"]:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,13 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from cms import search
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index from scratch."
+
+    def handle(self, *args, **options):
+        for model_label in search.DOCUMENTS:
+            count = search.rebuild(apps.get_model(model_label))
+            self.stdout.write(f"Indexed {count} {model_label} row(s).")
@@ -0,0 +1,154 @@
+import random
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from cms import search
+from cms.models import ContactSubmission
+from config import cache
+from projects.models import Award, Project, ProjectCategory, ProjectImage
+from testimonials.models import Testimonial
+
+PREFIX = "seed-"
+EMAIL_DOMAIN = "@seed.invalid"
+REVIEWER_TITLE = "Seed reviewer"
+
+WORDS = (
+    "hydropower irrigation canal barrage tunnel feasibility detailed design supervision highway bridge "
+    "interchange water supply sewerage treatment plant transmission line substation dam spillway "
+    "geotechnical survey environmental assessment resettlement tender documents contract management "
+    "rehabilitation flood protection embankment reservoir penstock powerhouse turbine district provincial"
+).split()
+LOCATIONS = ["Khyber Pakhtunkhwa", "Punjab", "Sindh", "Balochistan", "Gilgit-Baltistan", "Azad Kashmir", "Islamabad"]
+CLIENTS = ["WAPDA", "NHA", "PEDO", "Irrigation Department", "Asian Development Bank", "World Bank", "USAID"]
+STATUSES = ["Completed", "In Progress", "Operational", "Planning"]
+SEEDED = (ProjectCategory, Project, ProjectImage, Award, ContactSubmission, Testimonial)
+
+
+class Command(BaseCommand):
+    help = "Seed reproducible benchmark volumes of projects, awards, contact submissions and testimonials."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--projects", type=int, default=2000)
+        parser.add_argument("--images", type=int, default=4, help="Gallery images per project.")
+        parser.add_argument("--contacts", type=int, default=5000)
+        parser.add_argument("--testimonials", type=int, default=1000)
+        parser.add_argument("--seed", type=int, default=0, help="Random seed; the same seed gives the same rows.")
+        parser.add_argument("--clear", action="store_true", help="Only delete previously seeded rows.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            deleted = self.clear()
+            if options["clear"]:
+                self.stdout.write(f"Deleted {deleted} seeded row(s).")
+            else:
+                self.seed(random.Random(options["seed"]), options)
+            # bulk_create/delete send no signals: refresh the search index and response caches.
+            for model in SEEDED:
+                if search.label(model) in search.DOCUMENTS:
+                    search.rebuild(model)
+                cache.bump_version(model)
+
+    def clear(self):
+        deleted = 0
+        for queryset in (
+            Project.objects.filter(slug__startswith=PREFIX),
+            ProjectCategory.objects.filter(slug__startswith=PREFIX),
+            Award.objects.filter(title__startswith="Seed "),
+            ContactSubmission.objects.filter(email__endswith=EMAIL_DOMAIN),
+            Testimonial.objects.filter(author_title=REVIEWER_TITLE),
+        ):
+            deleted += queryset.delete()[0]
+        return deleted
+
+    def seed(self, rng, options):
+        def text(words):
+            return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+        categories = ProjectCategory.objects.bulk_create(
+            ProjectCategory(name=f"Seed {name}", slug=f"{PREFIX}{name.lower()}", description=text(20), order=n)
+            for n, name in enumerate(["Hydropower", "Irrigation", "Transport", "Water", "Energy", "Urban"])
+        )
+        projects = Project.objects.bulk_create(
+            (
+                Project(
+                    title=f"{text(4)[:-1]} {i}",
+                    slug=f"{PREFIX}{i}",
+                    client=rng.choice(CLIENTS),
+                    summary=text(25)[:300],
+                    description=" ".join(text(30) for _ in range(rng.randint(3, 8))),
+                    start_date=date(2005, 1, 1) + timedelta(days=rng.randint(0, 7000)),
+                    location=rng.choice(LOCATIONS),
+                    budget=f"PKR {rng.randint(5, 900)} million",
+                    scope=[text(6) for _ in range(rng.randint(3, 10))],
+                    impact=text(40),
+                    status=rng.choice(STATUSES),
+                    category=rng.choice(categories),
+                    is_featured=rng.random() < 0.05,
+                    is_active=rng.random() < 0.95,
+                    order=rng.randint(0, 100),
+                )
+                for i in range(options["projects"])
+            ),
+            batch_size=500,
+        )
+        ProjectImage.objects.bulk_create(
+            (
+                ProjectImage(project=project, image=f"projects/gallery/{PREFIX}{project.pk}-{n}.jpg", caption=text(5), order=n)
+                for project in projects
+                for n in range(options["images"])
+            ),
+            batch_size=1000,
+        )
+        Award.objects.bulk_create(
+            (
+                Award(
+                    title=f"Seed {text(3)[:-1]}",
+                    organization=rng.choice(CLIENTS),
+                    year=rng.randint(2005, 2025),
+                    description=text(30),
+                    project=project,
+                )
+                for project in projects
+                if rng.random() < 0.3
+            ),
+            batch_size=1000,
+        )
+        now = timezone.now()
+        ContactSubmission.objects.bulk_create(
+            (
+                ContactSubmission(
+                    name=f"Contact {i}",
+                    email=f"contact{i}{EMAIL_DOMAIN}",
+                    company=rng.choice(CLIENTS),
+                    service=rng.choice(WORDS),
+                    message=" ".join(text(25) for _ in range(rng.randint(1, 4))),
+                    newsletter=rng.random() < 0.3,
+                    submitted_at=now - timedelta(minutes=rng.randint(0, 60 * 24 * 365)),
+                )
+                for i in range(options["contacts"])
+            ),
+            batch_size=1000,
+        )
+        Testimonial.objects.bulk_create(
+            (
+                Testimonial(
+                    author_name=f"Reviewer {i}",
+                    author_title=REVIEWER_TITLE,
+                    company=rng.choice(CLIENTS),
+                    content=text(rng.randint(20, 80)),
+                    rating=rng.randint(3, 5),
+                    is_approved=rng.random() < 0.8,
+                    submitted_by_client=rng.random() < 0.5,
+                )
+                for i in range(options["testimonials"])
+            ),
+            batch_size=1000,
+        )
+        self.stdout.write(
+            f"Seeded {len(categories)} categories, {len(projects)} projects "
+            f"({len(projects) * options['images']} images), {options['contacts']} contact submissions "
+            f"and {options['testimonials']} testimonials."
+        )
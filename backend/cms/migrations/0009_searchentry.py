@@ -0,0 +1,87 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:16
+
+from django.db import migrations, models
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE cms_searchentry_fts USING fts5(
+        title, body,
+        content='cms_searchentry', content_rowid='id',
+        tokenize='porter unicode61', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER cms_searchentry_ai AFTER INSERT ON cms_searchentry BEGIN
+        INSERT INTO cms_searchentry_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER cms_searchentry_ad AFTER DELETE ON cms_searchentry BEGIN
+        INSERT INTO cms_searchentry_fts(cms_searchentry_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER cms_searchentry_au AFTER UPDATE ON cms_searchentry BEGIN
+        INSERT INTO cms_searchentry_fts(cms_searchentry_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO cms_searchentry_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS cms_searchentry_au",
+    "DROP TRIGGER IF EXISTS cms_searchentry_ad",
+    "DROP TRIGGER IF EXISTS cms_searchentry_ai",
+    "DROP TABLE IF EXISTS cms_searchentry_fts",
+]
+
+POSTGRES_FORWARD = [
+    """
+    ALTER TABLE cms_searchentry ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(body, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX cms_searchentry_vector_idx ON cms_searchentry USING GIN (search_vector)",
+]
+
+POSTGRES_REVERSE = [
+    "DROP INDEX IF EXISTS cms_searchentry_vector_idx",
+    "ALTER TABLE cms_searchentry DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+    return operation
+
+
+create_text_index = run({'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRES_FORWARD})
+drop_text_index = run({'sqlite': SQLITE_REVERSE, 'postgresql': POSTGRES_REVERSE})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms', '0008_outboundemail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_label', models.CharField(max_length=100)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('title', models.CharField(max_length=300)),
+                ('body', models.TextField(blank=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Search Entries',
+                'constraints': [models.UniqueConstraint(fields=('model_label', 'object_id'), name='cms_searchentry_unique_object')],
+            },
+        ),
+        migrations.RunPython(create_text_index, drop_text_index),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:18
+
+from django.db import migrations, models
+
+# SQLite adds and removes these columns by rebuilding cms_searchentry, which
+# drops the triggers feeding the FTS5 index; put them back and reindex after
+# the field operations, in either direction.
+SQLITE_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS cms_searchentry_ai AFTER INSERT ON cms_searchentry BEGIN
+        INSERT INTO cms_searchentry_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS cms_searchentry_ad AFTER DELETE ON cms_searchentry BEGIN
+        INSERT INTO cms_searchentry_fts(cms_searchentry_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS cms_searchentry_au AFTER UPDATE ON cms_searchentry BEGIN
+        INSERT INTO cms_searchentry_fts(cms_searchentry_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO cms_searchentry_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    "INSERT INTO cms_searchentry_fts(cms_searchentry_fts) VALUES ('rebuild')",
+]
+
+
+def restore_text_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        for statement in SQLITE_TRIGGERS:
+            schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms', '0009_searchentry'),
+    ]
+
+    operations = [
+        # Runs last when migrating backwards, after the fields are removed.
+        migrations.RunPython(migrations.RunPython.noop, restore_text_index),
+        migrations.AddField(
+            model_name='searchentry',
+            name='href',
+            field=models.CharField(blank=True, max_length=300),
+        ),
+        migrations.AddField(
+            model_name='searchentry',
+            name='is_public',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.RunPython(restore_text_index, migrations.RunPython.noop),
+    ]
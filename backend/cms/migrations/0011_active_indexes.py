@@ -0,0 +1,73 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms', '0010_searchentry_href_is_public'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactsubmission',
+            index=models.Index(fields=['-submitted_at'], name='cms_contact_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='corevalue',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'id'], name='cms_corevalue_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='footerlink',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['group', 'order', 'id'], name='cms_footerlink_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hero',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at'], name='cms_hero_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leadership',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'id'], name='cms_leadership_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='navitem',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'id'], name='cms_navitem_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='officehour',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'id'], name='cms_officehour_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='page',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['title'], name='cms_page_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pagesection',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['page', 'order', 'id'], name='cms_section_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='partner',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'id'], name='cms_partner_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quickstat',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'id'], name='cms_quickstat_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='serviceprocessstep',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['step_number'], name='cms_processstep_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sociallink',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'id'], name='cms_sociallink_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='timelineevent',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'year'], name='cms_timeline_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='whychooseitem',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'id'], name='cms_whychoose_active_idx'),
+        ),
+    ]
@@ -36,6 +36,9 @@ class NavItem(TimestampedModel):
 
     class Meta:
         ordering = ["order", "id"]
+        indexes = [
+            models.Index(fields=["order", "id"], condition=models.Q(is_active=True), name="cms_navitem_active_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.label
@@ -50,6 +53,9 @@ class FooterLink(TimestampedModel):
 
     class Meta:
         ordering = ["group", "order", "id"]
+        indexes = [
+            models.Index(fields=["group", "order", "id"], condition=models.Q(is_active=True), name="cms_footerlink_active_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.group}: {self.label}"
@@ -65,6 +71,9 @@ class Hero(TimestampedModel):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"], condition=models.Q(is_active=True), name="cms_hero_active_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.title
@@ -91,6 +100,9 @@ class Page(TimestampedModel):
 
     class Meta:
         ordering = ["title"]
+        indexes = [
+            models.Index(fields=["title"], condition=models.Q(is_active=True), name="cms_page_active_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.title
@@ -107,6 +119,9 @@ class PageSection(TimestampedModel):
 
     class Meta:
         ordering = ["page", "order", "id"]
+        indexes = [
+            models.Index(fields=["page", "order", "id"], condition=models.Q(is_active=True), name="cms_section_active_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.page.title} - {self.heading}"
@@ -124,6 +139,7 @@ class ContactSubmission(TimestampedModel):
 
     class Meta:
         ordering = ["-submitted_at"]
+        indexes = [models.Index(fields=["-submitted_at"], name="cms_contact_submitted_idx")]
 
     def __str__(self) -> str:
         return f"{self.name} - {self.submitted_at.strftime('%Y-%m-%d')}"
@@ -139,6 +155,9 @@ class ServiceProcessStep(TimestampedModel):
 
     class Meta:
         ordering = ["step_number"]
+        indexes = [
+            models.Index(fields=["step_number"], condition=models.Q(is_active=True), name="cms_processstep_active_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"Step {self.step_number}: {self.title}"
@@ -153,6 +172,9 @@ class WhyChooseItem(TimestampedModel):
 
     class Meta:
         ordering = ["order", "id"]
+        indexes = [
+            models.Index(fields=["order", "id"], condition=models.Q(is_active=True), name="cms_whychoose_active_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.title
@@ -166,6 +188,9 @@ class OfficeHour(TimestampedModel):
 
     class Meta:
         ordering = ["order", "id"]
+        indexes = [
+            models.Index(fields=["order", "id"], condition=models.Q(is_active=True), name="cms_officehour_active_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.day}: {self.hours}"
@@ -179,6 +204,9 @@ class QuickStat(TimestampedModel):
 
     class Meta:
         ordering = ["order", "id"]
+        indexes = [
+            models.Index(fields=["order", "id"], condition=models.Q(is_active=True), name="cms_quickstat_active_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.value} {self.label}"
@@ -192,6 +220,9 @@ class SocialLink(TimestampedModel):
 
     class Meta:
         ordering = ["order", "id"]
+        indexes = [
+            models.Index(fields=["order", "id"], condition=models.Q(is_active=True), name="cms_sociallink_active_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -206,6 +237,9 @@ class Partner(TimestampedModel):
 
     class Meta:
         ordering = ["order", "id"]
+        indexes = [
+            models.Index(fields=["order", "id"], condition=models.Q(is_active=True), name="cms_partner_active_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -220,6 +254,9 @@ class CoreValue(TimestampedModel):
 
     class Meta:
         ordering = ["order", "id"]
+        indexes = [
+            models.Index(fields=["order", "id"], condition=models.Q(is_active=True), name="cms_corevalue_active_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.title
@@ -240,6 +277,9 @@ class Leadership(TimestampedModel):
 
     class Meta:
         ordering = ["order", "id"]
+        indexes = [
+            models.Index(fields=["order", "id"], condition=models.Q(is_active=True), name="cms_leadership_active_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.name} - {self.position}"
@@ -256,6 +296,80 @@ class TimelineEvent(TimestampedModel):
 
     class Meta:
         ordering = ["order", "year"]
+        indexes = [
+            models.Index(fields=["order", "year"], condition=models.Q(is_active=True), name="cms_timeline_active_idx"),
+        ]
 
     def __str__(self) -> str:
-        return f"{self.year}: {self.title}"
\ No newline at end of file
+        return f"{self.year}: {self.title}"
+
+
+class OutboundEmail(TimestampedModel):
+    """Email waiting to be delivered by the ``process_outbox`` worker."""
+
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    DEAD = "dead"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (SENDING, "Sending"),
+        (SENT, "Sent"),
+        (DEAD, "Dead"),
+    ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254, blank=True)
+    recipients = models.JSONField(default=list, blank=True)  # Empty means SiteSettings.contact_email
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ["next_attempt_at", "id"]
+        indexes = [models.Index(fields=["status", "next_attempt_at"], name="cms_outbox_due_idx")]
+
+    def __str__(self) -> str:
+        return f"{self.subject} ({self.status})"
+
+
+class SearchEntry(models.Model):
+    """Denormalized text of one searchable row (see cms/search.py).
+
+    On SQLite an FTS5 table mirrors ``title``/``body`` through triggers; on
+    PostgreSQL a generated ``tsvector`` column with a GIN index is added. Both
+    are created by migration 0009.
+    """
+
+    model_label = models.CharField(max_length=100)
+    object_id = models.PositiveBigIntegerField()
+    title = models.CharField(max_length=300)
+    body = models.TextField(blank=True)
+    href = models.CharField(max_length=300, blank=True)  # Frontend path of the result
+    is_public = models.BooleanField(default=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["model_label", "object_id"], name="cms_searchentry_unique_object"),
+        ]
+        verbose_name_plural = "Search Entries"
+
+    def __str__(self) -> str:
+        return f"{self.model_label}#{self.object_id}: {self.title}"
+
+
+class CacheVersion(models.Model):
+    """Version counter of one model's cached API responses (see config/cache.py).
+
+    Bumped with an ``UPDATE ... SET version = version + 1``, so concurrent
+    writers in different workers never lose an increment.
+    """
+
+    label = models.CharField(max_length=100, primary_key=True)  # Model label, e.g. "cms.page"
+    version = models.BigIntegerField()
+
+    def __str__(self) -> str:
+        return f"{self.label}: {self.version}"
@@ -0,0 +1,119 @@
+"""
+Durable email outbox.
+
+Requests only insert an ``OutboundEmail`` row (in the same transaction as the
+data it reports on); the ``process_outbox`` management command delivers
+them. Failed deliveries are retried with exponential backoff and moved to
+``dead`` once ``MAX_ATTEMPTS`` is reached.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import send_mail
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import OutboundEmail, SiteSettings
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "MAX_ATTEMPTS": 6,
+    "BACKOFF_BASE": 30,  # seconds before the first retry, doubled each attempt
+    "BACKOFF_MAX": 60 * 60,
+    "LEASE": 5 * 60,  # seconds a claimed job is reserved for one worker
+    "BATCH_SIZE": 20,
+}
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, "EMAIL_OUTBOX", {})}
+
+
+def enqueue(subject, body, recipients=None, from_email=None):
+    """Queue an email; ``recipients=None`` targets the site's contact address."""
+    return OutboundEmail.objects.create(
+        subject=subject[:255],
+        body=body,
+        from_email=from_email or "",
+        recipients=list(recipients or []),
+    )
+
+
+def backoff(attempts):
+    config = get_config()
+    return timedelta(seconds=min(config["BACKOFF_BASE"] * 2 ** (attempts - 1), config["BACKOFF_MAX"]))
+
+
+def claim_batch(limit=None):
+    """Reserve up to ``limit`` due jobs for this worker.
+
+    Jobs left in ``sending`` by a worker that died are claimable again once
+    their lease expires. Each claim is a conditional UPDATE, so concurrent
+    workers never deliver the same job twice within a lease.
+    """
+    config = get_config()
+    now = timezone.now()
+    due = (
+        OutboundEmail.objects.filter(Q(status=OutboundEmail.PENDING) | Q(status=OutboundEmail.SENDING))
+        .filter(next_attempt_at__lte=now)
+        .values_list("pk", "status", "next_attempt_at")[: limit or config["BATCH_SIZE"]]
+    )
+    lease_until = now + timedelta(seconds=config["LEASE"])
+    claimed = []
+    for pk, status, next_attempt_at in due:
+        updated = OutboundEmail.objects.filter(pk=pk, status=status, next_attempt_at=next_attempt_at).update(
+            status=OutboundEmail.SENDING, next_attempt_at=lease_until, updated_at=now
+        )
+        if updated:
+            claimed.append(pk)
+    return list(OutboundEmail.objects.filter(pk__in=claimed))
+
+
+def default_recipient():
+    site_settings = SiteSettings.objects.first()
+    if site_settings and site_settings.contact_email:
+        return site_settings.contact_email
+    return settings.DEFAULT_FROM_EMAIL
+
+
+def deliver(job, fallback_recipient):
+    config = get_config()
+    now = timezone.now()
+    try:
+        send_mail(
+            subject=job.subject,
+            message=job.body,
+            from_email=job.from_email or settings.DEFAULT_FROM_EMAIL,
+            recipient_list=job.recipients or [fallback_recipient],
+            fail_silently=False,
+        )
+    except Exception as exc:
+        job.attempts += 1
+        job.last_error = f"{type(exc).__name__}: {exc}"
+        if job.attempts >= config["MAX_ATTEMPTS"]:
+            job.status = OutboundEmail.DEAD
+            logger.error("Giving up on outbound email %s after %s attempts: %s", job.pk, job.attempts, job.last_error)
+        else:
+            job.status = OutboundEmail.PENDING
+            job.next_attempt_at = now + backoff(job.attempts)
+            logger.warning("Outbound email %s failed (attempt %s): %s", job.pk, job.attempts, job.last_error)
+    else:
+        job.attempts += 1
+        job.status = OutboundEmail.SENT
+        job.sent_at = now
+        job.last_error = ""
+    job.save(update_fields=["attempts", "status", "next_attempt_at", "sent_at", "last_error", "updated_at"])
+    return job.status == OutboundEmail.SENT
+
+
+def process_batch(limit=None):
+    """Deliver one batch of due jobs; returns ``(sent, failed)`` counts."""
+    jobs = claim_batch(limit)
+    if not jobs:
+        return 0, 0
+    fallback_recipient = default_recipient()
+    sent = sum(deliver(job, fallback_recipient) for job in jobs)
+    return sent, len(jobs) - sent
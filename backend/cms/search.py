@@ -0,0 +1,311 @@
+"""
+Full-text search index.
+
+Searchable rows are copied into ``SearchEntry`` (title + body text) whenever
+they are saved, and removed when deleted. The database's own full-text
+engine indexes that table: FTS5 on SQLite, a ``tsvector`` GIN index on
+PostgreSQL. ``FullTextSearchFilter`` replaces DRF's ``SearchFilter`` so
+``?search=`` is answered from the index with ranked, prefix-matching
+results instead of ``icontains`` scans; other databases keep the LIKE path.
+"""
+
+import re
+
+from django.apps import apps
+from django.db import connection
+from django.db.models import FloatField
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_delete, post_save
+from rest_framework.filters import SearchFilter
+
+from config import bulk
+
+from .models import SearchEntry
+
+RANK = "search_rank"
+
+
+class Document:
+    """How one model is flattened into a ``SearchEntry``.
+
+    ``kind`` names the result type in ``/api/search/``; ``href`` builds the
+    frontend path of a row and ``is_public`` decides whether it may appear there.
+    """
+
+    def __init__(self, kind, title, body, href, is_public=None, related=(), dependents=None):
+        self.kind = kind
+        self.title = title
+        self.body = body
+        self.href = href
+        self.is_public = is_public or (lambda instance: getattr(instance, "is_active", True))
+        # Relations read by href/is_public, and rows to reindex when this one changes.
+        self.related = related
+        self.dependents = dependents
+
+    def build(self, instance):
+        return {
+            "title": str(getattr(instance, self.title) or "")[:300],
+            "body": "\n".join(text for text in (flatten(getattr(instance, name)) for name in self.body) if text),
+            "href": self.href(instance)[:300],
+            "is_public": self.is_public(instance),
+        }
+
+
+def flatten(value):
+    """Collect the strings of plain values and JSON field contents."""
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        return " ".join(flatten(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return " ".join(flatten(item) for item in value)
+    return str(value)
+
+
+DOCUMENTS = {
+    "projects.project": Document(
+        "project", "title", ["slug", "client", "location", "summary", "description", "sector"],
+        href=lambda project: f"/projects#{project.slug}",
+    ),
+    "services.service": Document(
+        "service", "title", ["slug", "short_description", "description"],
+        href=lambda service: f"/services#{service.slug}",
+    ),
+    "sectors.sector": Document(
+        "sector", "name", ["slug", "short_description", "description", "overview", "capabilities"],
+        href=lambda sector: f"/sectors/{sector.slug}",
+    ),
+    "cms.page": Document(
+        "page", "title", ["slug", "content"],
+        href=lambda page: f"/{page.slug}",
+        dependents=lambda page: page.sections.select_related("page"),
+    ),
+    "cms.pagesection": Document(
+        "section", "heading", ["identifier", "content"],
+        href=lambda section: f"/{section.page.slug}#{section.identifier}",
+        is_public=lambda section: section.is_active and section.page.is_active,
+        related=("page",),
+    ),
+    "cms.leadership": Document(
+        "leadership", "name", ["position", "specialization", "education", "bio"],
+        href=lambda person: "/about",
+    ),
+    "projects.award": Document(
+        "award", "title", ["organization", "year", "description"],
+        href=lambda award: "/projects",
+    ),
+}
+
+
+def label(model):
+    return model._meta.label_lower
+
+
+def index_instance(instance):
+    document = DOCUMENTS[label(type(instance))]
+    SearchEntry.objects.update_or_create(
+        model_label=label(type(instance)),
+        object_id=instance.pk,
+        defaults=document.build(instance),
+    )
+    if document.dependents:
+        for dependent in document.dependents(instance):
+            index_instance(dependent)
+
+
+def remove_instance(instance):
+    SearchEntry.objects.filter(model_label=label(type(instance)), object_id=instance.pk).delete()
+
+
+def index_many(model, instances):
+    """Reindex ``instances`` of ``model`` with one delete and one insert."""
+    document = DOCUMENTS[label(model)]
+    pks = [instance.pk for instance in instances]
+    SearchEntry.objects.filter(model_label=label(model), object_id__in=pks).delete()
+    instances = model.objects.select_related(*document.related).filter(pk__in=pks)
+    entries = [
+        SearchEntry(model_label=label(model), object_id=instance.pk, **document.build(instance))
+        for instance in instances
+    ]
+    SearchEntry.objects.bulk_create(entries, batch_size=500)
+    if document.dependents:
+        for instance in instances:
+            for dependent in document.dependents(instance):
+                index_instance(dependent)
+
+
+def rebuild(model):
+    """Reindex every row of ``model``; returns the number of entries."""
+    document = DOCUMENTS[label(model)]
+    SearchEntry.objects.filter(model_label=label(model)).delete()
+    entries = [
+        SearchEntry(model_label=label(model), object_id=instance.pk, **document.build(instance))
+        for instance in model.objects.select_related(*document.related).iterator()
+    ]
+    SearchEntry.objects.bulk_create(entries, batch_size=500)
+    return len(entries)
+
+
+def is_supported():
+    return connection.vendor in ("sqlite", "postgresql")
+
+
+def terms(query):
+    return re.findall(r"\w+", query)
+
+
+def match_expression(words):
+    """Full-text query matching every word, each also as a prefix."""
+    if connection.vendor == "sqlite":
+        return " ".join(f'"{word}"*' for word in words)
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def rank_queryset(queryset, query):
+    """Restrict ``queryset`` to rows matching ``query``, best match first.
+
+    Matching and scoring both run in the database: an ``IN`` subquery scans
+    the index once, and a ``search_rank`` annotation (bm25 / ``ts_rank``)
+    looks each row's entry up through the ``(model_label, object_id)`` unique
+    index. Ties fall back to the primary key, which keyset pagination keeps as
+    its last key.
+    """
+    words = terms(query)
+    if not words:
+        return queryset.none()
+    opts = queryset.model._meta
+    quote = connection.ops.quote_name
+    row = f"{quote(opts.db_table)}.{quote(opts.pk.column)}"
+    expression, model_label = match_expression(words), label(queryset.model)
+    if connection.vendor == "sqlite":
+        # CROSS JOIN keeps the FTS table outermost: one MATCH scan, not one per entry.
+        matches = RawSQL(
+            "SELECT e.object_id FROM cms_searchentry_fts CROSS JOIN cms_searchentry e "
+            "ON e.id = cms_searchentry_fts.rowid WHERE cms_searchentry_fts MATCH %s AND e.model_label = %s",
+            [expression, model_label],
+        )
+        rank = RawSQL(
+            "SELECT -bm25(cms_searchentry_fts, 10.0, 1.0) FROM cms_searchentry e JOIN cms_searchentry_fts "
+            "ON cms_searchentry_fts.rowid = e.id WHERE e.model_label = %s "
+            f"AND e.object_id = {row} AND cms_searchentry_fts MATCH %s",
+            [model_label, expression],
+            output_field=FloatField(),
+        )
+    else:
+        matches = RawSQL(
+            "SELECT e.object_id FROM cms_searchentry e "
+            "WHERE e.search_vector @@ to_tsquery('english', %s) AND e.model_label = %s",
+            [expression, model_label],
+        )
+        rank = RawSQL(
+            "SELECT ts_rank(e.search_vector, to_tsquery('english', %s)) FROM cms_searchentry e "
+            f"WHERE e.model_label = %s AND e.object_id = {row}",
+            [expression, model_label],
+            output_field=FloatField(),
+        )
+    return queryset.filter(pk__in=matches).annotate(**{RANK: rank}).order_by(f"-{RANK}", "pk")
+
+
+def query_index(query, model_labels, limit, details=False, public_only=False):
+    """Run one ranked full-text query over the index, best match first.
+
+    Every term must match; each one also matches as a prefix. Rows are
+    ``(model_label, object_id)``, followed by ``(title, href, snippet, score)``
+    when ``details`` is set.
+    """
+    words = terms(query)
+    if not words or not model_labels or not is_supported():
+        return []
+    placeholders = ", ".join(["%s"] * len(model_labels))
+    public = "AND e.is_public" if public_only else ""
+    expression = match_expression(words)
+    if connection.vendor == "sqlite":
+        extra = (
+            ", e.title, e.href, snippet(cms_searchentry_fts, -1, '<mark>', '</mark>', '…', 16)"
+            if details else ""
+        )
+        sql = f"""
+            SELECT e.model_label, e.object_id{extra}, -bm25(cms_searchentry_fts, 10.0, 1.0) AS score
+            FROM cms_searchentry_fts
+            JOIN cms_searchentry e ON e.id = cms_searchentry_fts.rowid
+            WHERE cms_searchentry_fts MATCH %s {public} AND e.model_label IN ({placeholders})
+            ORDER BY score DESC
+            LIMIT %s
+        """
+    else:
+        extra = (
+            ", e.title, e.href, ts_headline('english', e.body, query, "
+            "'StartSel=<mark>, StopSel=</mark>, MaxWords=24, MinWords=8')"
+            if details else ""
+        )
+        sql = f"""
+            SELECT e.model_label, e.object_id{extra}, ts_rank(e.search_vector, query) AS score
+            FROM cms_searchentry e, to_tsquery('english', %s) query
+            WHERE e.search_vector @@ query {public} AND e.model_label IN ({placeholders})
+            ORDER BY score DESC
+            LIMIT %s
+        """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [expression, *model_labels, limit])
+        return cursor.fetchall()
+
+
+def search(query, kinds=None, limit=20):
+    """Ranked public hits of every indexed type, with highlighted snippets.
+
+    One query over the whole index; ``kinds`` restricts the result types.
+    """
+    labels = [model_label for model_label, document in DOCUMENTS.items() if not kinds or document.kind in kinds]
+    rows = query_index(query, labels, limit, details=True, public_only=True)
+    return [
+        {
+            "type": DOCUMENTS[model_label].kind,
+            "id": object_id,
+            "title": title,
+            "href": href,
+            "snippet": snippet,
+            "score": score,
+        }
+        for model_label, object_id, title, href, snippet, score in rows
+    ]
+
+
+class FullTextSearchFilter(SearchFilter):
+    """``SearchFilter`` backed by the full-text index for indexed models.
+
+    Every match is returned, like the ``icontains`` path, ranked by relevance
+    unless ``?ordering=`` is given (see ``rank_queryset``).
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        if not search_terms or label(queryset.model) not in DOCUMENTS or not is_supported():
+            return super().filter_queryset(request, queryset, view)
+        return rank_queryset(queryset, " ".join(search_terms))
+
+
+@bulk.per_row
+def update(sender, instance, **kwargs):
+    index_instance(instance)
+
+
+@bulk.per_row
+def remove(sender, instance, **kwargs):
+    remove_instance(instance)
+
+
+def update_bulk(sender, saved, deleted, **kwargs):
+    if label(sender) not in DOCUMENTS:
+        return
+    if deleted:
+        SearchEntry.objects.filter(model_label=label(sender), object_id__in=deleted).delete()
+    if saved:
+        index_many(sender, saved)
+
+
+def connect_signals():
+    for model_label in DOCUMENTS:
+        model = apps.get_model(model_label)
+        post_save.connect(update, sender=model, dispatch_uid=f"search-index-save-{model_label}")
+        post_delete.connect(remove, sender=model, dispatch_uid=f"search-index-delete-{model_label}")
+    bulk.bulk_changed.connect(update_bulk, dispatch_uid="search-index-bulk")
@@ -1,44 +1,46 @@
 from rest_framework import serializers
+from config.images import ResponsiveImagesMixin
+from config.sparse import SparseFieldsMixin
 from .models import SiteSettings, NavItem, FooterLink, SEO, Hero, Page, PageSection, ContactSubmission, ServiceProcessStep, WhyChooseItem, OfficeHour, SocialLink, QuickStat, Partner, CoreValue, Leadership, TimelineEvent
 
 
-class SiteSettingsSerializer(serializers.ModelSerializer):
+class SiteSettingsSerializer(SparseFieldsMixin, ResponsiveImagesMixin, serializers.ModelSerializer):
     class Meta:
         model = SiteSettings
         fields = "__all__"
 
 
-class NavItemSerializer(serializers.ModelSerializer):
+class NavItemSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = NavItem
         fields = "__all__"
 
 
-class FooterLinkSerializer(serializers.ModelSerializer):
+class FooterLinkSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = FooterLink
         fields = "__all__"
 
 
-class SEOSerializer(serializers.ModelSerializer):
+class SEOSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = SEO
         fields = "__all__"
 
 
-class HeroSerializer(serializers.ModelSerializer):
+class HeroSerializer(SparseFieldsMixin, ResponsiveImagesMixin, serializers.ModelSerializer):
     class Meta:
         model = Hero
         fields = "__all__"
 
 
-class PageSectionSerializer(serializers.ModelSerializer):
+class PageSectionSerializer(SparseFieldsMixin, ResponsiveImagesMixin, serializers.ModelSerializer):
     class Meta:
         model = PageSection
         fields = "__all__"
 
 
-class PageSerializer(serializers.ModelSerializer):
+class PageSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     sections = PageSectionSerializer(many=True, read_only=True)
 
     class Meta:
@@ -46,13 +48,13 @@ class PageSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class ContactSubmissionSerializer(serializers.ModelSerializer):
+class ContactSubmissionSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = ContactSubmission
         fields = "__all__"
 
 
-class ServiceProcessStepSerializer(serializers.ModelSerializer):
+class ServiceProcessStepSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     activities_list = serializers.SerializerMethodField()
 
     class Meta:
@@ -65,49 +67,49 @@ class ServiceProcessStepSerializer(serializers.ModelSerializer):
         return [a.strip() for a in (obj.activities or '').split(',') if a.strip()]
 
 
-class WhyChooseItemSerializer(serializers.ModelSerializer):
+class WhyChooseItemSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = WhyChooseItem
         fields = '__all__'
 
 
-class OfficeHourSerializer(serializers.ModelSerializer):
+class OfficeHourSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = OfficeHour
         fields = '__all__'
 
 
-class SocialLinkSerializer(serializers.ModelSerializer):
+class SocialLinkSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = SocialLink
         fields = '__all__'
 
 
-class QuickStatSerializer(serializers.ModelSerializer):
+class QuickStatSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = QuickStat
         fields = '__all__'
 
 
-class PartnerSerializer(serializers.ModelSerializer):
+class PartnerSerializer(SparseFieldsMixin, ResponsiveImagesMixin, serializers.ModelSerializer):
     class Meta:
         model = Partner
         fields = '__all__'
 
 
-class CoreValueSerializer(serializers.ModelSerializer):
+class CoreValueSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = CoreValue
         fields = '__all__'
 
 
-class LeadershipSerializer(serializers.ModelSerializer):
+class LeadershipSerializer(SparseFieldsMixin, ResponsiveImagesMixin, serializers.ModelSerializer):
     class Meta:
         model = Leadership
         fields = '__all__'
 
 
-class TimelineEventSerializer(serializers.ModelSerializer):
+class TimelineEventSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = TimelineEvent
         fields = '__all__'
\ No newline at end of file
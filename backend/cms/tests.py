@@ -1,3 +1,746 @@
-from django.test import TestCase
+import gzip
+import io
+import json
+import os
+import tempfile
+import uuid
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management import call_command
+from django.db import connection
+from django.http import QueryDict
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.test import AsyncRequestFactory, Client, RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError, Throttled
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from config import authentication, cache, compression, instrumentation, metrics, snapshot
+from config.pagination import KeysetPagination
+from config.renderers import FastJSONParser, FastJSONRenderer
+from projects.models import Project
+
+from . import outbox, search
+from .models import CacheVersion, ContactSubmission, NavItem, OutboundEmail, Page, PageSection, SearchEntry
+
+
+@override_settings(API_CACHE={"ENABLED": False})
+class PageQueryCountTests(TestCase):
+    """Page endpoints must cost a fixed number of queries regardless of size."""
+
+    @classmethod
+    def setUpTestData(cls):
+        pages = Page.objects.bulk_create(Page(title=f"Page {i}", slug=f"page-{i}") for i in range(100))
+        PageSection.objects.bulk_create(
+            PageSection(page=page, identifier=f"s{n}", heading=f"Heading {n}", content="...", order=n)
+            for page in pages
+            for n in range(5)
+        )
+
+    def test_list_query_budget(self):
+        # 2 validators + pages + sections
+        with self.assertNumQueries(4):
+            response = self.client.get("/api/pages/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 100)
+        self.assertEqual(len(response.json()[0]["sections"]), 5)
+
+    def test_detail_query_budget(self):
+        with self.assertNumQueries(4):
+            response = self.client.get("/api/pages/page-7/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["sections"]), 5)
+
+
+@override_settings(API_CACHE={"ENABLED": False})
+class BundleQueryCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        from services.models import Service, ServiceCategory
+        from .models import Partner, SiteSettings
+
+        SiteSettings.objects.create()
+        category = ServiceCategory.objects.create(name="Energy", slug="energy")
+        Service.objects.bulk_create(
+            Service(title=f"Service {i}", slug=f"service-{i}", category=category) for i in range(100)
+        )
+        Partner.objects.bulk_create(Partner(name=f"Partner {i}") for i in range(100))
+
+    def test_home_bundle_query_budget(self):
+        # 10 validators (9 sections + nested service category) + 9 sections
+        with self.assertNumQueries(19):
+            response = self.client.get("/api/bundle/home/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["services"]), 100)
+
+    async def test_async_bundle_matches_sync(self):
+        from .views import AsyncBundleView
+
+        expected = await sync_to_async(self.client.get)("/api/bundle/home/")
+        view = AsyncBundleView.as_view()
+        response = await view(AsyncRequestFactory().get("/api/bundle/home/"), name="home")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content), expected.json())
+        self.assertEqual(response["ETag"], expected["ETag"])
+
+        request = AsyncRequestFactory().get("/api/bundle/home/", headers={"If-None-Match": response["ETag"]})
+        self.assertEqual((await view(request, name="home")).status_code, 304)
+        self.assertEqual((await view(AsyncRequestFactory().get("/"), name="nope")).status_code, 404)
+
+
+@override_settings(API_CACHE={"ENABLED": False})
+class BatchTests(TestCase):
+    def test_batch_runs_each_url_through_its_view(self):
+        Page.objects.create(title="About", slug="about")
+        urls = ["/api/pages/", "/api/pages/about/", "/api/pages/missing/", "/api/nope/", "/admin/", "/api/batch/"]
+        response = self.client.post("/api/batch/", {"requests": urls}, content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["responses"]
+        self.assertEqual([result["url"] for result in results], urls)
+        self.assertEqual([result["status"] for result in results], [200, 200, 404, 404, 400, 400])
+        self.assertEqual(results[0]["body"], self.client.get("/api/pages/").json())
+        self.assertEqual(results[1]["body"]["slug"], "about")
+
+        response = self.client.get("/api/batch/", {"url": ["/api/pages/?slug=about", "/api/bundle/layout/"]})
+        self.assertEqual([result["status"] for result in response.json()["responses"]], [200, 200])
+        self.assertEqual(self.client.get("/api/batch/").status_code, 400)
+        self.assertEqual(self.client.get("/api/batch/", {"url": ["/api/pages/"] * 21}).status_code, 400)
+
+    def test_failing_url_does_not_fail_the_batch(self):
+        urls = ["/api/pages/", "/api/nav-items/", "/api/nav-items/abc/"]
+        with mock.patch("cms.views.PageViewSet.list", side_effect=RuntimeError("boom")), self.assertLogs("cms.batch"):
+            response = self.client.post("/api/batch/", {"requests": urls}, content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result["status"] for result in response.json()["responses"]], [500, 200, 404])
+
+        with mock.patch("cms.views.PageViewSet.list", side_effect=Throttled(wait=5)):
+            response = self.client.post("/api/batch/", {"requests": urls[:1]}, content_type="application/json")
+        self.assertEqual(response.json()["responses"][0]["status"], 429)
+
+
+class BulkWriteTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(get_user_model().objects.create_user("editor", is_staff=True))
+
+    def reorder(self, items):
+        payload = [{"id": item["id"], "order": len(items) - n} for n, item in enumerate(items)]
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch("/api/nav-items/bulk/", payload, format="json")
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_bulk_create_update_delete(self):
+        items = [{"label": f"Item {n}", "href": f"/{n}", "order": n} for n in range(30)]
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post("/api/nav-items/bulk/", items, format="json")
+        self.assertEqual(response.status_code, 201)
+        created = response.json()
+        self.assertEqual(self.client.get("/api/nav-items/").json()[0]["label"], "Item 0")
+
+        # Constant queries whatever the batch size, and the cached list is invalidated.
+        self.assertEqual(self.reorder(created[:3]), self.reorder(created))
+        self.assertEqual(self.client.get("/api/nav-items/").json()[0]["label"], "Item 29")
+
+        response = self.client.patch("/api/nav-items/bulk/", [{"id": created[0]["id"], "order": -1}], format="json")
+        self.assertEqual(response.status_code, 400)
+        response = self.client.delete("/api/nav-items/bulk/", {"ids": [item["id"] for item in created[:10]]}, format="json")
+        self.assertEqual(response.json(), {"deleted": 10})
+        self.assertEqual(NavItem.objects.count(), 20)
+        self.assertEqual(APIClient().delete("/api/nav-items/bulk/", {"ids": [1]}, format="json").status_code, 401)
+
+    def test_bulk_rejects_non_integer_ids(self):
+        item = NavItem.objects.create(label="Home", href="/")
+        for ids in (["x"], [[1]], [None], [True], [str(item.pk)]):
+            response = self.client.delete("/api/nav-items/bulk/", {"ids": ids}, format="json")
+            self.assertEqual(response.status_code, 400, ids)
+        response = self.client.patch("/api/nav-items/bulk/", [{"id": True, "label": "Renamed"}], format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(NavItem.objects.get().label, "Home")
+
+    @skipUnless(search.is_supported(), "needs a full-text engine")
+    def test_bulk_writes_update_the_search_index(self):
+        pages = [{"title": "Hydropower", "slug": "hydro"}, {"title": "Irrigation", "slug": "irrigation"}]
+        created = self.client.post("/api/pages/bulk/", pages, format="json").json()
+        self.assertEqual([hit["title"] for hit in search.search("hydropower")], ["Hydropower"])
+        self.client.delete("/api/pages/bulk/", {"ids": [page["id"] for page in created]}, format="json")
+        self.assertEqual(search.search("hydropower"), [])
+
+
+@skipUnless(search.is_supported(), "needs a full-text engine")
+class SearchIndexTests(TestCase):
+    def setUp(self):
+        cache.response_cache().clear()
+
+    def titles(self, query):
+        return [hit["title"] for hit in search.search(query)]
+
+    def test_index_follows_create_update_delete(self):
+        page = Page.objects.create(title="Hydropower", slug="hydro", content={"intro": "Run-of-river schemes"})
+        self.assertEqual(self.titles("hydro"), ["Hydropower"])
+        self.assertEqual(self.titles("river schemes"), ["Hydropower"])
+
+        page.title = "Irrigation"
+        page.save()
+        self.assertEqual(self.titles("hydropower"), [])
+        self.assertEqual(self.titles("irrigation"), ["Irrigation"])
+
+        page.is_active = False
+        page.save()
+        self.assertEqual(self.titles("irrigation"), [])
+
+        page.delete()
+        self.assertFalse(SearchEntry.objects.exists())
+
+    def test_search_filter_ranks_and_paginates_by_relevance(self):
+        # Title hits outrank body hits, against the model's title ordering.
+        Page.objects.create(title="Annual report", slug="report", content={"text": "A dam inspection."})
+        Page.objects.create(title="Zambezi dam safety", slug="zambezi")
+        Page.objects.create(title="Careers", slug="careers")
+        ranked = ["Zambezi dam safety", "Annual report"]
+        self.assertEqual([page["title"] for page in self.client.get("/api/pages/?search=dam").json()], ranked)
+        self.assertEqual(
+            [page["title"] for page in self.client.get("/api/pages/?search=dam&ordering=title").json()],
+            sorted(ranked),
+        )
+
+        titles, url = [], "/api/pages/?search=dam&page_size=1"
+        while url:
+            body = self.client.get(url).json()
+            titles += [page["title"] for page in body["results"]]
+            url = body["next"]
+        self.assertEqual(titles, ranked)
+
+    def test_search_filter_ranks_in_sql(self):
+        def search_sql(count):
+            Page.objects.bulk_create(Page(title=f"Dam {n}", slug=f"dam-{n}-{count}") for n in range(count))
+            search.rebuild(Page)
+            cache.response_cache().clear()
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(len(self.client.get("/api/pages/?search=dam").json()), Page.objects.count())
+            return [query["sql"] for query in queries if 'FROM "cms_page"' in query["sql"]]
+
+        # The page queries (list and validators) do not grow with the number of matches.
+        few, many = search_sql(2), search_sql(200)
+        self.assertEqual([len(sql) for sql in few], [len(sql) for sql in many])
+        self.assertFalse(any("CASE" in sql for sql in many))
+
+    def test_search_endpoint(self):
+        Project.objects.create(title="Kariba dam rehabilitation", slug="kariba", client="Zambezi River Authority")
+        Page.objects.create(title="About", slug="about", content={"text": "Dam engineering since 1990."})
+        Page.objects.create(title="Hidden dam page", slug="hidden", is_active=False)
+
+        body = self.client.get("/api/search/?q=dam").json()
+        self.assertEqual(body["query"], "dam")
+        self.assertEqual(
+            [(hit["type"], hit["title"], hit["href"]) for hit in body["results"]],
+            [("project", "Kariba dam rehabilitation", "/projects#kariba"), ("page", "About", "/about")],
+        )
+        self.assertIn("<mark>", body["results"][1]["snippet"])
+        self.assertEqual([hit["type"] for hit in self.client.get("/api/search/?q=dam&type=page").json()["results"]], ["page"])
+        self.assertEqual(len(self.client.get("/api/search/?q=dam&limit=1").json()["results"]), 1)
+        self.assertEqual(self.client.get("/api/search/?q=").json(), {"query": "", "results": []})
+        self.assertEqual(self.client.get("/api/search/?q=dam&type=planet").status_code, 400)
+
+        # Cached responses follow edits once they commit.
+        with self.captureOnCommitCallbacks(execute=True):
+            Project.objects.filter(slug="kariba").get().delete()
+        self.assertEqual([hit["type"] for hit in self.client.get("/api/search/?q=dam").json()["results"]], ["page"])
+
+    def test_rebuild_command(self):
+        Page.objects.create(title="Hydropower", slug="hydro")
+        Page.objects.update(title="Irrigation")  # update() sends no signals
+        SearchEntry.objects.filter(model_label="cms.page").update(title="Stale")
+        Project.objects.create(title="Kariba", slug="kariba")
+        SearchEntry.objects.filter(model_label="projects.project").delete()
+
+        out = io.StringIO()
+        call_command("rebuild_search_index", stdout=out)
+        self.assertIn("Indexed 1 cms.page row(s).", out.getvalue())
+        self.assertIn("Indexed 1 projects.project row(s).", out.getvalue())
+        self.assertEqual(self.titles("irrigation"), ["Irrigation"])
+        self.assertEqual(self.titles("kariba"), ["Kariba"])
+        self.assertEqual(SearchEntry.objects.count(), 2)
+
+
+@skipUnless(connection.vendor == "sqlite", "asserts on SQLite triggers")
+class SearchMigrationTests(TransactionTestCase):
+    def assertIndexFollowsWrites(self, title, **columns):
+        columns = {"model_label": "cms.page", "object_id": 1, "title": title, "body": "", **columns}
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'cms_searchentry' ORDER BY name"
+            )
+            self.assertEqual(
+                [row[0] for row in cursor.fetchall()],
+                ["cms_searchentry_ad", "cms_searchentry_ai", "cms_searchentry_au"],
+            )
+            cursor.execute(
+                f"INSERT INTO cms_searchentry ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})",
+                list(columns.values()),
+            )
+            cursor.execute("SELECT count(*) FROM cms_searchentry_fts WHERE cms_searchentry_fts MATCH %s", [title])
+            self.assertEqual(cursor.fetchone()[0], 1)
+            cursor.execute("DELETE FROM cms_searchentry")
+            cursor.execute("SELECT count(*) FROM cms_searchentry_fts WHERE cms_searchentry_fts MATCH %s", [title])
+            self.assertEqual(cursor.fetchone()[0], 0)
+
+    def test_triggers_survive_rolling_back_and_reapplying(self):
+        # Force the table rebuild SQLite < 3.35.5 uses to drop columns.
+        try:
+            with mock.patch.object(connection.features, "can_alter_table_drop_column", False):
+                call_command("migrate", "cms", "0009", verbosity=0)
+            self.assertIndexFollowsWrites("rollback")
+        finally:
+            call_command("migrate", verbosity=0)
+        self.assertIndexFollowsWrites("reapplied", href="/", is_public=True)
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.response_cache().clear()
+        self.item = NavItem.objects.create(label="Home", href="/")
+
+    def test_list_etag_and_last_modified(self):
+        response = self.client.get("/api/nav-items/")
+        etag = response["ETag"]
+        self.assertIn("Last-Modified", response)
+        self.assertEqual(self.client.get("/api/nav-items/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(
+            self.client.get("/api/nav-items/", HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]).status_code, 304
+        )
+        self.assertNotEqual(self.client.get("/api/nav-items/?is_active=true")["ETag"], etag)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            NavItem.objects.create(label="About", href="/about")
+        response = self.client.get("/api/nav-items/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_detail_etag_and_bad_lookups(self):
+        url = f"/api/nav-items/{self.item.pk}/"
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self.client.get("/api/nav-items/999/").status_code, 404)
+        self.assertEqual(self.client.get("/api/nav-items/abc/").status_code, 404)
+        response = self.client.get("/api/batch/", {"url": ["/api/nav-items/abc/", url]})
+        self.assertEqual([result["status"] for result in response.json()["responses"]], [404, 200])
+
+
+class CacheInvalidationTests(TestCase):
+    def test_versions_bump_when_the_write_commits(self):
+        cache.response_cache().clear()
+        item = NavItem.objects.create(label="Home", href="/")
+        self.assertEqual(self.client.get("/api/nav-items/").json()[0]["label"], "Home")
+        before = cache.get_versions([NavItem])
+        with self.captureOnCommitCallbacks(execute=True):
+            item.label = "Start"
+            item.save()
+            # A concurrent reader still sees the committed rows: they stay under the old version.
+            self.assertEqual(cache.get_versions([NavItem]), before)
+        self.assertNotEqual(cache.get_versions([NavItem]), before)
+        self.assertEqual(self.client.get("/api/nav-items/").json()[0]["label"], "Start")
+
+    def test_counters_are_shared_rows_bumped_in_sql(self):
+        seed, _ = cache.get_versions([Page, PageSection])
+        with CaptureQueriesContext(connection) as queries:
+            cache.bump_version(Page)
+        self.assertEqual(len(queries), 1)
+        self.assertIn('"version" + 1', queries[0]["sql"])
+        self.assertEqual(CacheVersion.objects.get(label="cms.page").version, seed + 1)
+
+        # One query per request, however many models and lookups.
+        request = RequestFactory().get("/api/pages/")
+        with self.assertNumQueries(1):
+            versions = cache.get_versions([Page, PageSection], request)
+            self.assertEqual(cache.get_versions([PageSection, Page], request), versions[::-1])
+        cache.bump_version(NavItem)  # an unseeded counter is created, then bumped
+        self.assertTrue(CacheVersion.objects.filter(label="cms.navitem").exists())
+
+
+class KeysetPaginationTests(TestCase):
+    def walk(self, url):
+        ids, pages = [], 0
+        while url:
+            pages += 1
+            self.assertLess(pages, 50, "next links do not advance")
+            body = self.client.get(url).json()
+            ids.extend(row["id"] for row in body["results"])
+            url = body["next"]
+        return ids
+
+    def test_cursor_keeps_sub_millisecond_ties_descending(self):
+        base = timezone.now().replace(microsecond=500000)
+        ContactSubmission.objects.bulk_create(
+            # 120 rows within one millisecond, pairs sharing a timestamp.
+            ContactSubmission(
+                name=f"C{n}", email=f"c{n}@example.com", message="Hi", submitted_at=base + timedelta(microseconds=n // 2)
+            )
+            for n in range(120)
+        )
+        expected = list(ContactSubmission.objects.order_by("-submitted_at", "pk").values_list("pk", flat=True))
+        self.assertEqual(self.walk("/api/contact-submissions/"), expected)
+
+    def test_cursor_keeps_sub_millisecond_ties_ascending(self):
+        from testimonials.models import Testimonial
+
+        base = timezone.now().replace(microsecond=500000)
+        rows = Testimonial.objects.bulk_create(Testimonial(author_name=f"T{n}", content="Good") for n in range(25))
+        for n, row in enumerate(rows):
+            Testimonial.objects.filter(pk=row.pk).update(created_at=base + timedelta(microseconds=n // 3))
+        expected = list(Testimonial.objects.order_by("created_at", "pk").values_list("pk", flat=True))
+        self.assertEqual(self.walk("/api/testimonials/?page_size=10&ordering=created_at"), expected)
+
+    def assertPaginatesLikeList(self, url):
+        expected = [row["id"] for row in self.client.get(url).json()]
+        self.assertEqual(self.walk(f"{url}{'&' if '?' in url else '?'}page_size=2"), expected)
+        return expected
+
+    def test_foreign_key_ordering_follows_the_related_model(self):
+        services = Page.objects.create(title="Services", slug="services")
+        about = Page.objects.create(title="About", slug="about")
+        for page in (services, about):
+            PageSection.objects.bulk_create(PageSection(page=page, identifier=f"s{n}", order=n) for n in range(3))
+        # Meta.ordering ["page", ...] sorts by Page.title, not page_id.
+        self.assertEqual(self.assertPaginatesLikeList("/api/sections/"), [4, 5, 6, 1, 2, 3])
+        self.assertEqual(self.assertPaginatesLikeList("/api/sections/?ordering=-page"), [1, 2, 3, 4, 5, 6])
+
+    def test_nullable_foreign_key_ordering(self):
+        from projects.models import ProjectCategory
+
+        categories = ProjectCategory.objects.bulk_create(
+            [ProjectCategory(name="Water", slug="water", order=1), ProjectCategory(name="Energy", slug="energy", order=1)]
+        )
+        Project.objects.bulk_create(
+            Project(title=f"P{n}", slug=f"p{n}", category=None if n % 3 == 0 else categories[n % 2]) for n in range(9)
+        )
+        factory = APIRequestFactory()
+        for ordering in (["category"], ["-category"], ["-category", "title"]):
+            queryset = Project.objects.order_by(*ordering)
+            expected, pks, cursor = list(queryset.values_list("pk", flat=True)), [], ""
+            while cursor is not None:
+                paginator = KeysetPagination()
+                request = Request(factory.get("/api/projects/", {"page_size": 2, **({"cursor": cursor} if cursor else {})}))
+                pks += [project.pk for project in paginator.paginate_queryset(queryset, request)]
+                next_link = paginator.get_next_link()
+                cursor = next_link and QueryDict(next_link.partition("?")[2])["cursor"]
+            self.assertEqual(pks, expected, ordering)
+
+class CompressionTests(TestCase):
+    def setUp(self):
+        cache.response_cache().clear()
+        NavItem.objects.bulk_create(NavItem(label=f"Item {n}", href=f"/items/{n}") for n in range(40))
+
+    def test_negotiates_encoding(self):
+        identity = self.client.get("/api/nav-items/")
+        self.assertNotIn("Content-Encoding", identity)
+        self.assertIn("Accept-Encoding", identity["Vary"])
+        etag = identity["ETag"]
+        self.assertTrue(etag.startswith('"'))
+
+        response = self.client.get("/api/nav-items/", HTTP_ACCEPT_ENCODING="gzip, deflate")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(response["ETag"], f"W/{etag}")
+        self.assertEqual(json.loads(gzip.decompress(response.content)), identity.json())
+        self.assertEqual(
+            self.client.get("/api/nav-items/", HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=response["ETag"]).status_code,
+            304,
+        )
+        self.assertNotIn("Content-Encoding", self.client.get("/api/nav-items/", HTTP_ACCEPT_ENCODING="gzip;q=0, identity"))
+
+        brotli = mock.Mock(compress=lambda body, quality: b"br")
+        with mock.patch.object(compression, "brotli", brotli):
+            self.assertEqual(compression.choose_encoding("gzip, br"), "br")
+            self.assertEqual(compression.choose_encoding("gzip, br;q=0.5"), "gzip")
+            response = self.client.get("/api/nav-items/?ordering=label", HTTP_ACCEPT_ENCODING="br, gzip")
+        self.assertEqual((response["Content-Encoding"], response.content), ("br", b"br"))
+        with mock.patch.object(compression, "brotli", None):
+            self.assertIsNone(compression.choose_encoding("br"))  # brotli is optional
+
+    def test_html_is_not_compressed(self):
+        response = self.client.get("/admin/login/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertGreater(len(response.content), compression.get_config()["MIN_SIZE"])
+        self.assertContains(response, "csrfmiddlewaretoken")
+        self.assertNotIn("Content-Encoding", response)
+
+
+class SnapshotTests(TestCase):
+    def setUp(self):
+        cache.response_cache().clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings = override_settings(API_SNAPSHOT={"ROOT": directory.name})
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.page = Page.objects.create(title="About", slug="about")
+
+    def test_save_invalidates_exported_snapshot(self):
+        release = snapshot.export()
+        self.assertIsNotNone(release)
+        self.assertTrue(snapshot.is_current())
+        with open(os.path.join(snapshot.current_link(), snapshot.file_name("/api/pages/about/"))) as fh:
+            self.assertEqual(json.load(fh)["title"], "About")
+
+        self.page.title = "About us"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.page.save()
+        self.assertFalse(os.path.lexists(snapshot.current_link()))
+        self.assertFalse(snapshot.is_current())
+
+    def test_write_committing_during_publish_withdraws_the_release(self):
+        publish = snapshot.publish
+
+        def publish_after_write(release):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.page.save()
+            publish(release)
+
+        with mock.patch.object(snapshot, "publish", publish_after_write):
+            release = snapshot.export()
+        self.assertIsNone(release)
+        self.assertFalse(os.path.lexists(snapshot.current_link()))
+        self.assertIsNotNone(snapshot.export())
+
+
+class FailingEmailBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        raise ConnectionRefusedError("SMTP server unavailable")
+
+
+@override_settings(EMAIL_OUTBOX={"MAX_ATTEMPTS": 3, "BACKOFF_BASE": 30, "BACKOFF_MAX": 3600, "LEASE": 300})
+class OutboxTests(TestCase):
+    def setUp(self):
+        self.job = outbox.enqueue("New contact", "Hello")
+        self.start = timezone.now()
+
+    def at(self, seconds):
+        """Freeze the clock ``seconds`` after ``setUp``."""
+        return mock.patch.object(outbox.timezone, "now", return_value=self.start + timedelta(seconds=seconds))
+
+    def process(self, seconds):
+        with self.at(seconds):
+            return outbox.process_batch()
+
+    def test_delivers_to_the_fallback_recipient(self):
+        self.assertEqual(self.process(0), (1, 0))
+        self.assertEqual(self.process(0), (0, 0))
+        self.assertEqual([message.to for message in mail.outbox], [[settings.DEFAULT_FROM_EMAIL]])
+        self.job.refresh_from_db()
+        self.assertEqual((self.job.status, self.job.attempts), (OutboundEmail.SENT, 1))
+
+    @override_settings(EMAIL_BACKEND="cms.tests.FailingEmailBackend")
+    def test_retries_with_backoff_then_gives_up(self):
+        with self.assertLogs("cms.outbox", "WARNING"):
+            self.assertEqual(self.process(0), (0, 1))
+        self.job.refresh_from_db()
+        self.assertEqual((self.job.status, self.job.attempts), (OutboundEmail.PENDING, 1))
+        self.assertEqual(self.job.next_attempt_at, self.start + timedelta(seconds=30))
+        self.assertIn("ConnectionRefusedError", self.job.last_error)
+
+        self.assertEqual(self.process(29), (0, 0))
+        with self.assertLogs("cms.outbox", "WARNING"):
+            self.assertEqual(self.process(30), (0, 1))
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.next_attempt_at, self.start + timedelta(seconds=30 + 60))
+
+        with self.assertLogs("cms.outbox", "ERROR"):
+            self.assertEqual(self.process(90), (0, 1))
+        self.job.refresh_from_db()
+        self.assertEqual((self.job.status, self.job.attempts), (OutboundEmail.DEAD, 3))
+        self.assertEqual(self.process(10**6), (0, 0))
+        self.assertEqual(outbox.backoff(20), timedelta(seconds=3600))
+
+    def test_expired_lease_is_claimed_again(self):
+        with self.at(0):
+            self.assertEqual(outbox.claim_batch(), [self.job])
+            self.assertEqual(outbox.claim_batch(), [])
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, OutboundEmail.SENDING)
+
+        # The worker holding the lease died; nobody else may take it until it expires.
+        self.assertEqual(self.process(299), (0, 0))
+        self.assertEqual(self.process(300), (1, 0))
+        self.assertEqual(len(mail.outbox), 1)
+
+
+class RendererTests(TestCase):
+    def assertRendersLikeDRF(self, data):
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_matches_json_renderer(self):
+        moment = datetime(2026, 10, 18, 13, 15, 0, 123456)
+        self.assertRendersLikeDRF(ReturnList([
+            ReturnDict({
+                "price": Decimal("12.50"),
+                "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+                "created_at": timezone.make_aware(moment, dt_timezone.utc),
+                "local": timezone.make_aware(moment, dt_timezone(timedelta(hours=5))),
+                "naive": moment,
+                "day": date(2026, 10, 18),
+                "opens": time(9, 30, 15, 500),
+                "duration": timedelta(minutes=90),
+                "label": gettext_lazy("Home"),
+                "nested": {1: ["ünïcödé", "line\u2028break\u2029", None, 1.5, True]},
+            }, serializer=None),
+        ], serializer=None))
+        self.assertRendersLikeDRF({"big": 2 ** 70})  # beyond orjson, rendered by DRF
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+    def test_matches_json_renderer_for_api_responses(self):
+        Page.objects.create(title="Über uns", slug="about", content={"blocks": [{"text": "Since 1990\u2028"}]})
+        for url in ("/api/pages/", "/api/pages/about/", "/api/search/?q=uber"):
+            response = APIClient().get(url)
+            # Search scores are tiny floats, whose exponents orjson writes without padding.
+            self.assertEqual(json.loads(response.content), json.loads(JSONRenderer().render(response.data)), url)
+        response = APIClient().get("/api/pages/about/")
+        self.assertEqual(response.content, JSONRenderer().render(response.data))
+        with self.assertRaises(ValueError):  # like DRF: aware times are not representable
+            FastJSONRenderer().render({"opens": time(9, tzinfo=dt_timezone.utc)})
+
+    def test_parser(self):
+        parsed = FastJSONParser().parse(io.BytesIO('{"name": "Łódź", "ids": [1, 2]}'.encode()))
+        self.assertEqual(parsed, {"name": "Łódź", "ids": [1, 2]})
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"value": NaN}'))
+
+
+class InstrumentationTests(TestCase):
+    def setUp(self):
+        instrumentation.reset()
+        cache.response_cache().clear()  # cached responses run no queries
+
+    def test_server_timing_and_stats(self):
+        Page.objects.create(title="About", slug="about")
+        response = self.client.get("/api/pages/")
+        self.assertRegex(response["Server-Timing"], r'^db;dur=[\d.]+;desc="\d+ queries", view;dur=')
+
+        client = APIClient()
+        self.assertIn(client.get("/api/stats/").status_code, (401, 403))
+        client.force_authenticate(get_user_model().objects.create_user("staff", is_staff=True))
+        stats = client.get("/api/stats/").json()
+        pages = stats["views"]["GET page-list"]
+        self.assertEqual(pages["requests"], 1)
+        self.assertGreater(pages["queries"]["max"], 0)
+        self.assertEqual(sum(pages["histogram"].values()), 1)
+        self.assertEqual(client.delete("/api/stats/").status_code, 204)
+
+    @override_settings(API_INSTRUMENTATION={"SLOW_QUERY_MS": 0})
+    def test_slow_queries_are_logged_with_origin(self):
+        with self.assertLogs("config.instrumentation", "WARNING") as logs:
+            self.client.get("/api/pages/")
+        self.assertRegex(logs.output[0], r"from \w+/[\w/]+\.py:\d+ in ")
+        self.assertTrue(instrumentation.snapshot()["slow_queries"][0]["origin"])
+
+    @skipUnless(metrics.prometheus_client, "prometheus_client is not installed")
+    def test_metrics_endpoint(self):
+        self.client.get("/api/pages/")
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        body = response.content.decode()
+        self.assertIn('http_requests_total{method="GET",route="page-list",status="200"}', body)
+        self.assertIn('email_outbox_messages{status="pending"} 0.0', body)
+        with override_settings(API_METRICS={"TOKEN": "secret"}):
+            self.assertEqual(self.client.get("/metrics").status_code, 401)
+            self.assertEqual(self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer secret").status_code, 200)
+
+
+class StatelessRouteTests(TestCase):
+    def test_public_reads_skip_the_stateful_middleware(self):
+        response = self.client.get("/api/pages/", HTTP_AUTHORIZATION="Bearer not-a-token")
+        self.assertEqual(response.status_code, 200)  # authentication is lazy: public reads ignore the token
+        self.assertFalse(hasattr(response.wsgi_request, "session"))
+        self.assertFalse(hasattr(response.wsgi_request, "user"))
+        self.assertEqual(self.client.get("/api/stats/", HTTP_AUTHORIZATION="Bearer not-a-token").status_code, 401)
+
+    def test_admin_and_writes_keep_the_full_stack(self):
+        client = Client(enforce_csrf_checks=True)
+        response = client.get("/admin/login/")
+        self.assertTrue(hasattr(response.wsgi_request, "session"))
+        self.assertTrue(hasattr(response.wsgi_request, "user"))
+        self.assertEqual(client.post("/admin/login/", {"username": "x", "password": "y"}).status_code, 403)
+        response = client.post("/api/pages/", {"title": "About"})
+        self.assertIn(response.status_code, (401, 403))
+        self.assertTrue(hasattr(response.wsgi_request, "session"))
+
+
+class JWTCacheTests(TestCase):
+    def setUp(self):
+        authentication.clear()
+
+    def test_verified_tokens_skip_the_user_query_until_the_user_changes(self):
+        from rest_framework_simplejwt.tokens import AccessToken
+
+        user = get_user_model().objects.create_user("editor", is_staff=True)
+        cache.get_versions([type(user)])
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(user)}"}
+        # The user model's version counter, then the user row.
+        with self.assertNumQueries(2):
+            self.assertEqual(self.client.get("/api/stats/", **headers).status_code, 200)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get("/api/stats/", **headers).status_code, 200)
+
+        user.is_staff = False
+        with self.captureOnCommitCallbacks(execute=True):
+            user.save()
+        self.assertEqual(self.client.get("/api/stats/", **headers).status_code, 403)
+        with self.captureOnCommitCallbacks(execute=True):
+            user.delete()
+        self.assertEqual(self.client.get("/api/stats/", **headers).status_code, 401)
+
+    def test_schema_declares_the_jwt_scheme(self):
+        schema = self.client.get("/api/schema/", HTTP_ACCEPT="application/vnd.oai.openapi+json").json()
+        self.assertEqual(schema["components"]["securitySchemes"]["jwtAuth"]["scheme"], "bearer")
+        self.assertIn({"jwtAuth": []}, schema["paths"]["/api/nav-items/"]["get"]["security"])
+
+
+@skipUnless(connection.vendor == "sqlite", "asserts on SQLite query plans")
+class IndexUsageTests(TestCase):
+    """The frontend's ``?is_active=true[&ordering=...]`` lists must be index scans."""
+
+    def active_indexes(self):
+        for model in apps.get_models():
+            for index in model._meta.indexes:
+                if index.name.endswith("_active_idx"):
+                    yield model, index
+
+    def assertUsesIndex(self, queryset, index_name, sorted_by_index=True):
+        plan = queryset.explain()
+        self.assertIn(f"USING INDEX {index_name}", plan)
+        if sorted_by_index:
+            self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_active_lists_use_partial_indexes(self):
+        indexes = list(self.active_indexes())
+        self.assertGreaterEqual(len(indexes), 20)
+        for model, index in indexes:
+            with self.subTest(model=model._meta.label):
+                first = index.fields[0].lstrip("-")
+                # Ordering by a foreign key sorts by the related model's ordering.
+                sorted_by_index = not model._meta.get_field(first).is_relation
+                self.assertUsesIndex(model.objects.filter(is_active=True), index.name, sorted_by_index)
+                self.assertUsesIndex(
+                    model.objects.filter(is_active=True).order_by(index.fields[0]), index.name, sorted_by_index
+                )
+
+    def test_featured_and_submission_indexes(self):
+        from projects.models import Project
+        from sectors.models import Sector
+        from .models import ContactSubmission
+
+        self.assertUsesIndex(Project.objects.filter(is_featured=True, is_active=True), "projects_project_featured_idx")
+        self.assertUsesIndex(Sector.objects.filter(is_featured=True, is_active=True), "sectors_sector_featured_idx")
+        self.assertUsesIndex(ContactSubmission.objects.all(), "cms_contact_submitted_idx")
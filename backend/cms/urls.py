@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import (
@@ -18,6 +19,11 @@ from .views import (
     CoreValueViewSet,
     LeadershipViewSet,
     TimelineEventViewSet,
+    AsyncBundleView,
+    BatchView,
+    BundleView,
+    SearchView,
+    StatsView,
 )
 
 router = DefaultRouter()
@@ -40,6 +46,10 @@ router.register(r'leadership', LeadershipViewSet)
 router.register(r'timeline-events', TimelineEventViewSet)
 
 urlpatterns = [
+    path('bundle/<slug:name>/', (AsyncBundleView if settings.ASYNC_VIEWS else BundleView).as_view(), name='bundle'),
+    path('batch/', BatchView.as_view(), name='batch'),
+    path('search/', SearchView.as_view(), name='search'),
+    path('stats/', StatsView.as_view(), name='stats'),
     path('', include(router.urls)),
 ]
 
@@ -1,6 +1,23 @@
-from rest_framework import viewsets, permissions
-from django.core.mail import send_mail
-from django.conf import settings
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import permissions
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from django.apps import apps
+from django.http import HttpResponse
+from django.views import View
+from django.db import transaction
+from django.urls import reverse
+from config import instrumentation
+from config.cache import acached_data, amemoize, cached_response, memoize
+from config.conditional import acompute_validators, aconditional_response, compute_validators, conditional_response
+from config.pagination import KeysetPagination
+from config.renderers import FastJSONRenderer
+from config.stateless import LazyAuthenticationMixin
+from config.viewsets import ContentViewSet
+from . import batch, outbox, search
+from .bundles import BUNDLES, abuild_bundle, build_bundle, bundle_models, bundle_querysets
 from .models import SiteSettings, NavItem, FooterLink, SEO, Hero, Page, PageSection, ContactSubmission, ServiceProcessStep, WhyChooseItem, OfficeHour, SocialLink, QuickStat, Partner, CoreValue, Leadership, TimelineEvent
 from .serializers import (
     SiteSettingsSerializer,
@@ -30,13 +47,13 @@ class ReadOnlyOrAdmin(permissions.BasePermission):
         return request.user and request.user.is_staff
 
 
-class SiteSettingsViewSet(viewsets.ModelViewSet):
+class SiteSettingsViewSet(ContentViewSet):
     queryset = SiteSettings.objects.all()
     serializer_class = SiteSettingsSerializer
     permission_classes = [ReadOnlyOrAdmin]
 
 
-class NavItemViewSet(viewsets.ModelViewSet):
+class NavItemViewSet(ContentViewSet):
     queryset = NavItem.objects.all()
     serializer_class = NavItemSerializer
     permission_classes = [ReadOnlyOrAdmin]
@@ -44,7 +61,7 @@ class NavItemViewSet(viewsets.ModelViewSet):
     ordering_fields = ["order"]
 
 
-class FooterLinkViewSet(viewsets.ModelViewSet):
+class FooterLinkViewSet(ContentViewSet):
     queryset = FooterLink.objects.all()
     serializer_class = FooterLinkSerializer
     permission_classes = [ReadOnlyOrAdmin]
@@ -52,28 +69,29 @@ class FooterLinkViewSet(viewsets.ModelViewSet):
     ordering_fields = ["group", "order"]
 
 
-class SEOViewSet(viewsets.ModelViewSet):
+class SEOViewSet(ContentViewSet):
     queryset = SEO.objects.all()
     serializer_class = SEOSerializer
     permission_classes = [ReadOnlyOrAdmin]
 
 
-class HeroViewSet(viewsets.ModelViewSet):
+class HeroViewSet(ContentViewSet):
     queryset = Hero.objects.all()
     serializer_class = HeroSerializer
     permission_classes = [ReadOnlyOrAdmin]
     filterset_fields = ["is_active"]
 
 
-class PageViewSet(viewsets.ModelViewSet):
-    queryset = Page.objects.all()
+class PageViewSet(ContentViewSet):
+    queryset = Page.objects.prefetch_related("sections")
     serializer_class = PageSerializer
     permission_classes = [ReadOnlyOrAdmin]
+    cache_dependencies = [PageSection]
     filterset_fields = ["is_active"]
     lookup_field = "slug"
 
 
-class PageSectionViewSet(viewsets.ModelViewSet):
+class PageSectionViewSet(ContentViewSet):
     queryset = PageSection.objects.all()
     serializer_class = PageSectionSerializer
     permission_classes = [ReadOnlyOrAdmin]
@@ -81,49 +99,40 @@ class PageSectionViewSet(viewsets.ModelViewSet):
     ordering_fields = ["page", "order"]
 
 
-class ContactSubmissionViewSet(viewsets.ModelViewSet):
+class ContactSubmissionPagination(KeysetPagination):
+    page_size = 50
+
+
+class ContactSubmissionViewSet(ContentViewSet):
     queryset = ContactSubmission.objects.all()
     serializer_class = ContactSubmissionSerializer
     permission_classes = [permissions.AllowAny]  # Allow public submissions
     ordering_fields = ["-submitted_at"]
+    pagination_class = ContactSubmissionPagination
+    cache_responses = False
+    bulk_writes = False  # creating one queues a notification email (perform_create)
 
+    @transaction.atomic
     def perform_create(self, serializer):
         instance = serializer.save()
-        # Determine destination from SiteSettings (fallback to DEFAULT_FROM_EMAIL)
-        try:
-            site_settings = SiteSettings.objects.first()
-        except Exception:
-            site_settings = None
-
-        destination_email = (site_settings.contact_email if site_settings and site_settings.contact_email else None) or settings.DEFAULT_FROM_EMAIL
-
-        # Send email notification to admin-configured address
-        try:
-            subject = f"New Contact Submission: {instance.name}"
-            message = (
-                "New contact form submission:\n\n"
-                f"Name: {instance.name}\n"
-                f"Email: {instance.email}\n"
-                f"Phone: {instance.phone}\n"
-                f"Company: {instance.company}\n"
-                f"Service: {instance.service}\n"
-                f"Message: {instance.message}\n"
-                f"Newsletter: {instance.newsletter}\n\n"
-                f"Submitted at: {instance.submitted_at}"
-            )
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[destination_email],
-                fail_silently=False,
-            )
-        except Exception as e:
-            # Log to console in dev; in production use proper logging
-            print(f"Failed to send email: {e}")
-
-
-class ServiceProcessStepViewSet(viewsets.ModelViewSet):
+        # Queue the notification for the process_outbox worker; it is delivered
+        # to SiteSettings.contact_email (or DEFAULT_FROM_EMAIL) off the request.
+        subject = f"New Contact Submission: {instance.name}"
+        message = (
+            "New contact form submission:\n\n"
+            f"Name: {instance.name}\n"
+            f"Email: {instance.email}\n"
+            f"Phone: {instance.phone}\n"
+            f"Company: {instance.company}\n"
+            f"Service: {instance.service}\n"
+            f"Message: {instance.message}\n"
+            f"Newsletter: {instance.newsletter}\n\n"
+            f"Submitted at: {instance.submitted_at}"
+        )
+        outbox.enqueue(subject, message)
+
+
+class ServiceProcessStepViewSet(ContentViewSet):
     queryset = ServiceProcessStep.objects.all()
     serializer_class = ServiceProcessStepSerializer
     permission_classes = [ReadOnlyOrAdmin]
@@ -131,7 +140,7 @@ class ServiceProcessStepViewSet(viewsets.ModelViewSet):
     ordering_fields = ["step_number"]
 
 
-class WhyChooseItemViewSet(viewsets.ModelViewSet):
+class WhyChooseItemViewSet(ContentViewSet):
     queryset = WhyChooseItem.objects.all()
     serializer_class = WhyChooseItemSerializer
     permission_classes = [ReadOnlyOrAdmin]
@@ -139,7 +148,7 @@ class WhyChooseItemViewSet(viewsets.ModelViewSet):
     ordering_fields = ["order"]
 
 
-class OfficeHourViewSet(viewsets.ModelViewSet):
+class OfficeHourViewSet(ContentViewSet):
     queryset = OfficeHour.objects.all()
     serializer_class = OfficeHourSerializer
     permission_classes = [ReadOnlyOrAdmin]
@@ -147,7 +156,7 @@ class OfficeHourViewSet(viewsets.ModelViewSet):
     ordering_fields = ["order"]
 
 
-class SocialLinkViewSet(viewsets.ModelViewSet):
+class SocialLinkViewSet(ContentViewSet):
     queryset = SocialLink.objects.all()
     serializer_class = SocialLinkSerializer
     permission_classes = [ReadOnlyOrAdmin]
@@ -155,7 +164,7 @@ class SocialLinkViewSet(viewsets.ModelViewSet):
     ordering_fields = ["order"]
 
 
-class QuickStatViewSet(viewsets.ModelViewSet):
+class QuickStatViewSet(ContentViewSet):
     queryset = QuickStat.objects.all()
     serializer_class = QuickStatSerializer
     permission_classes = [ReadOnlyOrAdmin]
@@ -163,7 +172,7 @@ class QuickStatViewSet(viewsets.ModelViewSet):
     ordering_fields = ["order"]
 
 
-class PartnerViewSet(viewsets.ModelViewSet):
+class PartnerViewSet(ContentViewSet):
     queryset = Partner.objects.all()
     serializer_class = PartnerSerializer
     permission_classes = [ReadOnlyOrAdmin]
@@ -171,7 +180,7 @@ class PartnerViewSet(viewsets.ModelViewSet):
     ordering_fields = ["order"]
 
 
-class CoreValueViewSet(viewsets.ModelViewSet):
+class CoreValueViewSet(ContentViewSet):
     queryset = CoreValue.objects.all()
     serializer_class = CoreValueSerializer
     permission_classes = [ReadOnlyOrAdmin]
@@ -179,7 +188,7 @@ class CoreValueViewSet(viewsets.ModelViewSet):
     ordering_fields = ["order"]
 
 
-class LeadershipViewSet(viewsets.ModelViewSet):
+class LeadershipViewSet(ContentViewSet):
     queryset = Leadership.objects.all()
     serializer_class = LeadershipSerializer
     permission_classes = [ReadOnlyOrAdmin]
@@ -187,9 +196,173 @@ class LeadershipViewSet(viewsets.ModelViewSet):
     ordering_fields = ["order"]
 
 
-class TimelineEventViewSet(viewsets.ModelViewSet):
+class TimelineEventViewSet(ContentViewSet):
     queryset = TimelineEvent.objects.all()
     serializer_class = TimelineEventSerializer
     permission_classes = [ReadOnlyOrAdmin]
     filterset_fields = ["is_active"]
-    ordering_fields = ["order", "year"]
\ No newline at end of file
+    ordering_fields = ["order", "year"]
+
+
+class BundleView(LazyAuthenticationMixin, APIView):
+    """Read-only aggregate of all active content a page needs, in one round-trip."""
+
+    permission_classes = [permissions.AllowAny]
+
+    @classmethod
+    def snapshot_targets(cls):
+        return [(reverse("bundle", kwargs={"name": name}), bundle_models(name)) for name in BUNDLES]
+
+    @extend_schema(responses=OpenApiTypes.OBJECT)
+    def get(self, request, name):
+        if name not in BUNDLES:
+            raise NotFound(f"Unknown bundle '{name}'.")
+        models = bundle_models(name)
+        validators = memoize(
+            request,
+            "validators:bundle",
+            models,
+            lambda: compute_validators(request, "bundle", bundle_querysets(name), extra=name)[:2],
+            extra=name,
+        )
+        return conditional_response(
+            request,
+            lambda: cached_response(
+                request,
+                "bundle",
+                models,
+                lambda: Response(build_bundle(name, {"request": request})),
+                extra=name,
+            ),
+            validators,
+        )
+
+
+class AsyncBundleView(View):
+    """``BundleView`` as a native async view, routed in ASGI mode (``settings.ASYNC_VIEWS``).
+
+    Validators, cached bodies and rows are read through the async cache and ORM
+    APIs, so one process keeps serving other connections while a bundle is
+    built. Responses, validators and cache entries match ``BundleView``'s JSON.
+    """
+
+    renderer = FastJSONRenderer()
+
+    @classmethod
+    def snapshot_targets(cls):
+        return BundleView.snapshot_targets()
+
+    def json(self, data, status=200):
+        return HttpResponse(self.renderer.render(data), status=status, content_type="application/json")
+
+    async def get(self, request, name):
+        if name not in BUNDLES:
+            return self.json({"detail": f"Unknown bundle '{name}'."}, status=404)
+        request.accepted_media_type = self.renderer.media_type
+        models = bundle_models(name)
+
+        async def validators():
+            return (await acompute_validators(request, "bundle", bundle_querysets(name), extra=name))[:2]
+
+        async def respond():
+            data, x_cache = await acached_data(
+                request, "bundle", models, lambda: abuild_bundle(name, {"request": request}), extra=name
+            )
+            response = self.json(data)
+            if x_cache is not None:
+                response["X-Cache"] = x_cache
+            return response
+
+        return await aconditional_response(
+            request, respond, await amemoize(request, "validators:bundle", models, validators, extra=name)
+        )
+
+
+class SearchView(LazyAuthenticationMixin, APIView):
+    """Ranked full-text search across every indexed content type.
+
+    ``?q=`` is required; ``?type=project,service`` restricts the result types
+    and ``?limit=`` caps the hits (default 20, max 50).
+    """
+
+    permission_classes = [permissions.AllowAny]
+    default_limit = 20
+    max_limit = 50
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params.get("limit", self.default_limit))
+        except ValueError:
+            limit = self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+    @extend_schema(responses=OpenApiTypes.OBJECT)
+    def get(self, request):
+        query = request.query_params.get("q", "").strip()
+        kinds = {kind for kind in request.query_params.get("type", "").split(",") if kind}
+        known = {document.kind for document in search.DOCUMENTS.values()}
+        if kinds - known:
+            raise ValidationError({"type": f"Unknown types: {', '.join(sorted(kinds - known))}."})
+        limit = self.get_limit(request)
+        if not query:
+            return Response({"query": query, "results": []})
+        models = [apps.get_model(model_label) for model_label in search.DOCUMENTS]
+        return cached_response(
+            request,
+            "search",
+            models,
+            lambda: Response({"query": query, "results": search.search(query, kinds, limit)}),
+        )
+
+
+class BatchView(LazyAuthenticationMixin, APIView):
+    """Several API GETs in one round-trip.
+
+    ``GET ?url=<encoded /api/... URL>&url=...`` or ``POST {"requests": [...]}``
+    with up to ``max_requests`` URLs. Each runs through its view in this
+    process, so the sub-requests share the database connection and the
+    response cache; a failing one does not fail the batch. Responds with
+    ``{"responses": [{"url", "status", "body"}, ...]}`` in request order.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    max_requests = 20
+
+    @extend_schema(
+        parameters=[OpenApiParameter("url", OpenApiTypes.STR, many=True, required=True)],
+        responses=OpenApiTypes.OBJECT,
+    )
+    def get(self, request):
+        return self.run(request, request.query_params.getlist("url"))
+
+    @extend_schema(request=OpenApiTypes.OBJECT, responses=OpenApiTypes.OBJECT)
+    def post(self, request):
+        urls = request.data.get("requests") if isinstance(request.data, dict) else None
+        if not isinstance(urls, list) or not all(isinstance(url, str) for url in urls):
+            raise ValidationError({"requests": "Expected a list of URLs."})
+        return self.run(request, urls)
+
+    def run(self, request, urls):
+        if not urls:
+            raise ValidationError({"requests": "Give at least one URL."})
+        if len(urls) > self.max_requests:
+            raise ValidationError({"requests": f"At most {self.max_requests} URLs per batch."})
+        return Response({"responses": [batch.execute(request._request, url, excluded={"batch"}) for url in urls]})
+
+
+class StatsView(APIView):
+    """Per-view request/SQL timings and recent slow queries of this worker process.
+
+    ``DELETE`` clears the window, e.g. before a load test.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+
+    @extend_schema(responses=OpenApiTypes.OBJECT)
+    def get(self, request):
+        return Response(instrumentation.snapshot())
+
+    @extend_schema(responses={204: None})
+    def delete(self, request):
+        instrumentation.reset()
+        return Response(status=204)
@@ -0,0 +1,106 @@
+"""
+JWT authentication with a per-worker cache of verified tokens.
+
+simplejwt's ``JWTAuthentication`` checks the signature and loads the user row
+on every request, so an admin bulk-editing content pays a user query per
+call. ``CachedJWTAuthentication`` keeps the user of each verified token in a
+bounded LRU until the token expires (or ``TTL`` seconds pass, whichever is
+sooner). Entries carry the user model's cache version (see
+``config/cache.py``): saving or deleting any user, e.g. revoking staff or
+changing a password, bumps it, and every worker then verifies tokens afresh.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from . import cache, metrics
+
+DEFAULTS = {
+    "ENABLED": True,
+    "MAX_ENTRIES": 1024,
+    "TTL": 300,
+}
+
+stats = {"hits": 0, "misses": 0}
+
+_entries = OrderedDict()  # raw token -> (expires_at, user version, user, validated token)
+_lock = threading.Lock()
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, "API_JWT_CACHE", {})}
+
+
+def clear():
+    with _lock:
+        _entries.clear()
+
+
+def _get(raw_token, version):
+    with _lock:
+        entry = _entries.get(raw_token)
+        if entry is None:
+            return None
+        expires_at, entry_version, user, validated_token = entry
+        if expires_at <= time.time() or entry_version != version:
+            del _entries[raw_token]
+            return None
+        _entries.move_to_end(raw_token)
+    return user, validated_token
+
+
+def _put(raw_token, entry, max_entries):
+    with _lock:
+        _entries[raw_token] = entry
+        _entries.move_to_end(raw_token)
+        while len(_entries) > max_entries:
+            _entries.popitem(last=False)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def authenticate(self, request):
+        config = get_config()
+        if not config["ENABLED"]:
+            return super().authenticate(request)
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        [version] = cache.get_versions([self.user_model], request)
+        cached = _get(raw_token, version)
+        metrics.cache_lookup("jwt", hit=cached is not None)
+        if cached is not None:
+            stats["hits"] += 1
+            user, validated_token = cached
+            # Views may annotate request.user; keep the cached instance pristine.
+            return copy.copy(user), validated_token
+        stats["misses"] += 1
+
+        validated_token = self.get_validated_token(raw_token)
+        user = self.get_user(validated_token)
+        expires_at = min(validated_token.get("exp", 0), time.time() + config["TTL"])
+        _put(raw_token, (expires_at, version, copy.copy(user), validated_token), config["MAX_ENTRIES"])
+        return user, validated_token
+
+
+class CachedJWTScheme(SimpleJWTScheme):
+    """Document ``CachedJWTAuthentication`` as the ``jwtAuth`` scheme (drf-spectacular)."""
+
+    target_class = "config.authentication.CachedJWTAuthentication"
+
+
+def connect_signals():
+    user_model = get_user_model()
+    post_save.connect(cache.invalidate, sender=user_model, dispatch_uid="jwt-cache-save")
+    post_delete.connect(cache.invalidate, sender=user_model, dispatch_uid="jwt-cache-delete")
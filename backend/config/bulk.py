@@ -0,0 +1,83 @@
+"""
+Deferred row signals for bulk writes.
+
+``bulk_create`` and ``bulk_update`` send no signals, and a queryset
+``delete()`` sends one per row. The ``post_save``/``post_delete`` receivers
+that keep the response cache, search index, API snapshot and image
+derivatives in sync are therefore wrapped with ``per_row``: inside
+``deferred()`` they only record the row, and when the block ends
+``bulk_changed`` is sent once per model with every saved and deleted row,
+so each of them does its work once. The response cache, for one, is
+invalidated a single time, when the transaction commits. See
+``BulkWriteMixin`` in ``config/viewsets.py``.
+"""
+
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db.models.signals import post_delete
+from django.dispatch import Signal
+
+# Sent with ``saved`` (instances) and ``deleted`` (primary keys) per model.
+bulk_changed = Signal()
+
+_changes = ContextVar("bulk_changes", default=None)
+
+
+class Changes:
+    def __init__(self):
+        self.models = {}
+
+    def _entry(self, model):
+        return self.models.setdefault(model, ({}, {}))
+
+    def saved(self, model, instances):
+        saved, deleted = self._entry(model)
+        for instance in instances:
+            saved[instance.pk] = instance
+
+    def deleted(self, model, pks):
+        saved, deleted = self._entry(model)
+        for pk in pks:
+            saved.pop(pk, None)
+            deleted[pk] = None
+
+    def updated(self, model):
+        """Rows of ``model`` changed through ``QuerySet.update()``.
+
+        Model-level receivers (cache, snapshot) react; per-row ones get no rows.
+        """
+        self._entry(model)
+
+    def send(self):
+        for model, (saved, deleted) in self.models.items():
+            bulk_changed.send(sender=model, saved=list(saved.values()), deleted=list(deleted))
+
+
+@contextmanager
+def deferred():
+    """Collect row changes and send ``bulk_changed`` for them on success."""
+    changes = Changes()
+    token = _changes.set(changes)
+    try:
+        yield changes
+    finally:
+        _changes.reset(token)
+    changes.send()
+
+
+def per_row(receiver):
+    """A ``post_save``/``post_delete`` receiver that defers to ``bulk_changed`` inside ``deferred()``."""
+
+    @functools.wraps(receiver)
+    def wrapper(sender, **kwargs):
+        changes = _changes.get()
+        if changes is None:
+            return receiver(sender, **kwargs)
+        if kwargs["signal"] is post_delete:
+            changes.deleted(sender, [kwargs["instance"].pk])
+        else:
+            changes.saved(sender, [kwargs["instance"]])
+
+    return wrapper
@@ -0,0 +1,234 @@
+"""
+Versioned response cache for read-only API endpoints.
+
+Responses are stored under keys that embed a version counter for every model
+they were built from. Saving or deleting a row bumps its model's counter
+once the transaction commits, so stale entries are never read again and
+simply age out of the cache.
+
+Responses live in a regular Django cache alias (see ``CACHES`` in settings),
+so any backend works; local memory keeps the hot path a dict lookup per
+worker. The version counters are ``CacheVersion`` rows in the database,
+shared by every gunicorn worker: a bump is a single atomic ``UPDATE``, and
+one query reads the counters of all the models a response depends on.
+"""
+
+import hashlib
+import time
+
+from asgiref.sync import sync_to_async
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from rest_framework.response import Response
+
+from . import bulk, metrics
+
+DEFAULTS = {
+    "ENABLED": True,
+    "ALIAS": "api",
+    "TIMEOUT": None,  # None defers to the alias' own TIMEOUT
+}
+
+stats = {"hits": 0, "misses": 0}
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, "API_CACHE", {})}
+
+
+def response_cache():
+    return caches[get_config()["ALIAS"]]
+
+
+def _versions():
+    return apps.get_model("cms", "CacheVersion").objects
+
+
+def get_versions(models, request=None):
+    """Return the current version of each model, seeding missing counters.
+
+    With a ``request``, counters are read once per request and reused by
+    later calls (responses, image manifests, authentication).
+    """
+    labels = [model._meta.label_lower for model in models]
+    if request is not None:
+        request = getattr(request, "_request", request)  # one memo for DRF and Django requests
+        memo = request.__dict__.setdefault("_cache_versions", {})
+        unread = [label for label in labels if label not in memo]
+        if unread:
+            memo.update(zip(unread, get_versions([apps.get_model(label) for label in unread])))
+        return [memo[label] for label in labels]
+    versions = dict(_versions().filter(label__in=labels).values_list("label", "version"))
+    missing = [label for label in dict.fromkeys(labels) if label not in versions]
+    if missing:
+        # A fresh counter must never collide with an earlier one (say, before
+        # the table was reset), or entries cached under it would resurface.
+        seed = time.time_ns()
+        _versions().bulk_create(
+            [_versions().model(label=label, version=seed) for label in missing], ignore_conflicts=True
+        )
+        versions.update(_versions().filter(label__in=missing).values_list("label", "version"))
+    return [versions[label] for label in labels]
+
+
+def bump_version(model):
+    label = model._meta.label_lower
+    if not _versions().filter(label=label).update(version=F("version") + 1):
+        get_versions([model])
+        _versions().filter(label=label).update(version=F("version") + 1)
+
+
+def normalize_query(query_dict):
+    """Order-independent representation of a request's query string."""
+    return "&".join(
+        f"{name}={value}"
+        for name in sorted(query_dict)
+        for value in sorted(query_dict.getlist(name))
+    )
+
+
+def build_key(namespace, request, models, extra=""):
+    versions = get_versions(models, request)
+    # The host is part of the key because serialized file URLs are absolute.
+    raw = "|".join([namespace, extra, request.get_host(), normalize_query(request.GET), ",".join(map(str, versions))])
+    return f"response:{namespace}:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+
+def store(key, value):
+    timeout = get_config()["TIMEOUT"]
+    if timeout is None:
+        response_cache().set(key, value)
+    else:
+        response_cache().set(key, value, timeout)
+
+
+def lookup(namespace, request, models, extra=""):
+    """``(key, cached value or None)`` for a request."""
+    key = build_key(namespace, request, models, extra)
+    return key, response_cache().get(key)
+
+
+def memoize(request, namespace, models, compute, extra=""):
+    """Cache an arbitrary value derived from ``models`` for this request's query."""
+    if not get_config()["ENABLED"]:
+        return compute()
+    key = build_key(namespace, request, models, extra)
+    value = response_cache().get(key)
+    if value is None:
+        value = compute()
+        store(key, value)
+    return value
+
+
+# The async variants make one thread hop per lookup: Django's async cache API
+# would make one per key (and the version counters take several keys).
+async def amemoize(request, namespace, models, compute, extra=""):
+    """Async ``memoize``; ``compute`` is a coroutine function."""
+    if not get_config()["ENABLED"]:
+        return await compute()
+    key, value = await sync_to_async(lookup)(namespace, request, models, extra)
+    if value is None:
+        value = await compute()
+        await sync_to_async(store)(key, value)
+    return value
+
+
+def cached_response(request, namespace, models, compute, extra=""):
+    """Serve ``compute()``'s data from the cache, storing successful results."""
+    config = get_config()
+    if not config["ENABLED"] or request.method != "GET":
+        return compute()
+    key = build_key(namespace, request, models, extra)
+    data = response_cache().get(key)
+    if data is not None:
+        stats["hits"] += 1
+        metrics.cache_lookup("response", hit=True)
+        response = Response(data)
+        response["X-Cache"] = "HIT"
+        return response
+    stats["misses"] += 1
+    metrics.cache_lookup("response", hit=False)
+    response = compute()
+    if response.status_code == 200:
+        store(key, response.data)
+    response["X-Cache"] = "MISS"
+    return response
+
+
+async def acached_data(request, namespace, models, compute, extra=""):
+    """Async ``cached_response`` for plain Django views.
+
+    ``compute`` is a coroutine function returning the response data. Returns
+    ``(data, X-Cache value)``, the latter ``None`` when caching is off. Entries
+    are shared with ``cached_response`` for the same namespace.
+    """
+    if not get_config()["ENABLED"] or request.method != "GET":
+        return await compute(), None
+    key, data = await sync_to_async(lookup)(namespace, request, models, extra)
+    if data is not None:
+        stats["hits"] += 1
+        metrics.cache_lookup("response", hit=True)
+        return data, "HIT"
+    stats["misses"] += 1
+    metrics.cache_lookup("response", hit=False)
+    data = await compute()
+    await sync_to_async(store)(key, data)
+    return data, "MISS"
+
+
+class CachedResponseMixin:
+    """Cache ``list`` and ``retrieve`` results of a viewset.
+
+    ``cache_dependencies`` lists models, besides the queryset's own, whose rows
+    appear in the serialized output (e.g. nested serializers).
+    """
+
+    cache_responses = True
+    cache_dependencies = ()
+
+    def get_cache_dependencies(self):
+        return [self.queryset.model, *self.cache_dependencies]
+
+    def get_cache_namespace(self):
+        return f"{type(self).__module__}.{type(self).__name__}"
+
+    def _cached(self, handler, request, *args, **kwargs):
+        if not self.cache_responses:
+            return handler(request, *args, **kwargs)
+        return cached_response(
+            request,
+            self.get_cache_namespace(),
+            self.get_cache_dependencies(),
+            lambda: handler(request, *args, **kwargs),
+            extra=f"{self.action}:{sorted(kwargs.items())}",
+        )
+
+    def list(self, request, *args, **kwargs):
+        return self._cached(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached(super().retrieve, request, *args, **kwargs)
+
+
+@bulk.per_row
+def invalidate(sender, **kwargs):
+    # Bumping inside the writer's transaction would let a concurrent reader
+    # cache the old committed rows under the new version.
+    transaction.on_commit(lambda: bump_version(sender))
+
+
+def is_timestamped(model):
+    # Each app declares its own abstract TimestampedModel, so match by name.
+    return any(base.__name__ == "TimestampedModel" for base in model.__mro__[1:])
+
+
+def connect_signals():
+    for model in apps.get_models():
+        if is_timestamped(model):
+            post_save.connect(invalidate, sender=model, dispatch_uid=f"api-cache-save-{model._meta.label_lower}")
+            post_delete.connect(invalidate, sender=model, dispatch_uid=f"api-cache-delete-{model._meta.label_lower}")
+    bulk.bulk_changed.connect(invalidate, dispatch_uid="api-cache-bulk")
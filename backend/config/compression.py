@@ -0,0 +1,154 @@
+"""
+Response compression negotiated via ``Accept-Encoding``.
+
+Brotli is preferred when the ``brotli`` package is installed and the client
+accepts it, gzip otherwise. Compressed bodies of cacheable API responses
+(those carrying an ``ETag`` or ``X-Cache`` header) are kept in the response
+cache keyed by a digest of the uncompressed body, so a payload served many
+times is compressed once; hashing is far cheaper than compressing.
+
+Only API payloads are compressed by default. HTML pages (the admin, the
+browsable API) embed CSRF tokens next to reflected input, and compressing
+them would expose the tokens to BREACH-style length oracles.
+"""
+
+import gzip
+import hashlib
+import re
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+from . import cache, metrics
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+DEFAULTS = {
+    "ENABLED": True,
+    "MIN_SIZE": 512,
+    "GZIP_LEVEL": 6,
+    "BROTLI_QUALITY": 5,
+    "CACHE": True,
+    # Exact types, or prefixes ending in "/"; keep secret-bearing HTML out (BREACH).
+    "CONTENT_TYPES": ["application/json", "application/vnd.oai.openapi", "application/vnd.oai.openapi+json"],
+}
+
+stats = {"hits": 0, "misses": 0}
+
+_accept_encoding_re = re.compile(r"\s*([^\s;,]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?")
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, "API_COMPRESSION", {})}
+
+
+def accepted_encodings(header):
+    """Map each encoding in an ``Accept-Encoding`` header to its q-value."""
+    encodings = {}
+    for part in header.split(","):
+        match = _accept_encoding_re.match(part)
+        if match:
+            try:
+                encodings[match[1].lower()] = float(match[2]) if match[2] is not None else 1.0
+            except ValueError:
+                continue
+    return encodings
+
+
+def choose_encoding(header):
+    encodings = accepted_encodings(header)
+    available = ["br", "gzip"] if brotli is not None else ["gzip"]
+    candidates = [
+        (encodings.get(encoding, encodings.get("*", 0)), -position, encoding)
+        for position, encoding in enumerate(available)
+    ]
+    q, _, encoding = max(candidates)
+    return encoding if q > 0 else None
+
+
+def compress(body, encoding):
+    config = get_config()
+    if encoding == "br":
+        return brotli.compress(body, quality=config["BROTLI_QUALITY"])
+    return gzip.compress(body, compresslevel=config["GZIP_LEVEL"], mtime=0)
+
+
+def cached_compress(body, encoding):
+    key = f"compressed:{encoding}:{hashlib.sha1(body).hexdigest()}"
+    compressed = cache.response_cache().get(key)
+    if compressed is not None:
+        stats["hits"] += 1
+        metrics.cache_lookup("compressed", hit=True)
+        return compressed
+    stats["misses"] += 1
+    metrics.cache_lookup("compressed", hit=False)
+    compressed = compress(body, encoding)
+    cache.store(key, compressed)
+    return compressed
+
+
+def is_compressible(response, config):
+    content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+    return any(
+        content_type.startswith(prefix) if prefix.endswith("/") else content_type == prefix
+        for prefix in config["CONTENT_TYPES"]
+    )
+
+
+class CompressionMiddleware:
+    """Compress response bodies with the best encoding the client accepts.
+
+    Place it near the top of ``MIDDLEWARE`` so it sees the final body. Works
+    in both WSGI and ASGI mode.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request, response):
+        config = get_config()
+        if (
+            not config["ENABLED"]
+            or response.streaming
+            or response.has_header("Content-Encoding")
+            or not is_compressible(response, config)
+        ):
+            return response
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if len(response.content) < config["MIN_SIZE"]:
+            return response
+        encoding = choose_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return response
+
+        cacheable = config["CACHE"] and response.status_code == 200 and (
+            response.has_header("ETag") or response.has_header("X-Cache")
+        )
+        body = cached_compress(response.content, encoding) if cacheable else compress(response.content, encoding)
+        if len(body) >= len(response.content):
+            return response
+        response.content = body
+        response["Content-Length"] = str(len(body))
+        response["Content-Encoding"] = encoding
+        # The compressed representation differs byte-wise, so its ETag must be weak.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = f"W/{etag}"
+        return response
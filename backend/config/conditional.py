@@ -0,0 +1,137 @@
+"""
+Conditional GET support (ETag / Last-Modified) for read-only API endpoints.
+
+Validators are derived from ``MAX(updated_at)`` and ``COUNT(*)`` of the rows a
+response is built from, so they are computed with one aggregate query per
+model and never require serializing the body. They are memoized in the
+versioned response cache, which makes repeat revalidations query-free.
+"""
+
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from . import cache
+
+
+def summarize(querysets):
+    """Return ``(count, latest updated_at)`` pairs for each queryset."""
+    summaries = []
+    for queryset in querysets:
+        result = queryset.order_by().aggregate(latest=Max("updated_at"), count=Count("pk"))
+        summaries.append((result["count"], result["latest"]))
+    return summaries
+
+
+async def asummarize(querysets):
+    """Async ``summarize``."""
+    summaries = []
+    for queryset in querysets:
+        result = await queryset.order_by().aaggregate(latest=Max("updated_at"), count=Count("pk"))
+        summaries.append((result["count"], result["latest"]))
+    return summaries
+
+
+def compute_validators(request, namespace, querysets, extra=""):
+    """Build a strong ETag and a Last-Modified timestamp for ``querysets``.
+
+    Returns ``None`` for the timestamp when every queryset is empty.
+    """
+    return validators_for(request, namespace, summarize(querysets), extra)
+
+
+async def acompute_validators(request, namespace, querysets, extra=""):
+    """Async ``compute_validators``."""
+    return validators_for(request, namespace, await asummarize(querysets), extra)
+
+
+def validators_for(request, namespace, summaries, extra=""):
+    timestamps = [latest for _, latest in summaries if latest is not None]
+    last_modified = int(max(timestamps).timestamp()) if timestamps else None
+    raw = "|".join([
+        namespace,
+        extra,
+        request.get_host(),
+        getattr(request, "accepted_media_type", "") or "",
+        cache.normalize_query(request.GET),
+        ";".join(f"{count}@{latest.isoformat() if latest else ''}" for count, latest in summaries),
+    ])
+    etag = '"%s"' % hashlib.sha1(raw.encode()).hexdigest()
+    return etag, last_modified, summaries
+
+
+def conditional_response(request, compute, validators):
+    """Return 304 when the client's copy is current, else ``compute()`` with validators set."""
+    etag, last_modified = validators
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        return not_modified
+    return set_validators(compute(), validators)
+
+
+async def aconditional_response(request, compute, validators):
+    """Async ``conditional_response``; ``compute`` is a coroutine function."""
+    etag, last_modified = validators
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        return not_modified
+    return set_validators(await compute(), validators)
+
+
+def set_validators(response, validators):
+    etag, last_modified = validators
+    if response.status_code == 200:
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+class ConditionalGetMixin:
+    """Answer conditional ``list`` and ``retrieve`` requests without serializing.
+
+    Expects the models listed by ``get_cache_dependencies()`` besides the
+    queryset's own to carry ``updated_at`` as well.
+    """
+
+    def get_validator_querysets(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == "retrieve":
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        dependencies = self.get_cache_dependencies()[1:]
+        return [queryset, *(model.objects.all() for model in dependencies)]
+
+    def get_validators(self, request):
+        namespace = f"validators:{self.get_cache_namespace()}"
+        extra = f"{self.action}:{sorted(self.kwargs.items())}"
+
+        def compute():
+            try:
+                etag, last_modified, summaries = compute_validators(
+                    request, namespace, self.get_validator_querysets(), extra=extra
+                )
+            except (TypeError, ValueError, ValidationError):
+                # A lookup value the field rejects (``/nav-items/abc/``): the view answers 404.
+                return None, None
+            # Nothing matched: let the view produce its usual 404 or empty list.
+            if self.action == "retrieve" and not summaries[0][0]:
+                return None, None
+            return etag, last_modified
+
+        return cache.memoize(request, namespace, self.get_cache_dependencies(), compute, extra=extra)
+
+    def _conditional(self, handler, request, *args, **kwargs):
+        etag, last_modified = self.get_validators(request)
+        if etag is None:
+            return handler(request, *args, **kwargs)
+        return conditional_response(request, lambda: handler(request, *args, **kwargs), (etag, last_modified))
+
+    def list(self, request, *args, **kwargs):
+        return self._conditional(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._conditional(super().retrieve, request, *args, **kwargs)
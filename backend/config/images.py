@@ -0,0 +1,231 @@
+"""
+Responsive image derivatives.
+
+Every uploaded ``ImageField`` file gets downscaled, re-encoded variants
+(WebP, plus AVIF when Pillow can write it) at the widths configured in
+``IMAGE_DERIVATIVES``. Variants are rendered in a process pool after the
+upload's transaction commits, never on the request path, and are described
+by a small JSON manifest next to them::
+
+    media/projects/tarbela.jpg
+    media/derivatives/projects/tarbela.json
+    media/derivatives/projects/tarbela-640.webp
+    ...
+
+Serializers using ``ResponsiveImagesMixin`` expose each image's variants as
+``srcset``-ready strings once the manifest exists.
+"""
+
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import connection, models, transaction
+from django.db.models.signals import post_save
+
+from . import bulk, cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "ENABLED": True,
+    "ASYNC": True,
+    "WIDTHS": [320, 640, 1024, 1600],
+    "FORMATS": ["avif", "webp"],
+    "QUALITY": 80,
+    "WORKERS": 2,
+    "ROOT": "derivatives",
+}
+
+_executor = None
+_manifests = {}  # upload name -> manifest
+_missing = {}  # upload name -> model cache version it had no manifest at
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, "IMAGE_DERIVATIVES", {})}
+
+
+def supported_formats(formats):
+    from PIL import Image
+
+    Image.init()
+    return [fmt for fmt in formats if fmt.upper() in Image.SAVE]
+
+
+def manifest_name(name):
+    stem, _ = os.path.splitext(name)
+    return f"{get_config()['ROOT']}/{stem}.json"
+
+
+def render(source, manifest, widths, formats, quality):
+    """Write variants of ``source`` and their manifest (absolute paths).
+
+    Runs in a worker process, so it only depends on Pillow and the filesystem.
+    Returns the manifest contents.
+    """
+    from PIL import Image, ImageOps
+
+    directory = os.path.dirname(manifest)
+    stem = os.path.splitext(os.path.basename(manifest))[0]
+    os.makedirs(directory, exist_ok=True)
+    variants = {fmt: [] for fmt in formats}
+    with Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+        # Never upscale: widths above the original collapse to the original width.
+        targets = sorted({min(width, image.width) for width in widths})
+        for width in targets:
+            height = max(1, round(image.height * width / image.width))
+            resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+            for fmt in formats:
+                filename = f"{stem}-{width}.{fmt}"
+                resized.save(os.path.join(directory, filename), fmt.upper(), quality=quality)
+                variants[fmt].append([width, filename])
+    contents = {"width": image.width, "height": image.height, "variants": variants}
+    tmp = f"{manifest}.tmp"
+    with open(tmp, "w") as fh:
+        json.dump(contents, fh)
+    os.replace(tmp, manifest)
+    return contents
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=get_config()["WORKERS"])
+    return _executor
+
+
+def generate(name, model=None, wait=False):
+    """Render derivatives for the stored file ``name``.
+
+    Asynchronous unless ``wait`` is set or ``IMAGE_DERIVATIVES['ASYNC']`` is
+    off. ``model``'s cache version is bumped once the variants exist, so
+    cached API responses pick them up.
+    """
+    config = get_config()
+    args = (
+        default_storage.path(name),
+        default_storage.path(manifest_name(name)),
+        config["WIDTHS"],
+        supported_formats(config["FORMATS"]),
+        config["QUALITY"],
+    )
+    if wait or not config["ASYNC"]:
+        result = render(*args)
+        if model is not None:
+            cache.bump_version(model)
+        return result
+
+    future = get_executor().submit(render, *args)
+
+    def done(future):
+        try:
+            future.result()
+        except Exception:
+            logger.exception("Could not render derivatives for %s", name)
+        else:
+            if model is not None:
+                cache.bump_version(model)
+                connection.close()  # the callback's thread keeps no connection open
+
+    future.add_done_callback(done)
+    return future
+
+
+def load_manifest(name, version=None):
+    """The manifest of upload ``name``, or ``None`` while it has no derivatives.
+
+    Manifests are immutable for a given upload name, so hits are kept for
+    good. Misses are kept for the owning model's cache ``version``: rendering
+    derivatives (like any save) bumps it, so the manifest is looked up again.
+    """
+    manifest = _manifests.get(name)
+    if manifest is not None:
+        return manifest
+    if version is not None and _missing.get(name) == version:
+        return None
+    try:
+        with default_storage.open(manifest_name(name)) as fh:
+            manifest = json.load(fh)
+    except (FileNotFoundError, ValueError):
+        if version is not None:
+            _missing[name] = version
+        return None
+    _missing.pop(name, None)
+    _manifests[name] = manifest
+    return manifest
+
+
+def model_version(model, request=None):
+    """``model``'s cache version, read once per request."""
+    return cache.get_versions([model], request)[0]
+
+
+def srcsets(file, request=None, model=None):
+    """Map each format to a ``srcset`` string for an image field's file (or stored name).
+
+    ``model`` owns the image field; with it, missing manifests are remembered
+    until the model's cache version changes instead of looked up every time.
+    """
+    name = getattr(file, "name", file)
+    if not name:
+        return None
+    manifest = load_manifest(name, None if model is None else model_version(model, request))
+    if manifest is None:
+        return None
+    base = os.path.dirname(manifest_name(name))
+    result = {}
+    for fmt, variants in manifest["variants"].items():
+        entries = []
+        for width, filename in variants:
+            url = default_storage.url(f"{base}/{filename}")
+            if request is not None:
+                url = request.build_absolute_uri(url)
+            entries.append(f"{url} {width}w")
+        result[fmt] = ", ".join(entries)
+    return result
+
+
+class ResponsiveImagesMixin:
+    """Add ``<field>_srcset`` next to every image field of a model serializer."""
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        request = self.context.get("request")
+        for field in instance._meta.fields:
+            if isinstance(field, models.ImageField) and field.name in data:
+                data[f"{field.name}_srcset"] = srcsets(getattr(instance, field.name), request, type(instance))
+        return data
+
+
+def image_fields(model):
+    return [field.name for field in model._meta.fields if isinstance(field, models.ImageField)]
+
+
+@bulk.per_row
+def schedule(sender, instance, **kwargs):
+    if not get_config()["ENABLED"]:
+        return
+    for name in image_fields(sender):
+        file = getattr(instance, name)
+        if file and file.name and not default_storage.exists(manifest_name(file.name)):
+            transaction.on_commit(lambda name=file.name: generate(name, model=sender))
+
+
+def schedule_bulk(sender, saved, **kwargs):
+    for instance in saved:
+        schedule(sender, instance=instance)
+
+
+def connect_signals():
+    for model in apps.get_models():
+        if cache.is_timestamped(model) and image_fields(model):
+            post_save.connect(schedule, sender=model, dispatch_uid=f"image-derivatives-{model._meta.label_lower}")
+    bulk.bulk_changed.connect(schedule_bulk, dispatch_uid="image-derivatives-bulk")
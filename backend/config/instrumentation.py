@@ -0,0 +1,289 @@
+"""
+Per-request SQL and timing instrumentation.
+
+``InstrumentationMiddleware`` measures, for every request, the number of SQL
+queries and the time spent in them (through an execute wrapper installed on
+every database connection),
+the time the view spent outside SQL (where DRF builds ``serializer.data``),
+the time spent rendering the response, and the size of the body sent. The
+figures are reported in a ``Server-Timing`` header, so browser dev tools show
+them regardless of ``DEBUG``, and folded into a rolling per-view window kept
+in process memory.
+
+Queries slower than ``SLOW_QUERY_MS`` are logged on the ``config.instrumentation``
+logger together with the application frame that issued them. ``snapshot()``
+aggregates everything for the staff-only ``/api/stats/`` endpoint; each worker
+process reports its own window; the same samples feed the Prometheus metrics
+of ``config.metrics``.
+"""
+
+import bisect
+import logging
+import threading
+import time
+import traceback
+from collections import deque
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "ENABLED": True,
+    "SERVER_TIMING": True,
+    "SLOW_QUERY_MS": 100,
+    "WINDOW": 1000,  # requests kept per view
+    "SLOW_QUERY_LOG": 50,  # slow queries kept for the stats endpoint
+    "BUCKETS": [5, 10, 25, 50, 100, 250, 500, 1000, 2500],  # ms
+}
+
+_lock = threading.Lock()
+_views = {}
+_slow_queries = deque(maxlen=DEFAULTS["SLOW_QUERY_LOG"])
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, "API_INSTRUMENTATION", {})}
+
+
+def origin():
+    """The innermost project frame on the stack, as ``path:line in function``."""
+    base = str(settings.BASE_DIR)
+    for frame in reversed(traceback.extract_stack()[:-2]):
+        if frame.filename.startswith(base) and "site-packages" not in frame.filename and frame.filename != __file__:
+            return f"{frame.filename[len(base) + 1:]}:{frame.lineno} in {frame.name}"
+    return None
+
+
+# The collector of the request being served. Context variables follow a request
+# into the threads ``sync_to_async`` runs its ORM calls in, while connections
+# (and their wrappers) are per thread.
+_collector = ContextVar("instrumentation_collector", default=None)
+
+
+def execute_wrapper(execute, sql, params, many, context):
+    collector = _collector.get()
+    if collector is None:
+        return execute(sql, params, many, context)
+    return collector(execute, sql, params, many, context)
+
+
+def install(connection, **kwargs):
+    if execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(execute_wrapper)
+
+
+class QueryCollector:
+    """``execute_wrapper`` counting and timing the queries of one request."""
+
+    def __init__(self, slow_ms):
+        self.slow_ms = slow_ms
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.count += 1
+            self.seconds += elapsed
+            if elapsed * 1000 >= self.slow_ms:
+                record_slow_query(sql, elapsed, origin())
+
+
+def record_slow_query(sql, elapsed, where):
+    logger.warning("Slow query (%.1f ms) from %s: %s", elapsed * 1000, where or "unknown", sql)
+    with _lock:
+        _slow_queries.append({
+            "sql": sql,
+            "ms": round(elapsed * 1000, 2),
+            "origin": where,
+            "at": time.time(),
+        })
+
+
+class ViewStats:
+    """Rolling window of the last ``WINDOW`` requests served by one view."""
+
+    def __init__(self, window):
+        self.samples = deque(maxlen=window)
+        self.requests = 0
+
+    def add(self, sample):
+        self.samples.append(sample)
+        self.requests += 1
+
+    def summary(self, buckets):
+        samples = list(self.samples)
+        totals = sorted(sample["total_ms"] for sample in samples)
+        histogram = [0] * (len(buckets) + 1)
+        for value in totals:
+            histogram[bisect.bisect_left(buckets, value)] += 1
+
+        def mean(key):
+            return round(sum(sample[key] for sample in samples) / len(samples), 2)
+
+        def percentile(fraction):
+            return round(totals[min(len(totals) - 1, int(fraction * len(totals)))], 2)
+
+        return {
+            "requests": self.requests,
+            "window": len(samples),
+            "queries": {"mean": mean("queries"), "max": max(sample["queries"] for sample in samples)},
+            "mean_ms": {key[:-3]: mean(key) for key in ("total_ms", "db_ms", "view_ms", "render_ms")},
+            "total_ms": {"p50": percentile(0.5), "p95": percentile(0.95), "p99": percentile(0.99), "max": totals[-1]},
+            "bytes": {"mean": mean("bytes"), "max": max(sample["bytes"] for sample in samples)},
+            "histogram": {
+                **{f"le_{bound}": count for bound, count in zip(buckets, histogram)},
+                "inf": histogram[-1],
+            },
+        }
+
+
+def record(view, sample):
+    config = get_config()
+    with _lock:
+        stats = _views.get(view)
+        if stats is None or stats.samples.maxlen != config["WINDOW"]:
+            stats = _views[view] = ViewStats(config["WINDOW"])
+        stats.add(sample)
+
+
+def snapshot():
+    """Aggregated stats of this process, slowest views (by p95) first."""
+    config = get_config()
+    with _lock:
+        views = {view: stats.summary(config["BUCKETS"]) for view, stats in _views.items() if stats.samples}
+        slow = list(_slow_queries)[-config["SLOW_QUERY_LOG"]:]
+    return {
+        "buckets_ms": config["BUCKETS"],
+        "views": dict(sorted(views.items(), key=lambda item: item[1]["total_ms"]["p95"], reverse=True)),
+        "slow_queries": slow[::-1],
+    }
+
+
+def reset():
+    with _lock:
+        _views.clear()
+        _slow_queries.clear()
+
+
+def server_timing(sample):
+    return ", ".join([
+        f'db;dur={sample["db_ms"]:.1f};desc="{sample["queries"]} queries"',
+        f'view;dur={sample["view_ms"]:.1f}',
+        f'render;dur={sample["render_ms"]:.1f}',
+        f'total;dur={sample["total_ms"]:.1f}',
+    ])
+
+
+class InstrumentationMiddleware:
+    """Measure SQL, view, render time and body size of every request.
+
+    Place it first in ``MIDDLEWARE`` so the total covers the whole stack and the
+    size is that of the body actually sent. Works in both WSGI and ASGI mode;
+    under ASGI the query wrappers follow the request into the threads that run
+    its ORM calls.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        connection_created.connect(install, dispatch_uid="config.instrumentation")
+        for connection in connections.all(initialized_only=True):
+            install(connection)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            # Coroutine hooks keep the handler from hopping to a thread to call them.
+            self.process_view = self.aprocess_view
+            self.process_template_response = self.aprocess_template_response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        config = get_config()
+        if not config["ENABLED"]:
+            return self.get_response(request)
+        token, started = self.start(request, config)
+        try:
+            response = self.get_response(request)
+        finally:
+            _collector.reset(token)
+        return self.finish(request, response, started, config)
+
+    async def __acall__(self, request):
+        config = get_config()
+        if not config["ENABLED"]:
+            return await self.get_response(request)
+        token, started = self.start(request, config)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _collector.reset(token)
+        return self.finish(request, response, started, config)
+
+    def start(self, request, config):
+        collector = QueryCollector(config["SLOW_QUERY_MS"])
+        request._instrumentation = {"collector": collector}
+        return _collector.set(collector), time.perf_counter()
+
+    def finish(self, request, response, started, config):
+        finished = time.perf_counter()
+        marks = request._instrumentation
+        collector = marks["collector"]
+        view_ms = render_ms = 0.0
+        if "view" in marks:
+            view_started, db_before = marks["view"]
+            view_finished, db_after = marks.get("view_done", (finished, collector.seconds))
+            view_ms = max(0.0, (view_finished - view_started) - (db_after - db_before)) * 1000
+            render_ms = marks.get("render", 0.0) * 1000
+        sample = {
+            "queries": collector.count,
+            "db_ms": collector.seconds * 1000,
+            "view_ms": view_ms,
+            "render_ms": render_ms,
+            "total_ms": (finished - started) * 1000,
+            "bytes": 0 if response.streaming else len(response.content),
+        }
+        match = getattr(request, "resolver_match", None)
+        route = match.view_name if match else "unresolved"
+        record(f"{request.method} {route}", sample)
+        metrics.observe(request.method, route, response.status_code, sample)
+        if config["SERVER_TIMING"]:
+            response["Server-Timing"] = server_timing(sample)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        marks = getattr(request, "_instrumentation", None)
+        if marks is not None:
+            marks["view"] = (time.perf_counter(), marks["collector"].seconds)
+        return None
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        return InstrumentationMiddleware.process_view(self, request, view_func, view_args, view_kwargs)
+
+    def process_template_response(self, request, response):
+        # Called once the view has returned and right before the response is rendered.
+        marks = getattr(request, "_instrumentation", None)
+        if marks is not None and "view" in marks:
+            started = time.perf_counter()
+            marks["view_done"] = (started, marks["collector"].seconds)
+
+            def rendered(response):
+                marks["render"] = time.perf_counter() - started
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    async def aprocess_template_response(self, request, response):
+        return InstrumentationMiddleware.process_template_response(self, request, response)
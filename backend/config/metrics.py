@@ -0,0 +1,116 @@
+"""
+Prometheus metrics.
+
+Request latency and status counts per route, SQL queries and SQL time per
+request (all fed by ``InstrumentationMiddleware``), response and compression
+cache hits/misses, and the email outbox depth are exposed in the Prometheus
+text format at ``/metrics``.
+
+Under gunicorn every worker keeps its own counters. With
+``PROMETHEUS_MULTIPROC_DIR`` set (``gunicorn.conf.py`` does so) the workers
+write them to files in that directory and a scrape, whichever worker serves
+it, aggregates all of them. The outbox depth is read from the database at
+scrape time. Everything is a no-op when ``prometheus_client`` is not installed.
+"""
+
+import hmac
+import os
+
+from django.conf import settings
+from django.db.models import Count, Min
+from django.http import HttpResponse
+from django.utils import timezone
+
+try:
+    import prometheus_client
+    from prometheus_client import CollectorRegistry, Counter, Histogram, multiprocess
+    from prometheus_client.core import GaugeMetricFamily
+except ImportError:  # optional: /metrics answers 503
+    prometheus_client = None
+
+DEFAULTS = {
+    "ENABLED": True,
+    "TOKEN": None,  # when set, scrapes must send "Authorization: Bearer <TOKEN>"
+}
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, "API_METRICS", {})}
+
+
+if prometheus_client is not None:
+    REQUEST_LATENCY = Histogram(
+        "http_request_duration_seconds", "Request latency by route.", ["method", "route"], buckets=LATENCY_BUCKETS
+    )
+    REQUESTS = Counter("http_requests", "Responses by route and status code.", ["method", "route", "status"])
+    REQUEST_QUERIES = Histogram(
+        "db_queries_per_request", "SQL queries issued per request.", ["route"], buckets=QUERY_BUCKETS
+    )
+    REQUEST_DB_TIME = Histogram(
+        "db_time_per_request_seconds", "SQL time spent per request.", ["route"], buckets=LATENCY_BUCKETS
+    )
+    CACHE_LOOKUPS = Counter("api_cache_lookups", "Response cache lookups by cache and result.", ["cache", "result"])
+
+
+def observe(method, route, status, sample):
+    """Record one request measured by ``InstrumentationMiddleware``."""
+    if prometheus_client is None or not get_config()["ENABLED"]:
+        return
+    REQUEST_LATENCY.labels(method, route).observe(sample["total_ms"] / 1000)
+    REQUESTS.labels(method, route, str(status)).inc()
+    REQUEST_QUERIES.labels(route).observe(sample["queries"])
+    REQUEST_DB_TIME.labels(route).observe(sample["db_ms"] / 1000)
+
+
+def cache_lookup(cache, hit):
+    if prometheus_client is not None:
+        CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+class OutboxCollector:
+    """Queued emails by status and the age of the oldest pending one, read at scrape time."""
+
+    def collect(self):
+        from cms.models import OutboundEmail
+
+        depth = GaugeMetricFamily("email_outbox_messages", "Outbound emails by status.", labels=["status"])
+        counts = dict(OutboundEmail.objects.values_list("status").annotate(count=Count("pk")).order_by())
+        for status, _ in OutboundEmail.STATUS_CHOICES:
+            depth.add_metric([status], counts.get(status, 0))
+        yield depth
+
+        oldest = OutboundEmail.objects.filter(status=OutboundEmail.PENDING).aggregate(oldest=Min("created_at"))
+        age = (timezone.now() - oldest["oldest"]).total_seconds() if oldest["oldest"] else 0
+        yield GaugeMetricFamily("email_outbox_oldest_pending_seconds", "Age of the oldest pending email.", value=age)
+
+
+def registry():
+    """A registry holding this scrape's view of every worker's metrics."""
+    scrape = CollectorRegistry()
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.MultiProcessCollector(scrape)
+    else:
+        scrape.register(prometheus_client.REGISTRY)
+    scrape.register(OutboxCollector())
+    return scrape
+
+
+def is_authorized(request, config):
+    if not config["TOKEN"]:
+        return True
+    expected = f"Bearer {config['TOKEN']}"
+    return hmac.compare_digest(request.META.get("HTTP_AUTHORIZATION", ""), expected)
+
+
+def metrics_view(request):
+    config = get_config()
+    if prometheus_client is None or not config["ENABLED"]:
+        return HttpResponse("Metrics are unavailable.\n", status=503, content_type="text/plain")
+    if not is_authorized(request, config):
+        return HttpResponse(status=401)
+    return HttpResponse(
+        prometheus_client.generate_latest(registry()), content_type=prometheus_client.CONTENT_TYPE_LATEST
+    )
@@ -0,0 +1,225 @@
+"""
+Keyset (seek) pagination for list endpoints.
+
+Pages are selected with a ``WHERE (ordering columns) > (last row seen)``
+predicate instead of an OFFSET, so every page costs the same regardless of
+its position and rows inserted meanwhile never shift a cursor. The ordering
+is whatever the list would otherwise use (``?ordering=`` or the model's
+``Meta.ordering``, or an annotation such as the search rank) with the
+primary key appended as a tie-breaker. Ordering by a foreign key expands to
+the related model's ordering, as the ORM does, so paginated and unpaginated
+lists agree.
+"""
+
+import base64
+import datetime
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """``DjangoJSONEncoder`` with datetimes and times at full precision.
+
+    The stock encoder keeps milliseconds only, and a cursor must compare equal
+    to the row it was taken from or the page boundary drifts.
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPagination(BasePagination):
+    """Opt-in keyset pagination.
+
+    Lists stay unpaginated unless the client sends ``page_size`` or
+    ``cursor``; subclasses that set ``page_size`` are always paginated.
+    """
+
+    page_size = None
+    max_page_size = 200
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        limit = self.get_page_size(request)
+        if limit is None:
+            return None
+
+        self.ordering = self.get_ordering(queryset)
+        queryset = queryset.order_by(*(
+            F(name).desc(nulls_last=True) if descending else F(name).asc(nulls_first=True)
+            for field, name, descending, nullable in self.ordering
+        ))
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self.after(position))
+
+        rows = list(queryset[: limit + 1])
+        self.has_next = len(rows) > limit
+        self.page = rows[:limit]
+        return self.page
+
+    def get_page_size(self, request):
+        value = request.query_params.get(self.page_size_query_param)
+        if value is not None:
+            try:
+                size = int(value)
+            except ValueError:
+                size = 0
+            if size > 0:
+                return min(size, self.max_page_size)
+        if self.page_size is not None:
+            return self.page_size
+        if self.cursor_query_param in request.query_params:
+            return api_settings.PAGE_SIZE or self.max_page_size
+        return None
+
+    def get_ordering(self, queryset):
+        """Resolve the effective ordering to ``(field, path, descending, nullable)`` keys."""
+        opts = queryset.model._meta
+        annotations = queryset.query.annotations
+        names = queryset.query.order_by or opts.ordering
+        ordering = []
+        for name in names:
+            if not isinstance(name, str) or name == "?":
+                continue
+            descending = name.startswith("-")
+            name = name.lstrip("-")
+            if name in annotations:
+                field = annotations[name].output_field
+                ordering.append((field, name, descending, field.null))
+                continue
+            if name in ("pk", opts.pk.name, opts.pk.attname):
+                ordering.append((opts.pk, opts.pk.attname, descending, False))
+                return ordering
+            ordering.extend(self.expand(opts, name, descending))
+        ordering.append((opts.pk, opts.pk.attname, False, False))
+        return ordering
+
+    def expand(self, opts, path, descending, nullable=False, seen=()):
+        """Ordering keys for ``path``; a foreign key stands for its model's ``Meta.ordering``."""
+        *relations, name = path.split("__")
+        for relation in relations:
+            field = opts.get_field(relation)
+            nullable = nullable or field.null
+            opts = field.related_model._meta
+        field = opts.pk if name == "pk" else opts.get_field(name)
+        if not (field.many_to_one or field.one_to_one) or not field.concrete:
+            return [(field, path, descending, nullable or field.null)]
+        nullable = nullable or field.null
+        related = field.related_model._meta
+        if related.label in seen:
+            raise ValueError(f"Ordering of {related.label} refers back to itself.")
+        keys = []
+        for name in related.ordering or [related.pk.name]:
+            if not isinstance(name, str):
+                continue
+            keys.extend(self.expand(
+                related,
+                name.lstrip("-"),
+                descending != name.startswith("-"),
+                nullable,
+                (*seen, related.label),
+            ))
+        return [(key, f"{path}__{key_path}", *flags) for key, key_path, *flags in keys]
+
+    def after(self, position):
+        """Rows strictly after ``position`` in the (nulls first, nulls last on desc) order."""
+        condition = Q(pk__in=[])
+        equal = Q()
+        for (field, name, descending, nullable), value in zip(self.ordering, position):
+            condition |= equal & self._beyond(name, descending, nullable, value)
+            equal &= Q(**{f"{name}__isnull": True}) if value is None else Q(**{name: value})
+        return condition
+
+    @staticmethod
+    def _beyond(name, descending, nullable, value):
+        if value is None:
+            return Q(pk__in=[]) if descending else Q(**{f"{name}__isnull": False})
+        if not descending:
+            return Q(**{f"{name}__gt": value})
+        condition = Q(**{f"{name}__lt": value})
+        if nullable:
+            condition |= Q(**{f"{name}__isnull": True})
+        return condition
+
+    @staticmethod
+    def value(instance, path):
+        for name in path.split("__"):
+            if instance is None:
+                return None
+            instance = getattr(instance, name)
+        return instance
+
+    def encode_cursor(self, instance):
+        values = [self.value(instance, name) for field, name, descending, nullable in self.ordering]
+        raw = json.dumps(values, cls=CursorEncoder, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                None if value is None else field.to_python(value)
+                for (field, name, descending, nullable), value in zip(self.ordering, values)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Opaque position returned in a previous page's `next` link.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"Rows per page (max {self.max_page_size}); enables pagination.",
+                "schema": {"type": "integer"},
+            },
+        ]
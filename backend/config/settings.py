@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -53,13 +54,13 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'config.instrumentation.InstrumentationMiddleware',  # first: times the whole stack
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'config.compression.CompressionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
-    'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
+    # Session, CSRF, auth and messages; skipped by public API reads (API_STATELESS).
+    'config.stateless.StatefulMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
@@ -82,14 +83,36 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'config.wsgi.application'
 
+# Route read-only public endpoints to native async views. config/asgi.py turns
+# this on for the ASGI server; under WSGI the sync views are cheaper.
+ASYNC_VIEWS = os.environ.get('DJANGO_ASYNC_VIEWS') == '1'
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# SQLite tuning applied to every new connection. WAL lets readers run while a
+# writer commits, busy_timeout (ms) makes writers queue instead of failing with
+# "database is locked", and IMMEDIATE transactions take the write lock up front
+# so concurrent read-then-write transactions cannot deadlock.
+# Compare profiles with `python manage.py bench_sqlite`.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'cache_size': -20000,  # negative values are KiB
+    'mmap_size': 128 * 1024 * 1024,
+    'temp_store': 'MEMORY',
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            'init_command': ';'.join(f'PRAGMA {name}={value}' for name, value in SQLITE_PRAGMAS.items()),
+            'transaction_mode': 'IMMEDIATE',
+        },
     }
 }
 
@@ -134,19 +157,42 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = 'media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Resized WebP/AVIF variants of uploaded images, rendered off the request path
+# by a process pool (see config/images.py). Backfill with
+# `python manage.py build_image_derivatives`.
+IMAGE_DERIVATIVES = {
+    'WIDTHS': [320, 640, 1024, 1600],
+    'FORMATS': ['avif', 'webp'],  # formats Pillow cannot write are skipped
+    'QUALITY': 80,
+    'WORKERS': 2,
+}
+
 # Django REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'config.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.AllowAny',
     ),
+    # orjson-backed when installed, DRF's stdlib JSON otherwise (see config/renderers.py).
+    'DEFAULT_RENDERER_CLASSES': (
+        'config.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'config.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'DEFAULT_PAGINATION_CLASS': 'config.pagination.KeysetPagination',
+    'PAGE_SIZE': 25,
     'DEFAULT_FILTER_BACKENDS': (
         'django_filters.rest_framework.DjangoFilterBackend',
-        'rest_framework.filters.SearchFilter',
+        'cms.search.FullTextSearchFilter',
         'rest_framework.filters.OrderingFilter',
+        'config.sparse.SparseFieldsFilter',  # last: sees the final ordering
     ),
 }
 
@@ -164,6 +210,84 @@ CORS_ALLOW_CREDENTIALS = True
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 DEFAULT_FROM_EMAIL = 'no-reply@consultency.local'
 
+# Outbound email queue, drained by `python manage.py process_outbox`
+EMAIL_OUTBOX = {
+    'MAX_ATTEMPTS': 6,
+    'BACKOFF_BASE': 30,  # seconds; doubled after every failed attempt
+    'BACKOFF_MAX': 60 * 60,
+}
+
+# Caches: API responses live in per-worker local memory, while the model
+# version counters that invalidate them are database rows (cms.CacheVersion)
+# shared by every worker.
+# Point 'api' at FileBasedCache (or any other backend) to share responses too.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'api': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'api-responses',
+        'TIMEOUT': 60 * 60,
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    },
+}
+
+API_CACHE = {
+    'ENABLED': True,
+    'ALIAS': 'api',
+}
+
+# gzip/Brotli response compression (Brotli needs the `brotli` package).
+# Compressed bodies of cacheable API responses are kept in the 'api' cache.
+API_COMPRESSION = {
+    'MIN_SIZE': 512,
+    'GZIP_LEVEL': 6,
+    'BROTLI_QUALITY': 5,
+}
+
+# Static snapshot of the public API for nginx to serve (see config/snapshot.py
+# and `python manage.py export_api_snapshot --watch`). HOST is the host name
+# absolute URLs in the rendered responses point at.
+API_SNAPSHOT = {
+    'ROOT': 'snapshot',
+    'HOST': 'localhost',
+    'KEEP': 3,
+    'DEBOUNCE': 5,
+}
+
+# Per-request SQL/timing instrumentation (see config/instrumentation.py):
+# Server-Timing headers, slow-query logging and the staff-only /api/stats/.
+API_INSTRUMENTATION = {
+    'SLOW_QUERY_MS': 100,
+    'WINDOW': 1000,
+}
+
+# Prometheus metrics at /metrics (needs `prometheus_client`). Under gunicorn
+# the workers share them through PROMETHEUS_MULTIPROC_DIR (see gunicorn.conf.py).
+# nginx does not route /metrics; scrape 127.0.0.1:8000/metrics.
+API_METRICS = {
+    'TOKEN': None,  # set to require "Authorization: Bearer <TOKEN>" on scrapes
+}
+
+# Safe requests under these prefixes bypass the session, CSRF, auth and
+# messages middleware listed in config/stateless.py; /admin/ and API writes
+# keep the full stack.
+API_STATELESS = {
+    'PREFIXES': ['/api/', '/metrics'],
+}
+
+# Verified JWTs and their users, cached per worker until the token expires
+# or TTL seconds pass; any user change invalidates them (config/authentication.py).
+API_JWT_CACHE = {
+    'MAX_ENTRIES': 1024,
+    'TTL': 300,
+}
+
+# The admin checks look for the auth, messages and session middleware in
+# MIDDLEWARE; config.stateless.StatefulMiddleware runs them for the admin.
+SILENCED_SYSTEM_CHECKS = ['admin.E408', 'admin.E409', 'admin.E410']
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
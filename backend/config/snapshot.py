@@ -0,0 +1,265 @@
+"""
+Static snapshot of the public API.
+
+Every cacheable public GET response (list endpoints, including the
+``?is_active=true&ordering=...`` combinations the frontend requests, every
+detail route and the page bundles) is rendered in-process and written to a
+versioned release directory, next to gzip and, when the ``brotli`` package is
+installed, Brotli copies::
+
+    snapshot/current -> releases/20261018T131500123456
+    snapshot/releases/20261018T131500123456/api/projects/index.json
+    snapshot/releases/20261018T131500123456/api/projects/index?is_active=true&ordering=order.json
+    snapshot/releases/20261018T131500123456/api/projects/index?is_active=true&ordering=order.json.gz
+
+``current`` is swapped atomically once a release is complete, so nginx can
+answer anonymous reads straight from disk (see DEPLOYMENT-GUIDE.md) and fall
+back to gunicorn for anything missing. Saving a row the snapshot depends on
+bumps its cache version and then removes ``current`` as soon as the
+transaction commits; ``export_api_snapshot --watch`` then publishes a fresh
+release. A write committing while a release is being published is caught by
+re-checking the versions after the swap, so stale files are served for at
+most that instant.
+"""
+
+import functools
+import gzip
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.test import Client
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+
+from . import bulk, cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "ENABLED": True,
+    "ROOT": "snapshot",
+    "HOST": "localhost",
+    "SECURE": False,
+    "KEEP": 3,  # releases kept besides the published one
+    "DEBOUNCE": 5,  # seconds of quiet before --watch re-exports
+    "MIN_COMPRESS_SIZE": 256,
+    "EXTRA_QUERIES": {},  # path -> extra query strings to render
+}
+
+MANIFEST = ".snapshot.json"
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, "API_SNAPSHOT", {})}
+
+
+def root():
+    return os.path.join(settings.BASE_DIR, get_config()["ROOT"])
+
+
+def current_link():
+    return os.path.join(root(), "current")
+
+
+def file_name(path, query=""):
+    """Snapshot file for ``path?query``; mirrors the nginx ``try_files`` rule."""
+    return path.lstrip("/") + "index" + (f"?{query}" if query else "") + ".json"
+
+
+def walk(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from walk(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern):
+            yield pattern
+
+
+def list_queries(viewset):
+    """Query strings a list endpoint is rendered with, besides the bare one."""
+    queries = []
+    if "is_active" in (getattr(viewset, "filterset_fields", None) or ()):
+        queries.append("is_active=true")
+        queries.extend(f"is_active=true&ordering={field}" for field in getattr(viewset, "ordering_fields", None) or ())
+    return queries
+
+
+def viewset_routes():
+    """``(pattern, viewset, models)`` for the router routes the snapshot covers.
+
+    Viewsets are included when they cache their responses: those are pure
+    functions of content rows.
+    """
+    for pattern in walk(get_resolver().url_patterns):
+        viewset = getattr(pattern.callback, "cls", None)
+        # Skip the router's duplicate ``.json``-suffixed routes.
+        if viewset is None or "format" in pattern.pattern.regex.groupindex:
+            continue
+        if getattr(viewset, "cache_responses", False):
+            yield pattern, viewset, tuple(viewset().get_cache_dependencies())
+
+
+def view_targets():
+    """``(path, models)`` of plain views opting in with a ``snapshot_targets`` classmethod."""
+    for pattern in walk(get_resolver().url_patterns):
+        view = getattr(pattern.callback, "view_class", None)
+        if hasattr(view, "snapshot_targets"):
+            for path, models in view.snapshot_targets():
+                yield path, tuple(models)
+
+
+def targets():
+    """Every response the snapshot contains, as ``(path, query, models)``."""
+    extra_queries = get_config()["EXTRA_QUERIES"]
+    result = []
+    for pattern, viewset, models in viewset_routes():
+        action = pattern.callback.actions.get("get")
+        if action == "list":
+            path = reverse(pattern.name)
+            for query in dict.fromkeys(["", *list_queries(viewset), *extra_queries.get(path, [])]):
+                result.append((path, query, models))
+        elif action == "retrieve":
+            lookup_url_kwarg = viewset.lookup_url_kwarg or viewset.lookup_field
+            for value in viewset.queryset.order_by().values_list(viewset.lookup_field, flat=True):
+                result.append((reverse(pattern.name, kwargs={lookup_url_kwarg: value}), "", models))
+    result.extend((path, "", models) for path, models in view_targets())
+    return result
+
+
+@functools.cache
+def published_models():
+    routes = [models for pattern, viewset, models in viewset_routes()]
+    routes += [models for path, models in view_targets()]
+    return {model for models in routes for model in models}
+
+
+def fingerprint(models=None):
+    """Version counters of the snapshot's models; changes whenever one is saved."""
+    models = sorted(models or published_models(), key=lambda model: model._meta.label_lower)
+    return dict(zip((model._meta.label_lower for model in models), cache.get_versions(models)))
+
+
+def read_manifest():
+    try:
+        with open(os.path.join(current_link(), MANIFEST)) as fh:
+            return json.load(fh)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def compress(filename, data):
+    config = get_config()
+    if len(data) < config["MIN_COMPRESS_SIZE"]:
+        return
+    with open(f"{filename}.gz", "wb") as fh:
+        fh.write(gzip.compress(data, compresslevel=9, mtime=0))
+    try:
+        import brotli
+    except ImportError:
+        return
+    with open(f"{filename}.br", "wb") as fh:
+        fh.write(brotli.compress(data, quality=11))
+
+
+def render(directory, host=None):
+    """Write every target below ``directory``; returns the number of files."""
+    config = get_config()
+    client = Client(raise_request_exception=False, HTTP_HOST=host or config["HOST"], HTTP_ACCEPT="application/json")
+    written = 0
+    for path, query, models in targets():
+        response = client.get(f"{path}?{query}" if query else path, secure=config["SECURE"])
+        if response.status_code != 200:
+            logger.warning("Skipping %s?%s in snapshot: HTTP %s", path, query, response.status_code)
+            continue
+        filename = os.path.join(directory, file_name(path, query))
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, "wb") as fh:
+            fh.write(response.content)
+        compress(filename, response.content)
+        written += 1
+    return written
+
+
+def publish(release):
+    """Point ``current`` at ``release`` with a single atomic rename."""
+    link = current_link()
+    tmp = f"{link}.{os.getpid()}.tmp"
+    os.symlink(os.path.relpath(release, root()), tmp)
+    os.replace(tmp, link)
+
+
+def prune(keep):
+    releases_dir = os.path.join(root(), "releases")
+    live = os.path.realpath(current_link())
+    releases = sorted(
+        (os.path.join(releases_dir, name) for name in os.listdir(releases_dir)),
+        reverse=True,
+    )
+    for release in [release for release in releases if os.path.realpath(release) != live][keep:]:
+        shutil.rmtree(release, ignore_errors=True)
+
+
+def export(host=None):
+    """Render a new release and publish it.
+
+    Returns the release path, or ``None`` when content changed while it was
+    being rendered or published (the release is discarded; export again).
+    """
+    versions = fingerprint()
+    release = os.path.join(root(), "releases", datetime.now().strftime("%Y%m%dT%H%M%S%f"))
+    os.makedirs(release)
+    files = render(release, host)
+    if fingerprint() != versions:
+        shutil.rmtree(release, ignore_errors=True)
+        return None
+    with open(os.path.join(release, MANIFEST), "w") as fh:
+        json.dump({"created": datetime.now().isoformat(), "files": files, "versions": versions}, fh)
+    publish(release)
+    if fingerprint() != versions:
+        # A write committed between the check above and the swap; its
+        # unpublish() may already have run, so withdraw the release here.
+        withdraw(release)
+        return None
+    prune(get_config()["KEEP"])
+    return release
+
+
+def is_current():
+    manifest = read_manifest()
+    return manifest is not None and manifest["versions"] == fingerprint()
+
+
+def unpublish():
+    try:
+        os.unlink(current_link())
+    except FileNotFoundError:
+        pass
+
+
+def withdraw(release):
+    """Unpublish ``release`` if it is still ``current``, and delete it."""
+    if os.path.realpath(current_link()) == os.path.realpath(release):
+        unpublish()
+    shutil.rmtree(release, ignore_errors=True)
+
+
+@bulk.per_row
+def invalidate(sender, **kwargs):
+    if get_config()["ENABLED"] and sender in published_models():
+        # Runs after cache.invalidate's version bump (cache connects its
+        # receivers first), which export() relies on.
+        transaction.on_commit(unpublish)
+
+
+def connect_signals():
+    for model in apps.get_models():
+        if cache.is_timestamped(model):
+            label = model._meta.label_lower
+            post_save.connect(invalidate, sender=model, dispatch_uid=f"api-snapshot-save-{label}")
+            post_delete.connect(invalidate, sender=model, dispatch_uid=f"api-snapshot-delete-{label}")
+    bulk.bulk_changed.connect(invalidate, dispatch_uid="api-snapshot-bulk")
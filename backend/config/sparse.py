@@ -0,0 +1,134 @@
+"""
+Sparse fieldsets for read endpoints.
+
+``?fields=title,slug,cover_image`` limits a response to the listed fields and
+``?expand=images,category`` picks the nested relations to include. Without
+either parameter the full representation is returned; once one is given,
+nested relations appear only when named in ``expand`` (or ``fields``). Names
+the representation does not have are rejected with a 400.
+
+``SparseFieldsMixin`` trims the serializer; ``SparseFieldsFilter`` pushes
+whatever the serializer of a read request will output down to SQL: ``only()``
+on its columns, and the ``select_related``/``prefetch_related`` of relations
+it does not render (unrequested ones, or ones a compact list serializer
+leaves out) are dropped.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+FIELDS_PARAM = "fields"
+EXPAND_PARAM = "expand"
+
+
+def parse_list(value):
+    if value is None:
+        return None
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+def requested(request):
+    """``(fields, expand)`` name sets of a safe request; ``None`` when absent."""
+    if request is None or request.method not in permissions.SAFE_METHODS:
+        return None, None
+    params = request.query_params if hasattr(request, "query_params") else request.GET
+    return parse_list(params.get(FIELDS_PARAM)), parse_list(params.get(EXPAND_PARAM))
+
+
+class SparseFieldsMixin:
+    """Drop the fields a read request did not ask for (top-level serializer only)."""
+
+    def get_fields(self):
+        fields = super().get_fields()
+        root = self.root
+        if root is not self and not (isinstance(root, ListSerializer) and root.child is self):
+            return fields
+        only, expand = requested(self.context.get("request"))
+        if only is None and expand is None:
+            return fields
+        errors = {
+            param: f"Unknown fields: {', '.join(sorted(names - fields.keys()))}."
+            for param, names in ((FIELDS_PARAM, only), (EXPAND_PARAM, expand))
+            if names and names - fields.keys()
+        }
+        if errors:
+            raise ValidationError(errors)
+        wanted = (only or set()) | (expand or set())
+        return {
+            name: field
+            for name, field in fields.items()
+            if name in wanted or (only is None and not isinstance(field, BaseSerializer))
+        }
+
+
+def prefetch_path(lookup):
+    return lookup.prefetch_through if isinstance(lookup, Prefetch) else lookup
+
+
+class SparseFieldsFilter(BaseFilterBackend):
+    """Project a viewset's queryset onto the fields its serializer will read."""
+
+    def filter_queryset(self, request, queryset, view):
+        if request.method not in permissions.SAFE_METHODS or not hasattr(view, "get_serializer"):
+            return queryset
+        fields = view.get_serializer().fields
+        relations = {field.source.split(".")[0] for field in fields.values() if isinstance(field, BaseSerializer)}
+
+        if isinstance(queryset.query.select_related, dict):
+            joins = [name for name in queryset.query.select_related if name in relations]
+            queryset = queryset.select_related(None).select_related(*joins)
+        lookups = [
+            lookup for lookup in queryset._prefetch_related_lookups
+            if prefetch_path(lookup).split("__")[0] in relations
+        ]
+        queryset = queryset.prefetch_related(None).prefetch_related(*lookups)
+
+        columns = self.get_columns(queryset, fields, view)
+        return queryset if columns is None else queryset.only(*columns)
+
+    def get_columns(self, queryset, fields, view):
+        """Concrete fields to load, or ``None`` when a field's source is unknown."""
+        opts = queryset.model._meta
+        # The lookup and ordering columns are read by routing and keyset pagination.
+        names = {opts.pk.name, getattr(view, "lookup_field", "pk")}
+        names.update(
+            name.lstrip("-")
+            for name in queryset.query.order_by or opts.ordering
+            if isinstance(name, str) and name.lstrip("-") not in queryset.query.annotations
+        )
+        names.update(field.source for field in fields.values())
+        columns = set()
+        for name in names:
+            if name in ("pk", "?"):
+                continue
+            try:
+                model_field = opts.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            if model_field.concrete:
+                columns.add(model_field.name)
+            elif not model_field.is_relation:
+                return None
+        return sorted(columns)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": FIELDS_PARAM,
+                "required": False,
+                "in": "query",
+                "description": "Comma-separated fields to return; nested relations need `expand`.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": EXPAND_PARAM,
+                "required": False,
+                "in": "query",
+                "description": "Comma-separated nested relations to include.",
+                "schema": {"type": "string"},
+            },
+        ]
@@ -0,0 +1,110 @@
+"""
+Stateless public API reads.
+
+The session, CSRF, authentication and messages middleware serve the admin
+and other cookie-based pages. The API authenticates with JWT bearer tokens
+and never uses ``request.session`` or messages, yet every public read used
+to pay for them. ``StatefulMiddleware`` runs those middleware
+(``API_STATELESS["MIDDLEWARE"]``) as an inner stack and sends safe requests
+under ``API_STATELESS["PREFIXES"]`` around it; everything else, ``/admin/``
+and API writes included, gets the full stack.
+
+``LazyAuthenticationMixin`` does the same inside DRF: the bearer token is
+only verified when a permission check or the view reads ``request.user``, so
+reads of public content skip token validation and the user lookup.
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.core.handlers.exception import convert_exception_to_response
+from django.utils.module_loading import import_string
+
+DEFAULTS = {
+    "ENABLED": True,
+    "PREFIXES": ["/api/", "/metrics"],
+    "MIDDLEWARE": [
+        "django.contrib.sessions.middleware.SessionMiddleware",
+        "django.middleware.csrf.CsrfViewMiddleware",
+        "django.contrib.auth.middleware.AuthenticationMiddleware",
+        "django.contrib.messages.middleware.MessageMiddleware",
+    ],
+}
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, "API_STATELESS", {})}
+
+
+class StatefulMiddleware:
+    """Run the stateful middleware only for requests that need them.
+
+    Takes the place of those middleware in ``MIDDLEWARE``. Their
+    ``process_view`` hooks (CSRF's check) run from this middleware's own.
+    Works in both WSGI and ASGI mode.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        config = get_config()
+        self.get_response = get_response
+        self.prefixes = tuple(config["PREFIXES"]) if config["ENABLED"] else ()
+        self.view_hooks = []
+        handler = get_response
+        for path in reversed(config["MIDDLEWARE"]):
+            try:
+                middleware = import_string(path)(handler)
+            except MiddlewareNotUsed:
+                continue
+            for hook in ("process_exception", "process_template_response"):
+                if hasattr(middleware, hook):
+                    raise ImproperlyConfigured(f"{path} defines {hook}, which StatefulMiddleware does not forward.")
+            if hasattr(middleware, "process_view"):
+                self.view_hooks.insert(0, middleware.process_view)
+            handler = convert_exception_to_response(middleware)
+        self.stateful = handler
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            self.process_view = self.aprocess_view
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.route(request)(request)
+
+    async def __acall__(self, request):
+        return await self.route(request)(request)
+
+    def route(self, request):
+        request._stateless = request.method in SAFE_METHODS and request.path_info.startswith(self.prefixes)
+        return self.get_response if request._stateless else self.stateful
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if getattr(request, "_stateless", False):
+            return None
+        for hook in self.view_hooks:
+            response = hook(request, view_func, view_args, view_kwargs)
+            if response is not None:
+                return response
+        return None
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        if getattr(request, "_stateless", False):
+            return None
+        # The hooks may load the session from the database.
+        return await sync_to_async(StatefulMiddleware.process_view)(self, request, view_func, view_args, view_kwargs)
+
+
+class LazyAuthenticationMixin:
+    """Authenticate on first access to ``request.user`` instead of up front.
+
+    A stale or invalid token then only fails requests whose permissions look
+    at the user; public reads ignore it.
+    """
+
+    def perform_authentication(self, request):
+        pass
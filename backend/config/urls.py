@@ -20,6 +20,7 @@ from django.http import JsonResponse
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 from django.conf import settings
 from django.conf.urls.static import static
+from config.metrics import metrics_view
 
 def api_root(request):
     return JsonResponse({
@@ -34,12 +35,16 @@ def api_root(request):
             'sectors': '/api/sectors/',
             'team': '/api/team/',
             'testimonials': '/api/testimonials/',
+            'bundles': '/api/bundle/<home|layout|about|contact>/',
+            'search': '/api/search/?q=',
+            'batch': '/api/batch/?url=<url>&url=<url>',
         }
     })
 
 urlpatterns = [
     path('', api_root, name='api-root'),
     path('admin/', admin.site.urls),
+    path('metrics', metrics_view, name='metrics'),
     # API schema and docs
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='docs'),
@@ -0,0 +1,138 @@
+"""
+``values()`` fast path for read-only list endpoints.
+
+A serializer marked with ``ValuesSerializerMixin`` is compiled once per field
+set into a plan: the ``values()`` columns it reads and one converter per
+output key, picked ahead of time (identity for strings, numbers, booleans and
+JSON; the field's own ``to_representation`` otherwise; storage URLs for
+files). Lists are then built as plain dicts straight from ``values()`` rows,
+skipping model instantiation and DRF's per-field attribute lookups.
+
+Serializers the plan cannot express exactly (method fields, dotted sources,
+to-many relations) compile to ``None`` and keep the regular path, as do
+paginated requests.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField
+from rest_framework.response import Response
+
+from . import images
+
+IDENTITY_FIELDS = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.JSONField,
+    serializers.ReadOnlyField,
+    PrimaryKeyRelatedField,
+)
+
+_plans = {}
+
+
+class ValuesSerializerMixin:
+    """Mark a (read-only) list serializer as eligible for the ``values()`` fast path."""
+
+
+class Plan:
+    def __init__(self, columns, build):
+        self.columns = columns
+        self.build = build
+
+
+def file_url(storage):
+    def convert(name, request):
+        if not name:
+            return None
+        url = storage.url(name)
+        return request.build_absolute_uri(url) if request is not None else url
+    return convert
+
+
+def converter(field, model_field):
+    if isinstance(field, serializers.FileField):
+        return file_url(model_field.storage)
+    if isinstance(field, IDENTITY_FIELDS):
+        return None
+    to_representation = field.to_representation
+    return lambda value, request: to_representation(value)
+
+
+def compile_fields(serializer, prefix=""):
+    """Compile ``serializer``'s readable fields; ``None`` if it cannot be done exactly."""
+    opts = serializer.Meta.model._meta
+    columns = []
+    steps = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if field.source == "*" or "." in field.source or isinstance(field, ManyRelatedField):
+            return None
+        try:
+            model_field = opts.get_field(field.source)
+        except FieldDoesNotExist:
+            return None
+        column = f"{prefix}{field.source}"
+        if isinstance(field, serializers.BaseSerializer):
+            if isinstance(field, serializers.ListSerializer) or not (model_field.many_to_one or model_field.one_to_one):
+                return None
+            if not model_field.concrete:
+                return None
+            nested = compile_fields(field, prefix=f"{column}__")
+            if nested is None:
+                return None
+            columns.append(column)
+            columns.extend(nested.columns)
+            steps.append((name, column, nested.build, True))
+            continue
+        if not model_field.concrete:
+            return None
+        columns.append(column)
+        steps.append((name, column, converter(field, model_field), False))
+
+    srcsets = []
+    if isinstance(serializer, images.ResponsiveImagesMixin):
+        srcsets = [
+            (f"{model_field.name}_srcset", f"{prefix}{model_field.name}")
+            for model_field in opts.fields
+            if isinstance(model_field, models.ImageField) and model_field.name in serializer.fields
+        ]
+
+    def build(row, request):
+        data = {}
+        for name, column, convert, nested in steps:
+            value = row[column]
+            if value is None:
+                data[name] = None
+            elif nested:
+                data[name] = convert(row, request)
+            else:
+                data[name] = value if convert is None else convert(value, request)
+        for name, column in srcsets:
+            data[name] = images.srcsets(row[column], request, opts.model)
+        return data
+
+    return Plan(list(dict.fromkeys(columns)), build)
+
+
+def compile_plan(serializer):
+    """Cached plan for a serializer instance's current field set."""
+    key = (type(serializer), tuple(serializer.fields))
+    if key not in _plans:
+        _plans[key] = compile_fields(serializer)
+    return _plans[key]
+
+
+class ValuesListMixin:
+    """Serve ``list`` from ``values()`` rows when the serializer allows it."""
+
+    def list(self, request, *args, **kwargs):
+        serializer = self.get_serializer()
+        plan = compile_plan(serializer) if isinstance(serializer, ValuesSerializerMixin) else None
+        if plan is None or (self.paginator is not None and self.paginator.get_page_size(request) is not None):
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset()).prefetch_related(None)
+        return Response([plan.build(row, request) for row in queryset.values(*plan.columns)])
@@ -0,0 +1,113 @@
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import permissions, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
+
+from .bulk import deferred
+from .cache import CachedResponseMixin
+from .conditional import ConditionalGetMixin
+from .stateless import LazyAuthenticationMixin
+from .values import ValuesListMixin
+
+
+class BulkWriteMixin:
+    """``bulk/`` list route for staff: create, partially update or delete many rows at once.
+
+    ``POST`` takes a list of objects, ``PATCH`` a list of objects with their
+    ``id`` and ``DELETE`` ``{"ids": [...]}``. Everything is validated before
+    anything is written; one invalid item rejects the whole request.
+    """
+
+    bulk_writes = True
+    bulk_max_items = 500
+
+    @action(detail=False, methods=["post", "patch", "delete"], permission_classes=[permissions.IsAdminUser])
+    def bulk(self, request, *args, **kwargs):
+        if not self.bulk_writes:
+            raise NotFound()
+        handler = {"POST": self.bulk_create, "PATCH": self.bulk_update, "DELETE": self.bulk_destroy}[request.method]
+        try:
+            with transaction.atomic(), deferred() as changes:
+                return handler(request, changes)
+        except IntegrityError as exc:
+            raise ValidationError({"detail": f"Conflicting rows: {exc}"})
+
+    def bulk_items(self, request):
+        items = request.data
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            raise ValidationError({"detail": "Expected a list of objects."})
+        if len(items) > self.bulk_max_items:
+            raise ValidationError({"detail": f"At most {self.bulk_max_items} items per request."})
+        return items
+
+    def bulk_create(self, request, changes):
+        model = self.queryset.model
+        serializer = self.get_serializer(data=self.bulk_items(request), many=True)
+        serializer.is_valid(raise_exception=True)
+        instances = model.objects.bulk_create([model(**attrs) for attrs in serializer.validated_data])
+        changes.saved(model, instances)
+        return Response(self.get_serializer(instances, many=True).data, status=status.HTTP_201_CREATED)
+
+    def bulk_update(self, request, changes):
+        model = self.queryset.model
+        items = self.bulk_items(request)
+        ids = [item.get("id") for item in items]
+        if not all(type(pk) is int for pk in ids):  # bool is an int subclass
+            raise ValidationError({"detail": "Every item needs its integer id."})
+        instances = model.objects.in_bulk(ids)
+        missing = [pk for pk in ids if pk not in instances]
+        if missing:
+            raise ValidationError({"detail": f"Unknown ids: {missing}."})
+
+        serializers = [self.get_serializer(instances[item["id"]], data=item, partial=True) for item in items]
+        errors = [{} if serializer.is_valid() else serializer.errors for serializer in serializers]
+        if any(errors):
+            raise ValidationError(errors)
+        fields = {"updated_at"}
+        for serializer in serializers:
+            for name, value in serializer.validated_data.items():
+                setattr(serializer.instance, name, value)
+                fields.add(name)
+        now = timezone.now()
+        updated = list(instances.values())
+        for instance in updated:
+            instance.updated_at = now  # bulk_update skips auto_now
+        model.objects.bulk_update(updated, sorted(fields))
+        changes.saved(model, updated)
+        return Response([serializer.data for serializer in serializers])
+
+    def bulk_destroy(self, request, changes):
+        ids = request.data.get("ids") if isinstance(request.data, dict) else None
+        if not isinstance(ids, list) or not ids:
+            raise ValidationError({"ids": "Expected a list of ids."})
+        if len(ids) > self.bulk_max_items:
+            raise ValidationError({"ids": f"At most {self.bulk_max_items} ids per request."})
+        if not all(type(pk) is int for pk in ids):
+            raise ValidationError({"ids": "Every id must be an integer."})
+        deleted, _ = self.queryset.model.objects.filter(pk__in=ids).delete()
+        return Response({"deleted": deleted})
+
+
+class ContentViewSet(
+    LazyAuthenticationMixin,
+    ConditionalGetMixin,
+    CachedResponseMixin,
+    ValuesListMixin,
+    BulkWriteMixin,
+    viewsets.ModelViewSet,
+):
+    """Base viewset for site content served by the public API.
+
+    ``list_serializer_class``, when set, renders list responses instead of
+    ``serializer_class`` (typically a compact one for grids and menus).
+    Staff can write many rows at once through the ``bulk/`` list route.
+    """
+
+    list_serializer_class = None
+
+    def get_serializer_class(self):
+        if self.action == "list" and self.list_serializer_class is not None:
+            return self.list_serializer_class
+        return super().get_serializer_class()
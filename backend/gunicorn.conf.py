@@ -0,0 +1,43 @@
+"""
+Gunicorn settings for the PM2 ``saizgar-backend`` app.
+
+``GUNICORN_MODE=asgi`` serves ``config.asgi`` through uvicorn workers: the
+public read endpoints then run as native async views, so each worker keeps
+serving while other connections are slow to send or receive. The default
+``wsgi`` mode uses gunicorn's sync workers.
+
+Workers share their Prometheus metrics through ``PROMETHEUS_MULTIPROC_DIR``:
+it is set here, before any worker imports ``prometheus_client``, emptied when
+the master starts, and the files of exited workers are marked dead so their
+gauges drop out of ``/metrics``.
+"""
+
+import multiprocessing
+import os
+import shutil
+from pathlib import Path
+
+mode = os.environ.get("GUNICORN_MODE", "wsgi")
+if mode == "asgi":
+    wsgi_app = "config.asgi:application"
+    worker_class = "uvicorn.workers.UvicornWorker"
+else:
+    wsgi_app = "config.wsgi:application"
+
+bind = os.environ.get("GUNICORN_BIND", "127.0.0.1:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+
+metrics_dir = Path(os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", str(Path(__file__).parent / ".metrics")))
+
+
+def on_starting(server):
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    metrics_dir.mkdir(parents=True)
+
+
+def child_exit(server, worker):
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    multiprocess.mark_process_dead(worker.pid)
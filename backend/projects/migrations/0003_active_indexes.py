@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_projectcategory_alter_project_options_project_budget_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='award',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'year', 'title'], name='projects_award_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'title'], name='projects_project_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_featured', True)), fields=['order', 'title'], name='projects_project_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectcategory',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'name'], name='projects_category_active_idx'),
+        ),
+    ]
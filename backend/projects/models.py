@@ -19,6 +19,9 @@ class ProjectCategory(TimestampedModel):
 
     class Meta:
         ordering = ["order", "name"]
+        indexes = [
+            models.Index(fields=["order", "name"], condition=models.Q(is_active=True), name="projects_category_active_idx"),
+        ]
         verbose_name_plural = "Project Categories"
 
     def __str__(self) -> str:
@@ -52,6 +55,14 @@ class Project(TimestampedModel):
 
     class Meta:
         ordering = ["order", "title"]
+        indexes = [
+            models.Index(fields=["order", "title"], condition=models.Q(is_active=True), name="projects_project_active_idx"),
+            models.Index(
+                fields=["order", "title"],
+                condition=models.Q(is_active=True, is_featured=True),
+                name="projects_project_featured_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.title
@@ -82,6 +93,9 @@ class Award(TimestampedModel):
 
     class Meta:
         ordering = ["order", "year", "title"]
+        indexes = [
+            models.Index(fields=["order", "year", "title"], condition=models.Q(is_active=True), name="projects_award_active_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.title} ({self.year})" if self.year else self.title
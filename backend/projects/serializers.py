@@ -1,26 +1,29 @@
 from rest_framework import serializers
+from config.images import ResponsiveImagesMixin
+from config.sparse import SparseFieldsMixin
+from config.values import ValuesSerializerMixin
 from .models import Project, ProjectImage, ProjectCategory, Award
 
 
-class ProjectImageSerializer(serializers.ModelSerializer):
+class ProjectImageSerializer(SparseFieldsMixin, ResponsiveImagesMixin, serializers.ModelSerializer):
     class Meta:
         model = ProjectImage
         fields = "__all__"
 
 
-class ProjectCategorySerializer(serializers.ModelSerializer):
+class ProjectCategorySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = ProjectCategory
         fields = "__all__"
 
 
-class AwardSerializer(serializers.ModelSerializer):
+class AwardSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Award
         fields = "__all__"
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(SparseFieldsMixin, ResponsiveImagesMixin, serializers.ModelSerializer):
     images = ProjectImageSerializer(many=True, read_only=True)
     category = ProjectCategorySerializer(read_only=True)
     awards = AwardSerializer(many=True, read_only=True)
@@ -30,3 +33,21 @@ class ProjectSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
+class ProjectCategorySummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ProjectCategory
+        fields = ["id", "name", "slug", "icon_name"]
+
+
+class ProjectListSerializer(ValuesSerializerMixin, SparseFieldsMixin, ResponsiveImagesMixin, serializers.ModelSerializer):
+    """Compact list representation: no gallery, awards or timestamps."""
+
+    category = ProjectCategorySummarySerializer(read_only=True)
+
+    class Meta:
+        model = Project
+        fields = [
+            "id", "title", "slug", "client", "summary", "description", "cover_image", "start_date", "end_date",
+            "location", "budget", "sector", "scope", "impact", "status", "category", "is_featured", "is_active",
+            "order",
+        ]
@@ -1,3 +1,181 @@
-from django.test import TestCase
+import os
+import tempfile
+import threading
+from unittest import mock
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from config import cache, images
+from .models import Project, ProjectImage, ProjectCategory, Award
+
+
+@override_settings(API_CACHE={"ENABLED": False})
+class ProjectQueryCountTests(TestCase):
+    """Project endpoints must cost a fixed number of queries regardless of size.
+
+    Each budget includes one aggregate per model used to compute the
+    ETag/Last-Modified validators (the project plus its three nested models).
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cache.get_versions([ProjectImage])  # seed the counter read for image manifests
+        categories = ProjectCategory.objects.bulk_create(
+            ProjectCategory(name=f"Category {i}", slug=f"category-{i}") for i in range(5)
+        )
+        projects = Project.objects.bulk_create(
+            Project(title=f"Project {i}", slug=f"project-{i}", category=categories[i % 5], order=i)
+            for i in range(200)
+        )
+        ProjectImage.objects.bulk_create(
+            ProjectImage(project=project, image=f"projects/gallery/{project.slug}-{n}.jpg", order=n)
+            for project in projects
+            for n in range(3)
+        )
+        Award.objects.bulk_create(
+            Award(title=f"Award {project.pk}", project=project, year=2020) for project in projects
+        )
+
+    def test_list_query_budget(self):
+        # 4 validators + one values() query (joined category); the compact
+        # list representation has no gallery or awards to prefetch.
+        with self.assertNumQueries(5):
+            response = self.client.get("/api/projects/?is_active=true&ordering=order")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 200)
+        self.assertNotIn("images", response.json()[0])
+        self.assertEqual(response.json()[0]["category"]["slug"], "category-0")
+
+    def test_paginated_list_matches_fast_path(self):
+        fast = self.client.get("/api/projects/").json()
+        paginated = self.client.get("/api/projects/?page_size=200").json()["results"]
+        self.assertEqual(fast, paginated)
+
+    def test_detail_query_budget(self):
+        # 4 validators + project (joined category) + images + awards, and the
+        # gallery's cache version (missing image manifests are cached against it).
+        with self.assertNumQueries(8):
+            response = self.client.get("/api/projects/project-42/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["category"]["slug"], "category-2")
+        self.assertEqual(len(response.json()["images"]), 3)
+
+    def test_budget_independent_of_row_count(self):
+        Project.objects.filter(order__gte=10).delete()
+        with self.assertNumQueries(5):
+            self.client.get("/api/projects/")
+
+
+class SparseFieldsTests(TestCase):
+    def setUp(self):
+        cache.response_cache().clear()
+        category = ProjectCategory.objects.create(name="Energy", slug="energy")
+        project = Project.objects.create(title="Dam", slug="dam", client="WAPDA", category=category)
+        ProjectImage.objects.create(project=project, image="projects/gallery/dam.jpg")
+        Award.objects.create(title="Best dam", project=project, year=2020)
+
+    def test_fields_and_expand(self):
+        self.assertEqual(self.client.get("/api/projects/?fields=title,slug").json(), [{"title": "Dam", "slug": "dam"}])
+        detail = self.client.get("/api/projects/dam/?fields=title&expand=category,images").json()
+        self.assertEqual(set(detail), {"title", "category", "images"})
+        self.assertEqual(detail["category"]["slug"], "energy")
+        self.assertEqual(detail["images"][0]["image"], "http://testserver/media/projects/gallery/dam.jpg")
+
+        # expand alone keeps every plain field, but only the named relations.
+        detail = self.client.get("/api/projects/dam/?expand=awards").json()
+        self.assertEqual(detail["awards"][0]["title"], "Best dam")
+        self.assertEqual(detail["client"], "WAPDA")
+        self.assertNotIn("images", detail)
+        self.assertNotIn("category", detail)
+
+    @override_settings(API_CACHE={"ENABLED": False})
+    def test_unrequested_relations_are_not_loaded(self):
+        # 4 validators + the project row; no category join, images or awards.
+        with self.assertNumQueries(5):
+            self.assertEqual(self.client.get("/api/projects/dam/?fields=title").json(), {"title": "Dam"})
+
+    def test_unknown_names_are_rejected(self):
+        response = self.client.get("/api/projects/?fields=title,budgett")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"fields": "Unknown fields: budgett."})
+        response = self.client.get("/api/projects/dam/?expand=owner")
+        self.assertEqual(response.json(), {"expand": "Unknown fields: owner."})
+        # The compact list representation has no gallery.
+        self.assertEqual(self.client.get("/api/projects/?expand=images").status_code, 400)
+
+    def test_cache_key_per_field_set(self):
+        for fields in ("title", "slug", "title", "slug"):
+            response = self.client.get(f"/api/projects/?fields={fields}")
+            self.assertEqual(list(response.json()[0]), [fields])
+        self.assertEqual(response["X-Cache"], "HIT")
+
+
+class ImageDerivativeTests(TestCase):
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        settings = override_settings(
+            MEDIA_ROOT=media.name,
+            API_CACHE={"ENABLED": False},
+            IMAGE_DERIVATIVES={"WIDTHS": [64, 128], "FORMATS": ["webp"], "WORKERS": 1},
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+        os.makedirs(os.path.join(media.name, "projects"))
+        Image.new("RGB", (100, 50), "teal").save(os.path.join(media.name, "projects", "dam.jpg"))
+        images._manifests.clear()
+        images._missing.clear()
+
+    def test_manifest_and_srcsets(self):
+        manifest = images.generate("projects/dam.jpg", wait=True)
+        # Widths above the original collapse to it rather than upscaling.
+        self.assertEqual(
+            manifest, {"width": 100, "height": 50, "variants": {"webp": [[64, "dam-64.webp"], [100, "dam-100.webp"]]}}
+        )
+        self.assertEqual(images.load_manifest("projects/dam.jpg"), manifest)
+        self.assertEqual(
+            images.srcsets("projects/dam.jpg"),
+            {"webp": "/media/derivatives/projects/dam-64.webp 64w, /media/derivatives/projects/dam-100.webp 100w"},
+        )
+
+        Project.objects.create(title="Dam", slug="dam", cover_image="projects/dam.jpg")
+        srcset = self.client.get("/api/projects/").json()[0]["cover_image_srcset"]
+        self.assertEqual(srcset["webp"].split(", ")[0], "http://testserver/media/derivatives/projects/dam-64.webp 64w")
+        self.assertEqual(self.client.get("/api/projects/dam/").json()["cover_image_srcset"], srcset)
+
+    def test_missing_manifest_is_cached_until_the_model_changes(self):
+        Project.objects.create(title="Dam", slug="dam", cover_image="projects/dam.jpg")
+        with mock.patch.object(images, "manifest_name", wraps=images.manifest_name) as lookups:
+            for _ in range(3):
+                self.assertIsNone(self.client.get("/api/projects/").json()[0]["cover_image_srcset"])
+                self.assertIsNone(self.client.get("/api/projects/dam/").json()["cover_image_srcset"])
+            self.assertEqual(lookups.call_count, 1)
+
+            images.generate("projects/dam.jpg", model=Project, wait=True)
+            lookups.reset_mock()
+            self.assertIsNotNone(self.client.get("/api/projects/").json()[0]["cover_image_srcset"])
+            self.assertEqual(lookups.call_count, 2)  # the manifest, then the srcset URLs
+
+    def test_process_pool_renders_off_the_request_path(self):
+        self.addCleanup(self.shutdown_executor)
+        [before] = cache.get_versions([Project])
+        self.assertIsNone(images.srcsets("projects/dam.jpg", model=Project))
+
+        finished = threading.Event()
+        # The bump runs on the pool's callback thread, outside this test's transaction.
+        with mock.patch.object(cache, "bump_version") as bump_version:
+            future = images.generate("projects/dam.jpg", model=Project)
+            future.add_done_callback(lambda future: finished.set())  # runs after the version bump
+            self.assertEqual(future.result(timeout=30)["width"], 100)
+            self.assertTrue(finished.wait(timeout=5))
+        bump_version.assert_called_once_with(Project)
+
+        cache.bump_version(Project)
+        self.assertNotEqual(cache.get_versions([Project]), [before])
+        self.assertIn("webp", images.srcsets("projects/dam.jpg", model=Project))
+
+    def shutdown_executor(self):
+        if images._executor is not None:
+            images._executor.shutdown()
+            images._executor = None
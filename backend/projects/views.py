@@ -1,6 +1,7 @@
-from rest_framework import viewsets, permissions
+from rest_framework import permissions
+from config.viewsets import ContentViewSet
 from .models import Project, ProjectImage, ProjectCategory, Award
-from .serializers import ProjectSerializer, ProjectImageSerializer, ProjectCategorySerializer, AwardSerializer
+from .serializers import ProjectSerializer, ProjectListSerializer, ProjectImageSerializer, ProjectCategorySerializer, AwardSerializer
 
 
 class ReadOnlyOrAdmin(permissions.BasePermission):
@@ -10,7 +11,7 @@ class ReadOnlyOrAdmin(permissions.BasePermission):
         return request.user and request.user.is_staff
 
 
-class ProjectCategoryViewSet(viewsets.ModelViewSet):
+class ProjectCategoryViewSet(ContentViewSet):
     queryset = ProjectCategory.objects.all()
     serializer_class = ProjectCategorySerializer
     permission_classes = [ReadOnlyOrAdmin]
@@ -18,24 +19,26 @@ class ProjectCategoryViewSet(viewsets.ModelViewSet):
     ordering_fields = ["order", "name"]
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
-    queryset = Project.objects.all()
+class ProjectViewSet(ContentViewSet):
+    queryset = Project.objects.select_related("category").prefetch_related("images", "awards")
     serializer_class = ProjectSerializer
+    list_serializer_class = ProjectListSerializer
     permission_classes = [ReadOnlyOrAdmin]
+    cache_dependencies = [ProjectImage, ProjectCategory, Award]
     filterset_fields = ["is_featured", "is_active", "category", "status"]
     search_fields = ["title", "slug", "client", "location"]
     ordering_fields = ["order", "title", "start_date"]
     lookup_field = "slug"
 
 
-class ProjectImageViewSet(viewsets.ModelViewSet):
+class ProjectImageViewSet(ContentViewSet):
     queryset = ProjectImage.objects.all()
     serializer_class = ProjectImageSerializer
     permission_classes = [ReadOnlyOrAdmin]
     filterset_fields = ["project"]
 
 
-class AwardViewSet(viewsets.ModelViewSet):
+class AwardViewSet(ContentViewSet):
     queryset = Award.objects.all()
     serializer_class = AwardSerializer
     permission_classes = [ReadOnlyOrAdmin]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sectors', '0002_alter_sector_options_remove_sector_icon_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='sector',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'name'], name='sectors_sector_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sector',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_featured', True)), fields=['order', 'name'], name='sectors_sector_featured_idx'),
+        ),
+    ]
@@ -38,6 +38,14 @@ class Sector(TimestampedModel):
 
     class Meta:
         ordering = ["order", "name"]
+        indexes = [
+            models.Index(fields=["order", "name"], condition=models.Q(is_active=True), name="sectors_sector_active_idx"),
+            models.Index(
+                fields=["order", "name"],
+                condition=models.Q(is_active=True, is_featured=True),
+                name="sectors_sector_featured_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.name
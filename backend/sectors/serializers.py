@@ -1,10 +1,23 @@
 from rest_framework import serializers
+from config.images import ResponsiveImagesMixin
+from config.sparse import SparseFieldsMixin
+from config.values import ValuesSerializerMixin
 from .models import Sector
 
 
-class SectorSerializer(serializers.ModelSerializer):
+class SectorSerializer(SparseFieldsMixin, ResponsiveImagesMixin, serializers.ModelSerializer):
     class Meta:
         model = Sector
         fields = "__all__"
 
 
+class SectorListSerializer(ValuesSerializerMixin, SparseFieldsMixin, ResponsiveImagesMixin, serializers.ModelSerializer):
+    """Compact list representation: no overview, SEO fields or timestamps."""
+
+    class Meta:
+        model = Sector
+        fields = [
+            "id", "name", "slug", "short_description", "description", "icon_name", "cover_image", "capabilities",
+            "key_projects", "projects_count", "capacity_value", "capacity_label", "coverage_value", "coverage_label",
+            "order", "is_featured", "is_active",
+        ]
@@ -1,6 +1,7 @@
-from rest_framework import viewsets, permissions
+from rest_framework import permissions
+from config.viewsets import ContentViewSet
 from .models import Sector
-from .serializers import SectorSerializer
+from .serializers import SectorSerializer, SectorListSerializer
 
 
 class ReadOnlyOrAdmin(permissions.BasePermission):
@@ -10,9 +11,10 @@ class ReadOnlyOrAdmin(permissions.BasePermission):
         return request.user and request.user.is_staff
 
 
-class SectorViewSet(viewsets.ModelViewSet):
+class SectorViewSet(ContentViewSet):
     queryset = Sector.objects.all()
     serializer_class = SectorSerializer
+    list_serializer_class = SectorListSerializer
     permission_classes = [ReadOnlyOrAdmin]
     filterset_fields = ["is_active", "is_featured"]
     search_fields = ["name", "slug", "description"]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0002_servicecategory_service_category'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'title'], name='services_service_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='servicecategory',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'name'], name='services_category_active_idx'),
+        ),
+    ]
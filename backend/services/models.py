@@ -19,6 +19,9 @@ class ServiceCategory(TimestampedModel):
 
     class Meta:
         ordering = ["order", "name"]
+        indexes = [
+            models.Index(fields=["order", "name"], condition=models.Q(is_active=True), name="services_category_active_idx"),
+        ]
         verbose_name_plural = "Service Categories"
 
     def __str__(self) -> str:
@@ -38,6 +41,9 @@ class Service(TimestampedModel):
 
     class Meta:
         ordering = ["order", "title"]
+        indexes = [
+            models.Index(fields=["order", "title"], condition=models.Q(is_active=True), name="services_service_active_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.title
@@ -1,14 +1,16 @@
 from rest_framework import serializers
+from config.images import ResponsiveImagesMixin
+from config.sparse import SparseFieldsMixin
 from .models import Service, ServiceCategory
 
 
-class ServiceCategorySerializer(serializers.ModelSerializer):
+class ServiceCategorySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = ServiceCategory
         fields = "__all__"
 
 
-class ServiceSerializer(serializers.ModelSerializer):
+class ServiceSerializer(SparseFieldsMixin, ResponsiveImagesMixin, serializers.ModelSerializer):
     category = ServiceCategorySerializer(read_only=True)
     
     class Meta:
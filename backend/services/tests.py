@@ -1,3 +1,31 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
-# Create your tests here.
+from .models import Service, ServiceCategory
+
+
+@override_settings(API_CACHE={"ENABLED": False})
+class ServiceQueryCountTests(TestCase):
+    """Service endpoints must cost a fixed number of queries regardless of size."""
+
+    @classmethod
+    def setUpTestData(cls):
+        categories = ServiceCategory.objects.bulk_create(
+            ServiceCategory(name=f"Category {i}", slug=f"category-{i}") for i in range(10)
+        )
+        Service.objects.bulk_create(
+            Service(title=f"Service {i}", slug=f"service-{i}", category=categories[i % 10], order=i)
+            for i in range(300)
+        )
+
+    def test_list_query_budget(self):
+        # 2 validators + services (joined category)
+        with self.assertNumQueries(3):
+            response = self.client.get("/api/services/?is_active=true&ordering=order")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 300)
+        self.assertEqual(response.json()[0]["category"]["slug"], "category-0")
+
+    def test_filtered_by_category_query_budget(self):
+        with self.assertNumQueries(3):
+            response = self.client.get("/api/services/?category__slug=category-3")
+        self.assertEqual(len(response.json()), 30)
@@ -1,4 +1,5 @@
-from rest_framework import viewsets, permissions
+from rest_framework import permissions
+from config.viewsets import ContentViewSet
 from .models import Service, ServiceCategory
 from .serializers import ServiceSerializer, ServiceCategorySerializer
 
@@ -10,16 +11,17 @@ class ReadOnlyOrAdmin(permissions.BasePermission):
         return request.user and request.user.is_staff
 
 
-class ServiceViewSet(viewsets.ModelViewSet):
-    queryset = Service.objects.all()
+class ServiceViewSet(ContentViewSet):
+    queryset = Service.objects.select_related("category")
     serializer_class = ServiceSerializer
     permission_classes = [ReadOnlyOrAdmin]
+    cache_dependencies = [ServiceCategory]
     filterset_fields = ["is_active", "category", "category__slug"]
     search_fields = ["title", "slug", "short_description"]
     ordering_fields = ["order", "title"]
 
 
-class ServiceCategoryViewSet(viewsets.ModelViewSet):
+class ServiceCategoryViewSet(ContentViewSet):
     queryset = ServiceCategory.objects.all()
     serializer_class = ServiceCategorySerializer
     permission_classes = [ReadOnlyOrAdmin]
@@ -21,6 +21,9 @@ class TeamMember(TimestampedModel):
 
     class Meta:
         ordering = ["order", "name"]
+        indexes = [
+            models.Index(fields=["order", "name"], condition=models.Q(is_active=True), name="team_member_active_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -1,8 +1,10 @@
 from rest_framework import serializers
+from config.images import ResponsiveImagesMixin
+from config.sparse import SparseFieldsMixin
 from .models import TeamMember
 
 
-class TeamMemberSerializer(serializers.ModelSerializer):
+class TeamMemberSerializer(SparseFieldsMixin, ResponsiveImagesMixin, serializers.ModelSerializer):
     class Meta:
         model = TeamMember
         fields = "__all__"
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from . import moderation
 from .models import Testimonial, ClientFeedback
 
 
@@ -11,13 +12,13 @@ class TestimonialAdmin(admin.ModelAdmin):
     actions = ["approve_testimonials", "deactivate_testimonials"]
 
     def approve_testimonials(self, request, queryset):
-        queryset.update(is_approved=True, is_active=True)
-        self.message_user(request, f"Approved {queryset.count()} testimonials.")
+        count = moderation.set_flags(queryset, is_approved=True, is_active=True)
+        self.message_user(request, f"Approved {count} testimonials.")
     approve_testimonials.short_description = "Approve selected testimonials"
 
     def deactivate_testimonials(self, request, queryset):
-        queryset.update(is_active=False)
-        self.message_user(request, f"Deactivated {queryset.count()} testimonials.")
+        count = moderation.set_flags(queryset, is_active=False)
+        self.message_user(request, f"Deactivated {count} testimonials.")
     deactivate_testimonials.short_description = "Deactivate selected testimonials"
 
 
@@ -46,29 +47,13 @@ class ClientFeedbackAdmin(admin.ModelAdmin):
     )
 
     def approve_and_convert_to_testimonial(self, request, queryset):
-        count = 0
-        for feedback in queryset.filter(is_approved=False):
-            # Create testimonial from feedback
-            Testimonial.objects.create(
-                author_name=feedback.author_name,
-                author_title=feedback.author_title,
-                content=feedback.content,
-                company=feedback.company,
-                rating=feedback.rating,
-                is_active=True,
-                is_approved=True,
-                submitted_by_client=True
-            )
-            feedback.is_approved = True
-            feedback.is_reviewed = True
-            feedback.save()
-            count += 1
+        count = len(moderation.approve_and_convert(queryset))
         self.message_user(request, f"Approved and converted {count} feedback submissions to testimonials.")
     approve_and_convert_to_testimonial.short_description = "Approve and convert to testimonials"
 
     def mark_as_reviewed(self, request, queryset):
-        queryset.update(is_reviewed=True)
-        self.message_user(request, f"Marked {queryset.count()} submissions as reviewed.")
+        count = moderation.set_flags(queryset, is_reviewed=True)
+        self.message_user(request, f"Marked {count} submissions as reviewed.")
     mark_as_reviewed.short_description = "Mark as reviewed"
 
 # Register your models here.
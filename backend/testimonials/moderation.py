@@ -0,0 +1,54 @@
+"""
+Moderation of client feedback, shared by the admin actions and the API.
+
+Each operation runs in one transaction with a constant number of queries,
+however many rows are selected, and notifies the response cache, snapshot
+and other ``bulk_changed`` receivers once (see ``config/bulk.py``).
+"""
+
+from django.db import transaction
+from django.utils import timezone
+
+from config import bulk
+from .models import ClientFeedback, Testimonial
+
+
+def approve_and_convert(queryset):
+    """Approve the pending feedback in ``queryset`` and publish each as a testimonial.
+
+    Already approved rows are skipped, so running it twice converts nothing
+    twice. Returns the created testimonials.
+    """
+    with transaction.atomic(), bulk.deferred() as changes:
+        pending = list(queryset.filter(is_approved=False).select_for_update())
+        testimonials = Testimonial.objects.bulk_create([
+            Testimonial(
+                author_name=feedback.author_name,
+                author_title=feedback.author_title,
+                content=feedback.content,
+                company=feedback.company,
+                rating=feedback.rating,
+                is_active=True,
+                is_approved=True,
+                submitted_by_client=True,
+            )
+            for feedback in pending
+        ])
+        now = timezone.now()
+        ClientFeedback.objects.filter(pk__in=[feedback.pk for feedback in pending]).update(
+            is_approved=True, is_reviewed=True, updated_at=now
+        )
+        for feedback in pending:
+            feedback.is_approved = feedback.is_reviewed = True
+            feedback.updated_at = now
+        changes.saved(Testimonial, testimonials)
+        changes.saved(ClientFeedback, pending)
+    return testimonials
+
+
+def set_flags(queryset, **flags):
+    """``queryset.update(**flags)``, plus the invalidation ``update()`` skips; returns the row count."""
+    with transaction.atomic(), bulk.deferred() as changes:
+        count = queryset.update(**flags, updated_at=timezone.now())
+        changes.updated(queryset.model)
+    return count
@@ -1,10 +1,20 @@
 from rest_framework import serializers
-from .models import Testimonial
+from config.images import ResponsiveImagesMixin
+from config.sparse import SparseFieldsMixin
+from .models import ClientFeedback, Testimonial
 
 
-class TestimonialSerializer(serializers.ModelSerializer):
+class TestimonialSerializer(SparseFieldsMixin, ResponsiveImagesMixin, serializers.ModelSerializer):
     class Meta:
         model = Testimonial
         fields = "__all__"
 
 
+class ClientFeedbackSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ClientFeedback
+        fields = "__all__"
+
+
+class FeedbackSelectionSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=500)
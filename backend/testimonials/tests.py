@@ -1,3 +1,57 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from config import cache
+from .models import ClientFeedback, Testimonial
+
+
+class ModerationTests(TestCase):
+    def setUp(self):
+        self.staff = get_user_model().objects.create_user("moderator", password="secret", is_staff=True, is_superuser=True)
+        self.client = APIClient()
+        self.client.force_authenticate(self.staff)
+        cache.get_versions([ClientFeedback, Testimonial])  # a first bump would seed them
+
+    def feedback(self, count):
+        return ClientFeedback.objects.bulk_create(
+            ClientFeedback(author_name=f"Client {n}", author_email=f"client{n}@example.com", content="Great work.")
+            for n in range(count)
+        )
+
+    def approve(self, feedback):
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post("/api/feedback/approve/", {"ids": [row.pk for row in feedback]}, format="json")
+        self.assertEqual(response.status_code, 200)
+        return response.json(), len(queries)
+
+    def test_approve_converts_with_constant_queries(self):
+        few, few_queries = self.approve(self.feedback(2))
+        many, many_queries = self.approve(self.feedback(40))
+        self.assertEqual((few["approved"], many["approved"]), (2, 40))
+        self.assertEqual(few_queries, many_queries)
+        self.assertEqual(Testimonial.objects.filter(is_approved=True, submitted_by_client=True).count(), 42)
+        self.assertFalse(ClientFeedback.objects.filter(is_approved=False).exists())
+        self.assertEqual(len(self.client.get("/api/testimonials/").json()), 42)
+
+        # Approved rows are skipped, so nothing is converted twice.
+        again, _ = self.approve(ClientFeedback.objects.all())
+        self.assertEqual(again["approved"], 0)
+        self.assertEqual(APIClient().post("/api/feedback/approve/", {"ids": [1]}, format="json").status_code, 401)
+
+    def test_admin_action_uses_the_bulk_path(self):
+        rows = self.feedback(3)
+        client = self.client_class()
+        client.force_login(self.staff)
+        response = client.post(
+            "/admin/testimonials/clientfeedback/",
+            {"action": "approve_and_convert_to_testimonial", "_selected_action": [row.pk for row in rows]},
+            follow=True,
+        )
+        self.assertContains(response, "Approved and converted 3 feedback submissions to testimonials.")
+        self.assertEqual(Testimonial.objects.count(), 3)
+
+        response = self.client.post("/api/feedback/review/", {"ids": [rows[0].pk]}, format="json")
+        self.assertEqual(response.json(), {"reviewed": 1})
@@ -1,9 +1,10 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import TestimonialViewSet
+from .views import ClientFeedbackViewSet, TestimonialViewSet
 
 router = DefaultRouter()
 router.register(r'testimonials', TestimonialViewSet)
+router.register(r'feedback', ClientFeedbackViewSet)
 
 urlpatterns = [
     path('', include(router.urls)),
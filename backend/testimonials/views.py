@@ -1,6 +1,12 @@
-from rest_framework import viewsets, permissions
-from .models import Testimonial
-from .serializers import TestimonialSerializer
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework import permissions, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from config.viewsets import ContentViewSet
+from . import moderation
+from .models import ClientFeedback, Testimonial
+from .serializers import ClientFeedbackSerializer, FeedbackSelectionSerializer, TestimonialSerializer
 
 
 class ReadOnlyOrAdmin(permissions.BasePermission):
@@ -10,9 +16,40 @@ class ReadOnlyOrAdmin(permissions.BasePermission):
         return request.user and request.user.is_staff
 
 
-class TestimonialViewSet(viewsets.ModelViewSet):
+class TestimonialViewSet(ContentViewSet):
     queryset = Testimonial.objects.all()
     serializer_class = TestimonialSerializer
     permission_classes = [ReadOnlyOrAdmin]
     filterset_fields = ["is_active", "rating"]
     search_fields = ["author_name", "company", "content"]
+
+
+class ClientFeedbackViewSet(viewsets.ReadOnlyModelViewSet):
+    """Staff moderation queue for client feedback.
+
+    ``approve/`` and ``review/`` take ``{"ids": [...]}`` and act on all of them
+    in one transaction, like the matching admin actions.
+    """
+
+    queryset = ClientFeedback.objects.all()
+    serializer_class = ClientFeedbackSerializer
+    permission_classes = [permissions.IsAdminUser]
+    filterset_fields = ["is_reviewed", "is_approved", "rating"]
+    search_fields = ["author_name", "company", "content", "project_name"]
+    ordering_fields = ["created_at", "rating"]
+
+    def selected(self, request):
+        selection = FeedbackSelectionSerializer(data=request.data)
+        selection.is_valid(raise_exception=True)
+        return self.get_queryset().filter(pk__in=selection.validated_data["ids"])
+
+    @extend_schema(request=FeedbackSelectionSerializer, responses=OpenApiTypes.OBJECT)
+    @action(detail=False, methods=["post"])
+    def approve(self, request):
+        testimonials = moderation.approve_and_convert(self.selected(request))
+        return Response({"approved": len(testimonials), "testimonials": [testimonial.pk for testimonial in testimonials]})
+
+    @extend_schema(request=FeedbackSelectionSerializer, responses=OpenApiTypes.OBJECT)
+    @action(detail=False, methods=["post"])
+    def review(self, request):
+        return Response({"reviewed": moderation.set_flags(self.selected(request), is_reviewed=True)})
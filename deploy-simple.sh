@@ -44,6 +44,7 @@ pip install -r requirements.txt
 
 # Run migrations
 python manage.py migrate
+python manage.py rebuild_search_index
 python manage.py collectstatic --noinput
 
 # Frontend setup
@@ -80,8 +81,21 @@ server {
         proxy_cache_bypass \$http_upgrade;
     }
 
-    # Backend API
+    # Backend API: anonymous GETs are answered from the static API snapshot when it has
+    # the URL; everything else goes to gunicorn.
     location /api/ {
+        error_page 418 = @backend;
+        if (\$request_method !~ ^(GET|HEAD)\$) { return 418; }
+        if (\$http_authorization) { return 418; }
+        root /var/www/saizgar-consultancy/backend/snapshot/current;
+        default_type application/json;
+        gzip_static on;
+        # brotli_static on;  # needs the ngx_brotli module
+        add_header Access-Control-Allow-Origin *;
+        try_files \${uri}index\${is_args}\${args}.json @backend;
+    }
+
+    location @backend {
         proxy_pass http://127.0.0.1:8000;
         proxy_set_header Host \$host;
         proxy_set_header X-Real-IP \$remote_addr;
@@ -119,7 +133,26 @@ module.exports = {
       name: 'saizgar-backend',
       cwd: '/var/www/saizgar-consultancy/backend',
       script: 'venv/bin/gunicorn',
-      args: 'config.wsgi:application --bind 127.0.0.1:8000',
+      args: '-c gunicorn.conf.py',
+      env: {
+        DJANGO_SETTINGS_MODULE: 'config.settings',
+        GUNICORN_MODE: 'wsgi'  // 'asgi': uvicorn workers with async read views
+      }
+    },
+    {
+      name: 'saizgar-outbox',
+      cwd: '/var/www/saizgar-consultancy/backend',
+      script: 'venv/bin/python',
+      args: 'manage.py process_outbox',
+      env: {
+        DJANGO_SETTINGS_MODULE: 'config.settings'
+      }
+    },
+    {
+      name: 'saizgar-snapshot',
+      cwd: '/var/www/saizgar-consultancy/backend',
+      script: 'venv/bin/python',
+      args: 'manage.py export_api_snapshot --watch --host $SERVER_IP',
       env: {
         DJANGO_SETTINGS_MODULE: 'config.settings'
       }
@@ -4,7 +4,26 @@ module.exports = {
       name: 'saizgar-backend',
       cwd: '/var/www/saizgar-consultancy/backend',
       script: 'venv/bin/gunicorn',
-      args: 'config.wsgi:application --bind 127.0.0.1:8000',
+      args: '-c gunicorn.conf.py',
+      env: {
+        DJANGO_SETTINGS_MODULE: 'config.settings',
+        GUNICORN_MODE: 'wsgi'  // 'asgi': uvicorn workers with async read views
+      }
+    },
+    {
+      name: 'saizgar-outbox',
+      cwd: '/var/www/saizgar-consultancy/backend',
+      script: 'venv/bin/python',
+      args: 'manage.py process_outbox',
+      env: {
+        DJANGO_SETTINGS_MODULE: 'config.settings'
+      }
+    },
+    {
+      name: 'saizgar-snapshot',
+      cwd: '/var/www/saizgar-consultancy/backend',
+      script: 'venv/bin/python',
+      args: 'manage.py export_api_snapshot --watch --host 13.49.178.174',
       env: {
         DJANGO_SETTINGS_MODULE: 'config.settings'
       }
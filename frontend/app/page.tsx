@@ -66,17 +66,11 @@ export default function HomePage() {
   useEffect(() => {
     async function load() {
       try {
-        const [heroRes, servicesRes, partnersRes] = await Promise.all([
-          fetch(`${API_BASE}/api/hero/?is_active=true`, { cache: "no-store" }),
-          fetch(`${API_BASE}/api/services/?is_active=true&ordering=order`, { cache: "no-store" }),
-          fetch(`${API_BASE}/api/partners/?is_active=true&ordering=order`, { cache: "no-store" }),
-        ])
-        const heroData = await heroRes.json()
-        const servicesData = await servicesRes.json()
-        const partnersData = await partnersRes.json()
-        setHero(Array.isArray(heroData) ? heroData[0] ?? null : null)
-        setServices(Array.isArray(servicesData) ? servicesData : servicesData?.results ?? [])
-        setPartners(Array.isArray(partnersData) ? partnersData : partnersData?.results ?? [])
+        const res = await fetch(`${API_BASE}/api/bundle/home/`, { cache: "no-store" })
+        const bundle = await res.json()
+        setHero(bundle?.hero ?? null)
+        setServices(Array.isArray(bundle?.services) ? bundle.services : [])
+        setPartners(Array.isArray(bundle?.partners) ? bundle.partners : [])
       } catch (e) {
         // fail silently; fallbacks render
       }